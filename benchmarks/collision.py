@@ -0,0 +1,133 @@
+"""
+对比碰撞检测的暴力两两测试与网格宽相位。
+
+子弹数从 100 增加到 10000，分别统计（均为多次重复的中位数）：
+- 玩家子弹 vs 敌机：pygame.sprite.groupcollide 与 SpatialHash（含每帧重建）
+- 玩家 vs 敌方子弹：spritecollide + collide_rect_ratio(0.7) 与 BulletPool.collide_rect
+
+每一轮都会核对两种方式的命中结果（包括顺序）完全一致。
+
+用法（在项目根目录）：
+    python -m benchmarks.collision [重复次数]
+"""
+
+import random
+import statistics
+import sys
+import time
+
+import pygame
+
+from src.core.config import Config
+from src.managers.bullet_pool import BulletPool
+from src.managers.collision import SpatialHash
+
+BULLET_COUNTS = (100, 300, 1000, 3000, 10000)
+ENEMY_COUNT = 40
+
+
+def _sprite(rect):
+    sprite = pygame.sprite.Sprite()
+    sprite.rect = pygame.Rect(rect)
+    return sprite
+
+
+def _random_rect(rng, width, height):
+    return (
+        rng.randint(0, Config.WIDTH - width),
+        rng.randint(0, Config.HEIGHT - height),
+        width,
+        height,
+    )
+
+
+def _median_ms(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000, result
+
+
+def bench_bullets_vs_enemies(count, repeat, rng):
+    bullets = pygame.sprite.Group(
+        _sprite(_random_rect(rng, 6, 16)) for _ in range(count)
+    )
+    enemies = pygame.sprite.Group(
+        _sprite(_random_rect(rng, 32, 32)) for _ in range(ENEMY_COUNT)
+    )
+    grid = SpatialHash()
+
+    def brute():
+        return pygame.sprite.groupcollide(
+            bullets, enemies, False, False, collided=pygame.sprite.collide_rect
+        )
+
+    def hashed():
+        grid.build(enemies)
+        return grid.groupcollide(
+            bullets, False, False, collided=pygame.sprite.collide_rect
+        )
+
+    brute_ms, expected = _median_ms(brute, repeat)
+    hashed_ms, result = _median_ms(hashed, repeat)
+    assert list(result.items()) == list(expected.items()), "groupcollide mismatch"
+    return brute_ms, hashed_ms, len(expected)
+
+
+def bench_player_vs_bullets(count, repeat, rng):
+    player = _sprite(pygame.Rect(0, 0, 48, 48))
+    player.rect.center = (Config.WIDTH // 2, Config.HEIGHT - 80)
+    sprites = pygame.sprite.Group()
+    pool = BulletPool(count)
+    for _ in range(count):
+        # 一半子弹集中在玩家附近，保证有命中
+        if rng.random() < 0.5:
+            x = player.rect.centerx + rng.randint(-60, 60)
+            y = player.rect.centery + rng.randint(-60, 60)
+        else:
+            x = rng.randint(0, Config.WIDTH)
+            y = rng.randint(0, Config.HEIGHT)
+        sprites.add(_sprite(pygame.Rect(0, 0, 8, 8).move(x - 4, y - 4)))
+        pool.spawn((x, y), (0, 1), speed=0)
+
+    def brute():
+        return len(
+            pygame.sprite.spritecollide(
+                player,
+                sprites,
+                False,
+                collided=pygame.sprite.collide_rect_ratio(0.7),
+            )
+        )
+
+    def pooled():
+        return pool.collide_rect(player.rect, 0.7, dokill=False)
+
+    brute_ms, expected = _median_ms(brute, repeat)
+    pooled_ms, result = _median_ms(pooled, repeat)
+    assert result == expected, f"hit count mismatch: {result} != {expected}"
+    return brute_ms, pooled_ms, expected
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    rng = random.Random(1)
+
+    print(f"player bullets vs {ENEMY_COUNT} enemies (median of {repeat})")
+    print(f"{'bullets':>8} {'groupcollide':>14} {'SpatialHash':>12} {'hits':>6}")
+    for count in BULLET_COUNTS:
+        brute_ms, hashed_ms, hits = bench_bullets_vs_enemies(count, repeat, rng)
+        print(f"{count:>8} {brute_ms:>11.3f} ms {hashed_ms:>9.3f} ms {hits:>6}")
+
+    print()
+    print(f"player vs enemy bullets (median of {repeat})")
+    print(f"{'bullets':>8} {'spritecollide':>14} {'BulletPool':>12} {'hits':>6}")
+    for count in BULLET_COUNTS:
+        brute_ms, pooled_ms, hits = bench_player_vs_bullets(count, repeat, rng)
+        print(f"{count:>8} {brute_ms:>11.3f} ms {pooled_ms:>9.3f} ms {hits:>6}")
+
+
+if __name__ == "__main__":
+    main()
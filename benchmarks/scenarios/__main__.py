@@ -0,0 +1,88 @@
+"""
+场景基准：把游戏直接置于固定的高负载状态，统计每帧的 update、碰撞和渲染耗时
+（平均值、p50/p90/p99、最大值），并把结果写成 JSON，方便前后对比优化效果。
+
+场景见 states.py：
+- late_wave       第 30 波，所有解锁的敌机类型
+- boss_phase4     第 4 阶段 Boss 的最后形态，全部攻击模式 + 黑洞
+- particle_storm  粒子池满载
+
+用法（在项目根目录）：
+    python -m benchmarks.scenarios [场景名 ...] [--frames N] [--output 文件]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+import numpy as np
+import pygame
+
+from src.core.config import Config
+from .runner import PERCENTILES, run_quietly
+from .states import SCENARIOS
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the scenario benchmarks.")
+    parser.add_argument(
+        "scenarios",
+        nargs="*",
+        metavar="scenario",
+        help=f"scenarios to run (default: all of {', '.join(SCENARIOS)})",
+    )
+    parser.add_argument("--frames", type=int, default=600, help="measured frames")
+    parser.add_argument("--warmup", type=int, default=60, help="unmeasured frames")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--output", default="scenario_results.json", help="JSON results file"
+    )
+    args = parser.parse_args()
+    for name in args.scenarios:
+        if name not in SCENARIOS:
+            parser.error(f"unknown scenario {name!r}")
+    return args
+
+
+def main():
+    args = parse_args()
+    Config.HOLD_HP = True  # 玩家不会死亡，场景可以跑满帧数
+    names = args.scenarios or list(SCENARIOS)
+
+    results = {}
+    columns = ("mean",) + tuple(f"p{p}" for p in PERCENTILES) + ("max",)
+    print(f"{'scenario':<16} {'stage':<10}" + "".join(f"{c:>9}" for c in columns))
+    for name in names:
+        result = run_quietly(SCENARIOS[name](), args.frames, args.warmup, args.seed)
+        results[name] = result
+        for stage in ("update", "collision", "render"):
+            summary = result[f"{stage}_ms"]
+            print(
+                f"{name:<16} {stage:<10}"
+                + "".join(f"{summary[c]:>9.3f}" for c in columns)
+            )
+        print(f"{'':<16} entities   mean {result['entities']['mean']:.0f}")
+
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "frames": args.frames,
+        "warmup": args.warmup,
+        "seed": args.seed,
+        "tick_rate": Config.TICK_RATE,
+        "platform": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+        },
+        "scenarios": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"results written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import contextlib
+import os
+import time
+
+import numpy as np
+import pygame
+
+from src.core.config import Config
+from src.core.headless import HeadlessGame, count_entities
+from src.scenes.game_scene import GameScene
+
+PERCENTILES = (50, 90, 99)
+
+
+def summarize(samples):
+    """毫秒样本 -> 平均值、各百分位和最大值"""
+    data = np.asarray(samples) * 1000
+    summary = {"mean": float(data.mean())}
+    for p in PERCENTILES:
+        summary[f"p{p}"] = float(np.percentile(data, p))
+    summary["max"] = float(data.max())
+    return summary
+
+
+def run_scenario(scenario, frames, warmup, seed):
+    """
+    在无窗口的 GameScene 中运行一个场景，逐帧记录三段耗时：
+    update（不含碰撞）、collision（_check_collisions）、render（软件绘制整帧）。
+    """
+    game = HeadlessGame()
+    scene = GameScene(game, seed=seed)  # 重置所有子系统的随机数流
+    game.change_scene(scene)
+    surface = pygame.Surface((Config.WIDTH, Config.HEIGHT)).convert()
+    step = game.timestep.step
+
+    # 把碰撞检测单独计时：包装实例上的 _check_collisions
+    collision_time = 0.0
+    check_collisions = scene._check_collisions
+
+    def timed_collisions():
+        nonlocal collision_time
+        start = time.perf_counter()
+        check_collisions()
+        collision_time = time.perf_counter() - start
+
+    scene._check_collisions = timed_collisions
+
+    scenario.setup(scene)
+    update, collision, render, entities = [], [], [], []
+    for frame in range(warmup + frames):
+        scenario.tick(scene)
+        collision_time = 0.0
+        start = time.perf_counter()
+        scene.update(step)
+        updated = time.perf_counter()
+        surface.fill(Config.BG_COLOR)
+        scene.render_background(surface)
+        scene.render(surface)
+        rendered = time.perf_counter()
+        if game.active_scene is not scene:
+            raise RuntimeError(f"{scenario.name}: scene ended after {frame} frames")
+
+        if frame >= warmup:
+            update.append(updated - start - collision_time)
+            collision.append(collision_time)
+            render.append(rendered - updated)
+            entities.append(count_entities(scene))
+
+    return {
+        "description": scenario.description,
+        "frames": frames,
+        "entities": {"mean": float(np.mean(entities)), "max": int(max(entities))},
+        "update_ms": summarize(update),
+        "collision_ms": summarize(collision),
+        "render_ms": summarize(render),
+    }
+
+
+def run_quietly(scenario, frames, warmup, seed):
+    """运行场景，屏蔽游戏自身的 print 输出"""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        return run_scenario(scenario, frames, warmup, seed)
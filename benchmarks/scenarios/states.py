@@ -0,0 +1,119 @@
+"""
+基准场景：把 GameScene 直接置于某个状态，并在测量期间维持该状态。
+
+每个场景提供 setup(scene)（开始前调用一次）和 tick(scene)（每步更新前
+调用，补充被消灭或飞出屏幕的敌机、黑洞和粒子，让负载保持稳定）。
+"""
+
+from src.core.config import Config
+from src.core.rng import rng
+from src.entities.bullet import BlackHole
+
+# 场景自己的随机数流：GameScene(seed=...) 重置后，同一种子的负载完全相同
+_random = rng.stream("benchmark")
+
+
+def _hold_spawner(scene):
+    """停用 Spawner 的自动生成，敌机数量完全由场景控制"""
+    scene.spawner.update = lambda dt, enemy_group: None
+
+
+class Scenario:
+    name = ""
+    description = ""
+
+    def setup(self, scene):
+        pass
+
+    def tick(self, scene):
+        pass
+
+
+class LateWave(Scenario):
+    """后期波次：该阶段解锁的所有敌机类型同时在场，数量按 Spawner 的规则"""
+
+    name = "late_wave"
+    description = "wave 30, every enemy type the spawner unlocks"
+
+    def __init__(self, wave=30):
+        self.wave = wave
+
+    def setup(self, scene):
+        spawner = scene.spawner
+        spawner.wave = self.wave
+        _hold_spawner(scene)
+        self.config = spawner._generate_wave_config(spawner.get_current_phase())
+        # 每种类型至少一架，直接放进屏幕上半部分，不等它们飞入
+        for enemy_class in self.config["enemy_types"]:
+            enemy = spawner._create_enemy(dict(self.config, enemy_types=[enemy_class]))
+            enemy.rect.centery = _random.randint(50, Config.HEIGHT // 2)
+            scene.enemies.add(enemy)
+        self.tick(scene)
+
+    def tick(self, scene):
+        while len(scene.enemies) < self.config["count"]:
+            scene.enemies.add(scene.spawner._create_enemy(self.config))
+
+
+class BossPhase4(Scenario):
+    """第 4 阶段 Boss 进入第 4 形态，所有攻击模式和黑洞同时生效"""
+
+    name = "boss_phase4"
+    description = "phase 4 boss at its last phase, every attack pattern active"
+
+    BLACK_HOLES = 2  # 同时在场的黑洞数量
+
+    def setup(self, scene):
+        spawner = scene.spawner
+        spawner.wave = 20
+        _hold_spawner(scene)
+        spawner._spawn_boss(scene.enemies, 4)
+        spawner.flush(scene.enemies)
+        self.boss = spawner.active_boss
+        # 一次扣到 10% 以下，依次触发 2、3、4 阶段的回调，追加全部攻击模式
+        self.boss.take_damage(self.boss.hp - self.boss.max_hp * 0.09)
+        self.tick(scene)
+
+    def tick(self, scene):
+        boss = self.boss
+        boss.hp = max(boss.hp, boss.max_hp * 0.05)  # 不让玩家把 Boss 打死
+        if not boss.alive():
+            scene.enemies.add(boss)
+            boss.attach(scene.clock, scene.timers, scene.emitters)
+        holes = sum(isinstance(s, BlackHole) for s in scene.enemy_bullets.sprites)
+        for _ in range(self.BLACK_HOLES - holes):
+            scene.enemy_bullets.add(
+                BlackHole(
+                    (
+                        boss.rect.centerx + _random.randint(-200, 200),
+                        boss.rect.centery + 150,
+                    )
+                )
+            )
+
+
+class ParticleStorm(Scenario):
+    """粒子池始终处于满载：每步在随机位置发射大量爆炸粒子"""
+
+    name = "particle_storm"
+    description = "particle pool saturated with explosion bursts every tick"
+
+    BURSTS = 20  # 每步的爆炸次数
+    PER_BURST = 20  # 每次爆炸的粒子数
+
+    def setup(self, scene):
+        _hold_spawner(scene)
+        self.tick(scene)
+
+    def tick(self, scene):
+        for _ in range(self.BURSTS):
+            pos = (
+                _random.randint(0, Config.WIDTH),
+                _random.randint(0, Config.HEIGHT),
+            )
+            scene.particles.emit(pos, self.PER_BURST, color=(255, 150, 0))
+
+
+SCENARIOS = {
+    scenario.name: scenario for scenario in (LateWave, BossPhase4, ParticleStorm)
+}
@@ -0,0 +1,153 @@
+"""
+对比合成纹理的各种上传方式。
+
+在与游戏相同的 1280x720 渲染表面上反复上传整帧，分别统计：
+- CPU 侧取像素：旧的 tostring(RGBA, 翻转) 拷贝与 get_view 零拷贝视图的耗时和内存峰值
+- 主线程耗时：上传调用本身阻塞主线程的时间（即 flip 之前的停顿）
+- 上传 + 绘制 + flip 的总耗时
+
+用法（在项目根目录）：
+    python -m benchmarks.texture_upload [帧数]
+"""
+
+import statistics
+import sys
+import time
+import tracemalloc
+
+import pygame
+from OpenGL.GL import *
+
+from src.core.config import Config
+from src.core.texture_upload import (
+    PBOTextureUploader,
+    SyncTextureUploader,
+    pixel_format,
+)
+
+
+class TostringUploader:
+    """旧的上传方式：每帧 tostring 拷贝一份翻转后的 RGBA 数据"""
+
+    def __init__(self, texture, size):
+        self.texture = texture
+        self.size = size
+
+    def upload(self, surface, rects=None):
+        data = pygame.image.tostring(surface, "RGBA", True)
+        glBindTexture(GL_TEXTURE_2D, self.texture)
+        glTexSubImage2D(
+            GL_TEXTURE_2D,
+            0,
+            0,
+            0,
+            self.size[0],
+            self.size[1],
+            GL_RGBA,
+            GL_UNSIGNED_BYTE,
+            data,
+        )
+        return len(data)
+
+
+def _create_texture(size):
+    texture = glGenTextures(1)
+    glBindTexture(GL_TEXTURE_2D, texture)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+    glTexImage2D(
+        GL_TEXTURE_2D, 0, GL_RGBA, size[0], size[1], 0, GL_RGBA, GL_UNSIGNED_BYTE, None
+    )
+    return texture
+
+
+def _draw_quad(texture, size):
+    """让纹理真正被使用，模拟游戏每帧绘制合成纹理"""
+    glClear(GL_COLOR_BUFFER_BIT)
+    glEnable(GL_TEXTURE_2D)
+    glBindTexture(GL_TEXTURE_2D, texture)
+    glBegin(GL_QUADS)
+    glTexCoord2f(0, 0)
+    glVertex2f(0, 0)
+    glTexCoord2f(1, 0)
+    glVertex2f(size[0], 0)
+    glTexCoord2f(1, 1)
+    glVertex2f(size[0], size[1])
+    glTexCoord2f(0, 1)
+    glVertex2f(0, size[1])
+    glEnd()
+    glDisable(GL_TEXTURE_2D)
+
+
+def _ms(values):
+    return statistics.median(values) * 1000
+
+
+def bench_readback(surface, frames):
+    """只比较 CPU 侧取像素的开销：不调用 GL"""
+
+    def tostring():
+        return pygame.image.tostring(surface, "RGBA", True)
+
+    def view():
+        return surface.get_view("1")
+
+    print(f"pixel format: {'BGRA' if pixel_format(surface) == GL_BGRA else 'RGBA'}")
+    for name, read in (("tostring", tostring), ("get_view", view)):
+        times = []
+        tracemalloc.start()
+        for _ in range(frames):
+            start = time.perf_counter()
+            data = read()
+            times.append(time.perf_counter() - start)
+            del data
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name:<10} median {_ms(times):7.3f} ms   peak {peak / 1024:9.1f} KB")
+
+
+def bench(name, uploader, surface, frames):
+    upload_times = []
+    frame_times = []
+    for i in range(frames):
+        # 每帧内容都不同，避免驱动走捷径
+        surface.fill((i % 256, 64, 255 - i % 256, 255), (0, 0, 64, 64))
+        start = time.perf_counter()
+        uploader.upload(surface)
+        upload_times.append(time.perf_counter() - start)
+        _draw_quad(uploader.texture, surface.get_size())
+        pygame.display.flip()
+        frame_times.append(time.perf_counter() - start)
+    glFinish()
+
+    print(
+        f"{name:<10} upload(main thread) median {_ms(upload_times):7.3f} ms   "
+        f"upload+draw+flip median {_ms(frame_times):7.3f} ms"
+    )
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    size = (Config.WIDTH, Config.HEIGHT)
+    pygame.init()
+    pygame.display.set_mode(size, pygame.OPENGL | pygame.DOUBLEBUF)
+    glMatrixMode(GL_PROJECTION)
+    glLoadIdentity()
+    glOrtho(0, size[0], size[1], 0, -1, 1)
+    glMatrixMode(GL_MODELVIEW)
+
+    surface = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+    surface.fill((30, 60, 90, 255))
+
+    print(f"{size[0]}x{size[1]}, {frames} frames, {glGetString(GL_RENDERER)}")
+    bench_readback(surface, frames)
+    bench("tostring", TostringUploader(_create_texture(size), size), surface, frames)
+    bench("sync", SyncTextureUploader(_create_texture(size), size), surface, frames)
+    for count in (2, 3):
+        uploader = PBOTextureUploader(_create_texture(size), size, count=count)
+        bench(f"pbo x{count}", uploader, surface, frames)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+无窗口快进模式：不开窗口、不用 OpenGL、不限帧，按固定步长尽快推进 GameScene。
+
+用法：
+    python headless.py --minutes 10
+    python headless.py --waves 20 --invincible --quiet
+    python headless.py --minutes 5 --tick-rate 120 --render
+    python headless.py --waves 10 --trace traces/headless.json
+    python headless.py --minutes 3 --seed 42 --record replays/run.rpl
+    python headless.py --replay replays/run.rpl
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+
+from src.core.config import Config
+from src.core.headless import HeadlessGame, count_entities
+from src.core.profiler import profiler
+from src.core.replay import (
+    Replay,
+    ReplayInput,
+    ReplayRecorder,
+    nondeterministic_settings,
+)
+from src.core.trace import start_recording, stop_recording
+from src.scenes.game_scene import GameScene
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run GameScene headless.")
+    parser.add_argument(
+        "--minutes",
+        type=float,
+        help="simulated minutes to run (default 5, or 60 with --waves)",
+    )
+    parser.add_argument("--waves", type=int, help="stop when this wave is reached")
+    parser.add_argument(
+        "--tick-rate", type=int, default=Config.TICK_RATE, help="simulation Hz"
+    )
+    parser.add_argument(
+        "--invincible", action="store_true", help="keep the player at full health"
+    )
+    parser.add_argument(
+        "--render", action="store_true", help="also draw every tick offscreen"
+    )
+    parser.add_argument(
+        "--quiet", action="store_true", help="silence the game's own print output"
+    )
+    parser.add_argument("--trace", help="record a Chrome trace JSON to this path")
+    parser.add_argument("--seed", type=int, help="master RNG seed (default random)")
+    parser.add_argument("--record", help="save a replay of the run to this path")
+    parser.add_argument(
+        "--replay", help="play back a replay file and verify it reproduces exactly"
+    )
+    args = parser.parse_args()
+    if args.replay and (args.record or args.seed is not None):
+        parser.error("--replay cannot be combined with --record or --seed")
+    if args.replay or args.record:
+        reasons = nondeterministic_settings()
+        if reasons:
+            parser.error(f"cannot record or replay: {'; '.join(reasons)}")
+    if args.minutes is None:
+        # 只给 --waves 时也设一个上限，卡在 Boss 波次时不会无限运行
+        args.minutes = 5.0 if args.waves is None else 60.0
+    return args
+
+
+def main():
+    args = parse_args()
+    if args.invincible:
+        Config.HOLD_HP = True
+
+    replay = Replay.load(args.replay) if args.replay else None
+    if replay is not None:
+        # 回放按录制时的频率、步数和开关运行
+        args.tick_rate = replay.tick_rate
+        Config.HOLD_HP = replay.hold_hp
+        args.minutes = replay.ticks / replay.tick_rate / 60
+
+    game = HeadlessGame(tick_rate=args.tick_rate, render=args.render)
+    step = game.timestep.step
+    last_wave = None
+
+    def report_wave(scene, ticks):
+        # 每到新的一波打印一行，观察难度曲线和实体数量
+        nonlocal last_wave
+        wave = scene.spawner.wave
+        if wave != last_wave:
+            last_wave = wave
+            print(
+                f"[{ticks * step:8.1f}s] wave {wave:3d}  "
+                f"enemies {len(scene.enemies):4d}  "
+                f"enemy bullets {len(scene.enemy_bullets):5d}  "
+                f"spawns/s {scene.spawner.spawn_rate:3d}  "
+                f"entities {count_entities(scene):5d}",
+                file=report,
+            )
+
+    report = sys.stdout  # 静音时报告仍写到原来的 stdout
+    with contextlib.ExitStack() as stack:
+        if args.quiet:
+            devnull = stack.enter_context(open(os.devnull, "w"))
+            stack.enter_context(contextlib.redirect_stdout(devnull))
+        if replay is not None:
+            source = ReplayInput(replay)
+            scene = GameScene(game, seed=replay.seed, input_source=source)
+        else:
+            scene = GameScene(game, seed=args.seed)
+            if args.record:
+                # 无窗口时键盘输入恒为空，录下的是种子和空输入序列
+                source = ReplayRecorder(scene.seed, args.tick_rate, scene.input)
+                scene.input = source
+        game.change_scene(scene)
+        if args.trace:
+            start_recording(profiler)
+        stats = game.run(args.minutes, args.waves, on_tick=report_wave)
+        if args.trace:
+            stop_recording(profiler, args.trace)
+        if args.record:
+            source.save(scene, args.record)
+
+        print(
+            f"ticks {stats['ticks']} ({stats['simulated_seconds']:.1f}s simulated "
+            f"in {stats['wall_seconds']:.2f}s wall)\n"
+            f"ticks/s {stats['ticks_per_second']:.0f}  "
+            f"entities/s {stats['entities_per_second']:.0f}  "
+            f"peak entities {stats['peak_entities']}\n"
+            f"reached wave {stats['wave']}"
+            + ("" if stats["player_alive"] else " (player died)"),
+            file=report,
+        )
+        if replay is not None:
+            if source.verify_final(scene):
+                print(
+                    f"replay OK: seed {replay.seed}, {replay.ticks} ticks, "
+                    f"{source.verified} checkpoints match",
+                    file=report,
+                )
+            else:
+                print(f"replay DESYNC at tick {source.desync_tick}", file=report)
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+from .config import Config
+
+
+class SimulationClock:
+    """
+    场景的模拟时钟：实体读取的“当前时间”只随模拟步前进，与墙钟无关。
+
+    GameScene 每步调用 advance(dt)，返回按 time_scale 缩放后的步长
+    （暂停时为 0），场景用它推进所有对象。于是模拟比墙钟跑得快或慢
+    （快进、暂停、慢动作）都不会改变游戏行为；读取时间也只是一次属性访问，
+    不再是每个实体每帧一次 SDL 调用。
+
+        now = self.clock.time         # 秒（浮点）
+        ms = self.clock.get_ticks()   # 毫秒（整数），可直接替换 pygame.time.get_ticks()
+    """
+
+    def __init__(self, time_scale=Config.TIME_SCALE):
+        self.time = 0.0  # 已经过的模拟时间（秒）
+        self.ticks = 0  # 已推进的步数（暂停的步不计）
+        self.time_scale = time_scale
+        self.paused = False
+
+    def advance(self, dt):
+        """推进一步，返回本步实际经过的模拟时间"""
+        if self.paused:
+            return 0.0
+        dt *= self.time_scale
+        self.time += dt
+        self.ticks += 1
+        return dt
+
+    def get_ticks(self):
+        return int(self.time * 1000)
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def toggle_pause(self):
+        self.paused = not self.paused
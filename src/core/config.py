@@ -1,3 +1,8 @@
+import os
+
+from ..constants import __PROJECT_ROOT__
+
+
 class Config:
     WIDTH = 1280
     HEIGHT = 720
@@ -9,3 +14,50 @@ class Config:
     SHOW_FPS = True
     ENABLE_BACKGROUND = True
     HOLD_HP = False
+    ASSET_CACHE_SIZE = 64  # 共享图像缓存的最大条目数
+    DATA_DIR = os.path.normpath(os.path.join(__PROJECT_ROOT__, "data"))  # 运行时生成的文件
+    # OpenGL 渲染后端
+    GL_SPRITE_BATCH = True  # True: 纹理图集 + 批量四边形；False: CPU 合成整帧后上传纹理
+    ATLAS_SIZE = 2048  # 单张纹理图集的边长（像素）
+    MAX_ATLASES = 4  # 图集数量上限，全部写满后清空重新打包
+    # CPU 合成路径（GL_SPRITE_BATCH = False 时）的脏区域上传
+    DIRTY_RECTS = True  # 背景层由 GL 直接绘制，只上传前景中发生变化的区域
+    DIRTY_TILE_SIZE = 32  # 脏区域的瓦片粒度（像素）
+    DIRTY_FULL_UPLOAD_RATIO = 0.6  # 脏区域覆盖率超过该值时改为整帧上传
+    # 合成纹理的上传方式："sync" 同步 glTexSubImage2D，"pbo" 像素缓冲对象环异步上传
+    TEXTURE_UPLOAD = "sync"
+    PBO_COUNT = 2  # PBO 环的大小（2 或 3）
+    BULLET_POOL_SIZE = 2048  # 敌方子弹池的初始容量（不足时自动翻倍）
+    PARTICLE_CAPACITY = 1024  # 粒子池容量，用尽时覆盖最早的粒子
+    COLLISION_CELL_SIZE = 64  # 碰撞宽相位网格的格子边长（像素）
+    FIELD_CELL_SIZE = 64  # 力场（黑洞）查询受力子弹时的网格边长（像素）
+    BLACKHOLE_PLAYER_PULL = 0.3  # 黑洞对玩家的拉力（相对 pull_force），0 为不影响玩家
+    TEXT_CACHE_SIZE = 256  # 已渲染文字表面的缓存条目数
+    TEXT_FADE_STEPS = 16  # 淡出文字的透明度分级数，每级缓存一张表面
+    # 固定步长模拟：逻辑按 TICK_RATE 推进，渲染按显示帧率插值
+    TICK_RATE = 60  # 每秒模拟步数，与显示帧率无关
+    MAX_CATCHUP_STEPS = 5  # 单帧最多补算的模拟步数，超出的时间直接丢弃
+    RENDER_INTERPOLATION = True  # 在上一步与当前步的位置之间插值绘制
+    TIME_SCALE = 1.0  # 模拟时间流速（< 1 为慢动作），P 键暂停
+    # 帧分析器（F3 切换叠加层）
+    PROFILER_ENABLED = False  # 启动时即记录各计时段；关闭时 scope() 几乎没有开销
+    PROFILER_FRAMES = 240  # 环形缓冲区保存的帧数
+    # 帧时间线录制（Chrome Trace / Perfetto，F4 开始/停止）
+    TRACE_ON_START = False  # 启动即开始录制，退出时写出文件
+    TRACE_DIR = "traces"  # 录制文件的输出目录
+    TRACE_MAX_EVENTS = 2_000_000  # 单次录制的事件数上限
+    # 卡顿监视：帧耗时超过预算时把该帧的分析数据写到磁盘（轮换保存）
+    SPIKE_WATCHDOG = False  # 排查卡顿时打开；启用后分析器常开（每个计时段约 1 微秒）
+    SPIKE_BUDGET_FACTOR = 2.0  # 预算 = 目标帧间隔 x 该系数
+    SPIKE_DIR = os.path.join(DATA_DIR, "spikes")  # 捕获文件目录
+    SPIKE_KEEP = 10  # 最多保留的捕获文件数，循环覆盖最早的
+    SPIKE_COOLDOWN = 1.0  # 两次捕获的最小间隔（秒），持续卡顿时不会每帧写盘
+    SPIKE_GC_TAG_MS = 1.0  # 本帧 GC 暂停累计超过该值时标记为 gc
+    # 敌机生成队列：波次成员排队，每步只构造一部分，避免波次开始时卡顿
+    SPAWN_PER_TICK = 2  # 每步最多构造的敌机数（至少 1）
+    SPAWN_BUDGET_MS = 0.0  # > 0 时每步构造耗时上限；取决于机器速度，此时拒绝录制和回放
+    # 随机数与回放
+    RNG_SEED = None  # 主种子；None 表示每局随机（录制回放时会保存实际种子）
+    REPLAY_RECORD = False  # 记录每一局的种子和逐步输入
+    REPLAY_DIR = "replays"  # 回放文件目录
+    REPLAY_CHECKPOINT_TICKS = 60  # 每隔多少步保存一次状态校验值
@@ -0,0 +1,121 @@
+import numpy as np
+import pygame
+
+from .config import Config
+
+
+class DirtyRegionTracker:
+    """
+    包装 CPU 合成用的渲染表面，记录本帧所有绘制覆盖的区域（思路同
+    pygame.sprite.LayeredDirty），供 GL 路径只上传发生变化的部分。
+
+    区域按瓦片粒度累积在布尔网格里，记录成本与精灵数量成线性关系，
+    合并结果的矩形数量也有上限。表面假定为透明叠加层：每帧开始时只清除
+    上一帧画过的瓦片，而不是整屏填充。
+    """
+
+    def __init__(self, surface, tile_size=Config.DIRTY_TILE_SIZE):
+        self.surface = surface
+        self.tile_size = tile_size
+        width, height = surface.get_size()
+        self._cols = -(-width // tile_size)
+        self._rows = -(-height // tile_size)
+        self._bounds = surface.get_rect()
+        self._tiles = np.zeros((self._rows, self._cols), dtype=bool)
+        self._previous = np.zeros_like(self._tiles)
+
+    # --- Surface 兼容接口 ---
+
+    def get_size(self):
+        return self.surface.get_size()
+
+    def get_width(self):
+        return self.surface.get_width()
+
+    def get_height(self):
+        return self.surface.get_height()
+
+    def get_rect(self, **kwargs):
+        return self.surface.get_rect(**kwargs)
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        rect = self.surface.blit(source, dest, area, special_flags)
+        self.mark(rect)
+        return rect
+
+    def blits(self, blit_sequence, doreturn=1):
+        rects = self.surface.blits(blit_sequence, 1)
+        mark = self.mark
+        for rect in rects:
+            mark(rect)
+        return rects if doreturn else None
+
+    def fill(self, color, rect=None, special_flags=0):
+        rect = self.surface.fill(color, rect, special_flags)
+        self.mark(rect)
+        return rect
+
+    def draw_rect(self, color, rect, width=0):
+        rect = pygame.draw.rect(self.surface, color, rect, width)
+        self.mark(rect)
+        return rect
+
+    # --- 脏区域 ---
+
+    def begin_frame(self):
+        """清除上一帧画过的瓦片，开始记录新一帧"""
+        self._previous, self._tiles = self._tiles, self._previous
+        self._tiles[:] = False
+        for rect in self._tile_rects(self._previous):
+            self.surface.fill((0, 0, 0, 0), rect)
+
+    def mark(self, rect):
+        """把矩形覆盖的瓦片标记为脏"""
+        rect = self._bounds.clip(rect)
+        if not rect.width or not rect.height:
+            return
+        size = self.tile_size
+        self._tiles[
+            rect.top // size : (rect.bottom - 1) // size + 1,
+            rect.left // size : (rect.right - 1) // size + 1,
+        ] = True
+
+    def coverage(self):
+        """需要上传的区域占整屏的比例"""
+        return float((self._tiles | self._previous).mean())
+
+    def dirty_rects(self):
+        """本帧需要上传的矩形：上一帧与本帧绘制区域的并集（新画的 + 被擦掉的）"""
+        return self._tile_rects(self._tiles | self._previous)
+
+    def _tile_rects(self, tiles):
+        """把瓦片网格合并成矩形：先合并每行中连续的瓦片，再向下合并列范围相同的行段"""
+        size = self.tile_size
+        rects = []
+        open_runs = {}  # (start_col, end_col) -> [start_row, end_row]
+        for row in range(self._rows + 1):
+            runs = set()
+            if row < self._rows:
+                line = tiles[row]
+                if line.any():
+                    # 连续 True 段的起止列
+                    padded = np.concatenate(([False], line, [False]))
+                    edges = np.flatnonzero(padded[1:] != padded[:-1])
+                    runs = set(zip(edges[0::2].tolist(), edges[1::2].tolist()))
+            for run in list(open_runs):
+                if run in runs:
+                    open_runs[run][1] = row + 1
+                    runs.discard(run)
+                else:
+                    start_row, end_row = open_runs.pop(run)
+                    rects.append(
+                        pygame.Rect(
+                            run[0] * size,
+                            start_row * size,
+                            (run[1] - run[0]) * size,
+                            (end_row - start_row) * size,
+                        ).clip(self._bounds)
+                    )
+            for run in runs:
+                open_runs[run] = [row, row + 1]
+        return rects
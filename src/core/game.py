@@ -3,6 +3,15 @@ from pygame.locals import *
 from .config import Config
 from random import randint
 from ..managers.score import ScoreManager
+from ..managers.fonts import fonts, render_text
+from .renderer import SpriteBatch
+from .dirty_regions import DirtyRegionTracker
+from .texture_upload import create_texture_uploader
+from .timestep import FixedTimestep
+from .profiler import profiler
+from .trace import start_recording, stop_recording, tracer
+from .watchdog import SpikeWatchdog
+from ..ui.profiler_overlay import ProfilerOverlay
 from OpenGL.GL import *
 from OpenGL.GLU import *
 
@@ -13,6 +22,10 @@ class Game:
     def __init__(self):
         pygame.init()
         self.render_texture = None
+        self.texture_uploader = None
+        self.sprite_batch = None
+        self.dirty_tracker = None
+        self.upload_bytes = None  # bytes uploaded to render_texture last frame
         try:
             self.screen = pygame.display.set_mode(
                 (Config.WIDTH, Config.HEIGHT), pygame.OPENGL | pygame.DOUBLEBUF
@@ -38,8 +51,7 @@ class Game:
                 (Config.WIDTH, Config.HEIGHT), pygame.SRCALPHA
             ).convert_alpha()
 
-            # Initial texture upload
-            texture_data = pygame.image.tostring(self.render_surface, "RGBA", True)
+            # Allocate texture storage, then upload straight from the surface buffer
             glTexImage2D(
                 GL_TEXTURE_2D,
                 0,
@@ -49,8 +61,20 @@ class Game:
                 0,
                 GL_RGBA,
                 GL_UNSIGNED_BYTE,
-                texture_data,
+                None,
             )
+            self.texture_uploader = create_texture_uploader(
+                self.render_texture, (Config.WIDTH, Config.HEIGHT)
+            )
+            self.texture_uploader.upload(self.render_surface)
+
+            # GL sprite batch: with GL_SPRITE_BATCH every sprite is drawn as
+            # atlas quads instead of being composited on the CPU; otherwise
+            # it only draws the background under the dirty-rect overlay
+            if Config.GL_SPRITE_BATCH or Config.DIRTY_RECTS:
+                self.sprite_batch = SpriteBatch((Config.WIDTH, Config.HEIGHT))
+            if not Config.GL_SPRITE_BATCH and Config.DIRTY_RECTS:
+                self.dirty_tracker = DirtyRegionTracker(self.render_surface)
         except pygame.error as e:
             print(f"OpenGL init failed: {e}, using fallback")
             self.screen = pygame.display.set_mode((Config.WIDTH, Config.HEIGHT))
@@ -58,17 +82,22 @@ class Game:
                 (Config.WIDTH, Config.HEIGHT)
             ).convert()
             self.render_texture = None
+            self.texture_uploader = None
+            self.sprite_batch = None
+            self.dirty_tracker = None
 
         pygame.display.set_caption(Config.TITLE)
         self.clock = pygame.time.Clock()
         self.running = True
         self.dt = 0.0
+        # 模拟按固定步长推进；render_alpha 为渲染时在两步之间的插值比例
+        self.timestep = FixedTimestep()
+        self.render_alpha = 1.0
         self.fps_font = None
         if Config.SHOW_FPS:
-            try:
-                self.fps_font = pygame.font.SysFont("monospace", 18)
-            except:
-                self.fps_font = pygame.font.Font(None, 24)
+            self.fps_font = fonts.get("monospace", 18)
+        self.profiler_overlay = ProfilerOverlay(profiler)  # F3 切换
+        self.watchdog = SpikeWatchdog(profiler) if Config.SPIKE_WATCHDOG else None
         self.active_scene = None
         self.shake_intensity = 0
         self.shake_duration = 0.0
@@ -91,9 +120,21 @@ class Game:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
+                elif event.key == pygame.K_F3:
+                    self.profiler_overlay.toggle()
+                elif event.key == pygame.K_F4:
+                    self.toggle_trace()
             if self.active_scene:
                 self.active_scene.handle_event(event)
 
+    def toggle_trace(self):
+        """开始 / 停止录制帧时间线（停止时写出 Chrome Trace JSON）"""
+        if tracer.recording:
+            stop_recording(profiler)
+        else:
+            start_recording(profiler)
+            print("Trace recording started")
+
     def run(self):
         # Initial scene setup (same as before)
         if not self.active_scene and self.running:
@@ -104,13 +145,27 @@ class Game:
                 print(f"Scene init error: {e}")
                 self.running = False
 
+        if Config.TRACE_ON_START and not tracer.recording:
+            start_recording(profiler)
+        if self.watchdog is not None:
+            self.watchdog.start()
+
         while self.running:
             milliseconds = self.clock.tick(Config.FPS)
             self.dt = milliseconds / 1000.0
-            self.handle_events()
+            profiler.begin_frame()
+            with profiler.scope("events"):
+                self.handle_events()
 
-            if self.active_scene:
-                self.active_scene.update(self.dt)
+            # 固定步长模拟：一帧可能执行 0 步或多步（上限 MAX_CATCHUP_STEPS）
+            with profiler.scope("update"):
+                for _ in range(self.timestep.advance(self.dt)):
+                    if not self.running or not self.active_scene:
+                        break
+                    self.active_scene.update(self.timestep.step)
+            self.render_alpha = (
+                self.timestep.alpha if Config.RENDER_INTERPOLATION else 1.0
+            )
 
             # Calculate screen shake offset
             render_offset = (0, 0)
@@ -121,68 +176,121 @@ class Game:
                     randint(-self.shake_intensity, self.shake_intensity),
                 )
 
-            # Render to surface
-            self.render_surface.fill(Config.BG_COLOR)
-            if self.active_scene:
-                self.active_scene.render(self.render_surface)
-
-            # FPS rendering
-            if Config.SHOW_FPS and self.fps_font:
-                self._draw_fps(self.clock.get_fps())
-
-            # OpenGL rendering
-            if (
+            if Config.GL_SPRITE_BATCH and self.sprite_batch is not None:
+                # Batched GL rendering, no CPU composite or full-frame upload
+                glClear(GL_COLOR_BUFFER_BIT)
+                self.sprite_batch.begin(render_offset)
+                self._render_frame(self.sprite_batch)
+                with profiler.scope("upload"):
+                    self.sprite_batch.end()
+            elif (
                 self.screen.get_flags() & pygame.OPENGL
                 and self.render_texture is not None
             ):
-                # Upload surface to texture
-                texture_data = pygame.image.tostring(self.render_surface, "RGBA", True)
-                glBindTexture(GL_TEXTURE_2D, self.render_texture)
-                glTexSubImage2D(
-                    GL_TEXTURE_2D,
-                    0,
-                    0,
-                    0,
-                    Config.WIDTH,
-                    Config.HEIGHT,
-                    GL_RGBA,
-                    GL_UNSIGNED_BYTE,
-                    texture_data,
-                )
-
-                # Clear and draw textured quad
-                glClear(GL_COLOR_BUFFER_BIT)
-                glLoadIdentity()
-                glTranslatef(render_offset[0], render_offset[1], 0)
-
-                glEnable(GL_TEXTURE_2D)
-                glBindTexture(GL_TEXTURE_2D, self.render_texture)
-                glBegin(GL_QUADS)
-                glTexCoord2f(0, 1)  # 左上纹理坐标
-                glVertex2f(0, 0)  # 左上顶点
-                glTexCoord2f(1, 1)  # 右上纹理坐标
-                glVertex2f(Config.WIDTH, 0)  # 右上顶点
-                glTexCoord2f(1, 0)  # 右下纹理坐标
-                glVertex2f(Config.WIDTH, Config.HEIGHT)  # 右下顶点
-                glTexCoord2f(0, 0)  # 左下纹理坐标
-                glVertex2f(0, Config.HEIGHT)  # 左下顶点
-                glEnd()
-                glDisable(GL_TEXTURE_2D)
+                self._render_composite(render_offset)
             else:
                 # Fallback to software rendering
+                self.render_surface.fill(Config.BG_COLOR)
+                self._render_frame(self.render_surface)
                 self.screen.blit(self.render_surface, render_offset)
 
-            pygame.display.flip()
+            with profiler.scope("flip"):
+                pygame.display.flip()
+            profiler.end_frame()
+            if self.watchdog is not None:
+                self.watchdog.end_frame(milliseconds, self.active_scene)
 
+        if tracer.recording:
+            stop_recording(profiler)  # 退出时写出未保存的录制
+        if hasattr(self.active_scene, "save_replay"):
+            self.active_scene.save_replay()
+        if self.watchdog is not None:
+            self.watchdog.stop()
         pygame.quit()
 
-    def _draw_fps(self, fps):
-        # 现在绘制到render_surface而不是直接到屏幕
-        text_surface = self.fps_font.render(f"FPS: {int(fps)}", True, (255, 255, 255))
+    def _render_composite(self, render_offset):
+        """CPU composite into render_surface, then upload it as a texture."""
+        if self.dirty_tracker is not None:
+            # Background layers go straight to GL; the CPU only composites a
+            # transparent foreground overlay and uploads the tiles that changed
+            self.sprite_batch.begin(render_offset)
+            self.dirty_tracker.begin_frame()
+            self._render_frame(self.dirty_tracker, background=self.sprite_batch)
+            if self.dirty_tracker.coverage() > Config.DIRTY_FULL_UPLOAD_RATIO:
+                self._upload_render_surface()
+            else:
+                self._upload_render_surface(self.dirty_tracker.dirty_rects())
+            glClear(GL_COLOR_BUFFER_BIT)
+            with profiler.scope("upload"):
+                self.sprite_batch.end()
+        else:
+            self.render_surface.fill(Config.BG_COLOR)
+            self._render_frame(self.render_surface)
+            self._upload_render_surface()
+            glClear(GL_COLOR_BUFFER_BIT)
+
+        # Draw textured quad
+        glLoadIdentity()
+        glTranslatef(render_offset[0], render_offset[1], 0)
+
+        glEnable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, self.render_texture)
+        glBegin(GL_QUADS)
+        # 纹理按表面行顺序（自上而下）上传，第 0 行即屏幕顶部，无需 CPU 翻转
+        glTexCoord2f(0, 0)  # 左上纹理坐标
+        glVertex2f(0, 0)  # 左上顶点
+        glTexCoord2f(1, 0)  # 右上纹理坐标
+        glVertex2f(Config.WIDTH, 0)  # 右上顶点
+        glTexCoord2f(1, 1)  # 右下纹理坐标
+        glVertex2f(Config.WIDTH, Config.HEIGHT)  # 右下顶点
+        glTexCoord2f(0, 1)  # 左下纹理坐标
+        glVertex2f(0, Config.HEIGHT)  # 左下顶点
+        glEnd()
+        glDisable(GL_TEXTURE_2D)
+
+    def _upload_render_surface(self, rects=None):
+        """Uploads render_surface (or only the given rects) to render_texture."""
+        with profiler.scope("upload"):
+            self.upload_bytes = self.texture_uploader.upload(self.render_surface, rects)
+
+    def _render_frame(self, target, background=None):
+        """
+        Draws the active scene and overlays onto a Surface or SpriteBatch.
+
+        Args:
+            target: Render target for the scene and overlays.
+            background: Optional separate target for the scene's background
+                layers (defaults to target).
+        """
+        with profiler.scope("render"):
+            if self.active_scene:
+                if hasattr(self.active_scene, "render_background"):
+                    self.active_scene.render_background(
+                        target if background is None else background
+                    )
+                self.active_scene.render(target)
+
+            # FPS rendering
+            if Config.SHOW_FPS and self.fps_font:
+                self._draw_fps(target, self.clock.get_fps())
+
+            # 帧分析叠加层（F3），附带当前场景各组的实体数量
+            if self.profiler_overlay.visible:
+                counts = None
+                if hasattr(self.active_scene, "entity_counts"):
+                    counts = self.active_scene.entity_counts()
+                self.profiler_overlay.draw(target, counts)
+
+    def _draw_fps(self, target, fps):
+        # 绘制到渲染目标（render_surface 或 sprite_batch）而不是直接到屏幕
+        label = f"FPS: {int(fps)}"
+        if self.upload_bytes is not None:
+            label += f"  UPLOAD: {self.upload_bytes // 1024} KB"
+        text_surface = render_text(self.fps_font, label, (255, 255, 255))
         text_rect = text_surface.get_rect()
         padding = 10
         text_rect.bottomright = (Config.WIDTH - padding, Config.HEIGHT - padding)
-        self.render_surface.blit(text_surface, text_rect)
+        target.blit(text_surface, text_rect)
 
     def apply_screen_shake(self, intensity=5, duration=0.2):
         self.shake_intensity = max(0, intensity)
@@ -0,0 +1,103 @@
+import os
+import time
+
+import pygame
+
+from .config import Config
+from .profiler import profiler
+from .timestep import FixedTimestep
+from ..managers.score import ScoreManager
+
+
+class HeadlessGame:
+    """
+    无窗口的 Game 替身：不创建 OpenGL 上下文、不限帧，只按固定步长
+    尽快推进场景，用于测量难度曲线和后期波次的实体数量。
+
+    只实现场景会用到的 Game 接口（score_manager、change_scene、
+    apply_screen_shake、render_alpha 等）。视频驱动默认使用 SDL 的
+    dummy 驱动，仍会创建一个 1x1 的显示表面，保证 convert_alpha() 可用。
+    render=True 时每步把场景绘制到一张离屏表面上，把渲染开销也算进去。
+    """
+
+    def __init__(self, tick_rate=Config.TICK_RATE, render=False):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        pygame.init()
+        self.screen = pygame.display.set_mode((1, 1))
+        self.render_surface = (
+            pygame.Surface((Config.WIDTH, Config.HEIGHT)) if render else None
+        )
+
+        self.timestep = FixedTimestep(tick_rate)
+        self.render_alpha = 1.0
+        self.running = True
+        self.active_scene = None
+        self.score_manager = ScoreManager()
+
+    def change_scene(self, new_scene):
+        self.active_scene = new_scene
+
+    def apply_screen_shake(self, intensity=5, duration=0.2):
+        pass  # 没有屏幕可以震动
+
+    def run(self, minutes=None, waves=None, on_tick=None):
+        """
+        推进当前场景，直到模拟了 minutes 分钟、到达第 waves 波、场景被切换
+        （玩家死亡）或 running 被置为 False。
+
+        Args:
+            minutes: 模拟时长上限（模拟时间，不是墙钟时间）。
+            waves: 到达该波次后停止。
+            on_tick: 每步之后调用 on_tick(scene, ticks)，可用于采样。
+
+        Returns:
+            统计结果字典。
+        """
+        scene = self.active_scene
+        step = self.timestep.step
+        max_ticks = None if minutes is None else round(minutes * 60 / step)
+        surface = self.render_surface
+
+        ticks = 0
+        entity_updates = 0
+        peak_entities = 0
+        start = time.perf_counter()
+        while self.running and self.active_scene is scene:
+            if max_ticks is not None and ticks >= max_ticks:
+                break
+            if waves is not None and scene.spawner.wave >= waves:
+                break
+            profiler.begin_frame()  # 每一步记为一帧（时间线录制时可见）
+            with profiler.scope("update"):
+                scene.update(step)
+            if surface is not None and self.active_scene is scene:
+                with profiler.scope("render"):
+                    surface.fill(Config.BG_COLOR)
+                    scene.render_background(surface)
+                    scene.render(surface)
+            profiler.end_frame()
+            ticks += 1
+
+            entities = count_entities(scene)
+            entity_updates += entities
+            peak_entities = max(peak_entities, entities)
+            if on_tick is not None:
+                on_tick(scene, ticks)
+        elapsed = time.perf_counter() - start
+
+        return {
+            "ticks": ticks,
+            "simulated_seconds": ticks * step,
+            "wall_seconds": elapsed,
+            "ticks_per_second": ticks / elapsed if elapsed else 0.0,
+            "entities_per_second": entity_updates / elapsed if elapsed else 0.0,
+            "peak_entities": peak_entities,
+            "wave": scene.spawner.wave,
+            "player_alive": scene.player.alive(),
+        }
+
+
+def count_entities(scene):
+    """场景中当前需要逐步更新的实体总数（含池中的子弹和粒子）"""
+    return sum(scene.entity_counts().values())
@@ -0,0 +1,96 @@
+from enum import IntEnum
+
+from pygame.sprite import AbstractGroup
+
+
+class RenderLayer(IntEnum):
+    """绘制层，按数值从小到大依次绘制"""
+
+    BACKGROUND = 0
+    PLAYER = 1
+    ENEMIES = 2
+    BULLETS = 3  # 玩家子弹
+    ENEMY_BULLETS = 4
+    PICKUPS = 5
+    EFFECTS = 6  # 血条、粒子、伤害数字
+    HUD = 7
+
+
+class RenderQueue:
+    """
+    持久的分层绘制队列。
+
+    每层保存一组可绘制对象：精灵组或任何带 draw(surface) 方法的对象
+    （子弹池、粒子池、HUD），也可以是直接接受 surface 的函数。
+    对象只在场景创建时登记一次；精灵加入所属的组即进入对应的层，
+    kill() 后自动离开，不需要每帧重建绘制列表。
+
+    插值：每个模拟步开始前调用 snapshot() 记录精灵组中各精灵的位置，
+    并转发给带 snapshot() 的对象（子弹池、粒子池），这类对象的 draw 需
+    接受 (surface, alpha)。绘制时精灵临时移到上一步与当前步之间
+    alpha 比例处，画完立即还原，模拟状态不受影响。
+    """
+
+    def __init__(self):
+        self._layers = {layer: [] for layer in RenderLayer}
+        self._previous = {}  # 精灵 -> 上一模拟步的 rect.topleft
+
+    def attach(self, layer, drawable):
+        """把 drawable 追加到 layer 的末尾（同层内按登记顺序绘制）"""
+        self._layers[layer].append(drawable)
+        return drawable
+
+    def detach(self, layer, drawable):
+        self._layers[layer].remove(drawable)
+
+    def snapshot(self):
+        """记录当前位置作为下一模拟步的插值起点"""
+        previous = self._previous
+        previous.clear()
+        for drawables in self._layers.values():
+            for drawable in drawables:
+                if isinstance(drawable, AbstractGroup):
+                    for sprite in drawable:
+                        previous[sprite] = sprite.rect.topleft
+                elif hasattr(drawable, "snapshot"):
+                    drawable.snapshot()
+
+    def draw_layer(self, layer, surface, alpha=1.0):
+        for drawable in self._layers[layer]:
+            if isinstance(drawable, AbstractGroup):
+                if alpha < 1.0:
+                    self._draw_interpolated(drawable, surface, alpha)
+                else:
+                    drawable.draw(surface)
+            elif hasattr(drawable, "snapshot"):
+                drawable.draw(surface, alpha)
+            else:
+                draw = getattr(drawable, "draw", drawable)
+                draw(surface)
+
+    def draw(
+        self, surface, alpha=1.0, first=RenderLayer.PLAYER, last=RenderLayer.HUD
+    ):
+        """按顺序绘制 first..last 之间的所有层（背景层默认单独绘制）"""
+        for layer in RenderLayer:
+            if first <= layer <= last:
+                self.draw_layer(layer, surface, alpha)
+
+    def _draw_interpolated(self, group, surface, alpha):
+        previous = self._previous
+        moved = []
+        for sprite in group:
+            start = previous.get(sprite)
+            if start is None:
+                continue  # 本步新生成的精灵直接画在当前位置
+            rect = sprite.rect
+            x, y = rect.topleft
+            if start != (x, y):
+                moved.append((rect, x, y))
+                rect.topleft = (
+                    round(start[0] + (x - start[0]) * alpha),
+                    round(start[1] + (y - start[1]) * alpha),
+                )
+        group.draw(surface)
+        for rect, x, y in moved:
+            rect.topleft = (x, y)
@@ -0,0 +1,159 @@
+import time
+
+import numpy as np
+
+from .config import Config
+
+
+class _NullScope:
+    """关闭性能分析时所有 scope() 共用的空上下文，进入和退出都不做任何事"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class _Scope:
+    __slots__ = ("profiler", "name", "index", "start")
+
+    def __init__(self, profiler, name, index):
+        self.profiler = profiler
+        self.name = name
+        self.index = index
+        self.start = 0.0
+
+    def __enter__(self):
+        self.profiler._stack.append(self.index)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.start
+        profiler = self.profiler
+        stack = profiler._stack
+        stack.pop()
+        current = profiler._current
+        current[self.index] += elapsed
+        if stack:
+            # 记录独占时间：嵌套的子计时从父计时里扣除，堆叠图各段之和即帧时间
+            current[stack[-1]] -= elapsed
+        if profiler.recorder is not None:
+            profiler.recorder.complete(self.name, self.start, elapsed)
+        return False
+
+
+class FrameProfiler:
+    """
+    按名字计时的帧分析器。
+
+        with profiler.scope("collisions"):
+            ...
+
+    每帧各计时段的独占耗时（秒）写入固定大小的环形缓冲区 samples，
+    第 i 列对应 names[i]，frame_time 记录整帧耗时。
+    enabled 为 False 时 scope() 直接返回共享的空上下文，begin_frame / end_frame
+    立即返回，开销只有一次方法调用，可以常驻在正式版本中。
+    同名计时段不能嵌套自身。
+
+    recorder 不为 None 时（时间线录制期间），每个计时段和每一帧还会以
+    recorder.complete(name, start, duration) 的形式报告出去。
+    """
+
+    MAX_SCOPES = 32
+
+    def __init__(
+        self, capacity=Config.PROFILER_FRAMES, enabled=Config.PROFILER_ENABLED
+    ):
+        self.enabled = enabled
+        self._always_enabled = enabled
+        self._users = 0  # acquire() 的调用方数量
+        self.capacity = capacity
+        self.names = []
+        self._scopes = {}  # 名字 -> _Scope
+        self.samples = np.zeros((capacity, self.MAX_SCOPES))
+        self.frame_time = np.zeros(capacity)
+        self.frames = 0  # 已记录的帧数（环形缓冲区的写入位置 = frames % capacity）
+        self._current = [0.0] * self.MAX_SCOPES
+        self._stack = []
+        self._frame_start = None
+        self.recorder = None  # 见 trace.TraceRecorder
+
+    def scope(self, name):
+        if not self.enabled:
+            return _NULL_SCOPE
+        scope = self._scopes.get(name)
+        if scope is None:
+            if len(self.names) == self.MAX_SCOPES:
+                raise ValueError(f"too many profiler scopes (max {self.MAX_SCOPES})")
+            scope = _Scope(self, name, len(self.names))
+            self._scopes[name] = scope
+            self.names.append(name)
+        return scope
+
+    def acquire(self):
+        """临时启用分析器（叠加层、时间线录制等），与 release() 成对调用"""
+        self._users += 1
+        self.enabled = True
+
+    def release(self):
+        self._users = max(0, self._users - 1)
+        self.enabled = self._always_enabled or self._users > 0
+
+    def begin_frame(self):
+        if not self.enabled:
+            self._frame_start = None
+            return
+        self._current = [0.0] * self.MAX_SCOPES
+        self._stack.clear()
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        if self._frame_start is None:
+            return  # 本帧开始时未启用
+        row = self.frames % self.capacity
+        self.samples[row] = self._current
+        duration = time.perf_counter() - self._frame_start
+        self.frame_time[row] = duration
+        if self.recorder is not None:
+            self.recorder.complete("frame", self._frame_start, duration)
+        self.frames += 1
+        self._frame_start = None
+
+    def history(self, count=None):
+        """最近 count 帧（从旧到新）的 (samples, frame_time)，只含已命名的列"""
+        available = min(self.frames, self.capacity)
+        count = available if count is None else min(count, available)
+        rows = (np.arange(self.frames - count, self.frames)) % self.capacity
+        return self.samples[rows, : len(self.names)], self.frame_time[rows]
+
+    def last_frame(self):
+        """最近一帧的 (各计时段毫秒 {名字: 毫秒}, 整帧毫秒)，没有记录时返回 None"""
+        if not self.frames:
+            return None
+        row = (self.frames - 1) % self.capacity
+        scopes = self.samples[row, : len(self.names)] * 1000
+        return dict(zip(self.names, scopes.tolist())), self.frame_time[row] * 1000
+
+    def averages(self, count=None):
+        """最近 count 帧各计时段的平均耗时（毫秒），{名字: 毫秒}"""
+        samples, _ = self.history(count)
+        if not len(samples):
+            return {}
+        means = samples.mean(axis=0) * 1000
+        return dict(zip(self.names, means.tolist()))
+
+    def reset(self):
+        self.frames = 0
+        self.samples[:] = 0
+        self.frame_time[:] = 0
+
+
+# 进程级共享实例
+profiler = FrameProfiler()
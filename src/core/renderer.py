@@ -0,0 +1,486 @@
+import ctypes
+import math
+import weakref
+from array import array
+
+import numpy as np
+import pygame
+from OpenGL.GL import *
+
+from .config import Config
+
+# 每个顶点: x, y, u, v, r, g, b, a
+_VERTEX_FLOATS = 8
+_VERTEX_STRIDE = _VERTEX_FLOATS * 4
+
+# 原地修改过像素的表面，GL 后端下次绘制时会重新上传
+_dirty_surfaces = weakref.WeakSet()
+
+
+def mark_surface_dirty(surface):
+    """通知 GL 后端该表面的像素已被原地修改（如 fill），需要重新上传纹理"""
+    _dirty_surfaces.add(surface)
+
+
+def draw_rect(target, color, rect, width=0):
+    """在软件表面或 SpriteBatch 上绘制矩形，用来代替直接调用 pygame.draw.rect"""
+    if isinstance(target, pygame.Surface):
+        return pygame.draw.rect(target, color, rect, width)
+    return target.draw_rect(color, rect, width)
+
+
+def _rgba_bytes(surface):
+    """表面的 RGBA 字节；没有逐像素 alpha 的表面补成不透明（tostring 会给出错误的 alpha）"""
+    if not surface.get_flags() & pygame.SRCALPHA:
+        opaque = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        opaque.fill((0, 0, 0, 255))
+        opaque.blit(surface, (0, 0), special_flags=pygame.BLEND_RGB_MAX)
+        surface = opaque
+    return pygame.image.tostring(surface, "RGBA")
+
+
+class TextureAtlas:
+    """
+    在一张 GL 纹理上按货架（shelf）方式打包小表面。
+
+    新图块先写入 CPU 端的镜像表面，每帧绘制前把变化区域合并成一次
+    glTexSubImage2D 上传，避免驱动仍在使用纹理时逐块上传造成多次同步。
+
+    release() 把图块的位置还给所在货架的空闲列表，之后的 allocate 先在
+    空闲列表里找放得下的位置，短命的表面不会把图集逐渐填满。
+    """
+
+    PADDING = 1  # 相邻图块之间留空，避免采样串色
+
+    def __init__(self, size):
+        self.size = size
+        self.pixels = pygame.Surface((size, size), pygame.SRCALPHA)
+        self._dirty = None  # 尚未上传的区域
+        self.generation = 0  # 每次 reset 加一，过期的 release 据此忽略
+        self.texture = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, self.texture)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+        glTexImage2D(
+            GL_TEXTURE_2D, 0, GL_RGBA, size, size, 0, GL_RGBA, GL_UNSIGNED_BYTE, None
+        )
+        self.white_uv = (0.0, 0.0)
+        self.reset()
+
+    def reset(self):
+        """丢弃所有已分配区域（旧像素保留，等待覆盖）"""
+        self.generation += 1
+        self._shelf_x = 0
+        self._shelf_y = 0
+        self._shelf_height = 0
+        self._shelves = {}  # 货架的 y -> 高度
+        self._free = {}  # 货架的 y -> 空闲区段 [[x, 宽度], ...]（按 x 排序）
+        # 左上角保留一块纯白区域，纯色矩形用它配合顶点颜色绘制
+        white = pygame.Surface((4, 4), pygame.SRCALPHA)
+        white.fill((255, 255, 255, 255))
+        x, y = self.allocate(4, 4)
+        self.stage(white, x, y)
+        self.white_uv = ((x + 2) / self.size, (y + 2) / self.size)
+
+    def allocate(self, width, height):
+        """为 width x height 的图块分配位置，图集已满时返回 None"""
+        padded_w = width + self.PADDING
+        padded_h = height + self.PADDING
+        pos = self._allocate_free(padded_w, padded_h)
+        if pos is not None:
+            return pos
+        if self._shelf_x + padded_w > self.size:
+            # 当前货架放不下，开一层新货架
+            self._shelf_y += self._shelf_height
+            self._shelf_x = 0
+            self._shelf_height = 0
+        if self._shelf_y + padded_h > self.size or padded_w > self.size:
+            return None
+        pos = (self._shelf_x, self._shelf_y)
+        self._shelf_x += padded_w
+        self._shelf_height = max(self._shelf_height, padded_h)
+        self._shelves[self._shelf_y] = self._shelf_height
+        return pos
+
+    def _allocate_free(self, padded_w, padded_h):
+        """在已释放的区段中找第一个放得下的位置（货架高度足够且不超过两倍）"""
+        for y, slots in self._free.items():
+            shelf_height = self._shelves[y]
+            if not padded_h <= shelf_height <= padded_h * 2:
+                continue
+            for slot in slots:
+                if slot[1] >= padded_w:
+                    x = slot[0]
+                    slot[0] += padded_w
+                    slot[1] -= padded_w
+                    if not slot[1]:
+                        slots.remove(slot)
+                    return x, y
+        return None
+
+    def release(self, x, y, width, height):
+        """归还 allocate 分配的区域；相邻的空闲区段合并"""
+        slots = self._free.setdefault(y, [])
+        slots.append([x, width + self.PADDING])
+        slots.sort()
+        merged = [slots[0]]
+        for slot in slots[1:]:
+            last = merged[-1]
+            if last[0] + last[1] == slot[0]:
+                last[1] += slot[1]
+            else:
+                merged.append(slot)
+        # 当前货架末尾的空闲区段直接退回给货架
+        if y == self._shelf_y and merged[-1][0] + merged[-1][1] == self._shelf_x:
+            self._shelf_x = merged.pop()[0]
+        if merged:
+            self._free[y] = merged
+        else:
+            del self._free[y]
+
+    def stage(self, surface, x, y):
+        """把表面像素原样复制进镜像（不做混合，也不受表面整体 alpha 影响）"""
+        rect = pygame.Rect((x, y), surface.get_size())
+        if surface.get_flags() & pygame.SRCALPHA:
+            self.pixels.fill((0, 0, 0, 0), rect)
+            self.pixels.blit(surface, rect, special_flags=pygame.BLEND_RGBA_MAX)
+        else:
+            self.pixels.fill((0, 0, 0, 255), rect)
+            self.pixels.blit(surface, rect, special_flags=pygame.BLEND_RGB_MAX)
+        self._dirty = rect if self._dirty is None else self._dirty.union(rect)
+
+    def commit(self):
+        """上传自上次提交以来变化的区域"""
+        if self._dirty is None:
+            return
+        rect = self._dirty
+        self._dirty = None
+        glBindTexture(GL_TEXTURE_2D, self.texture)
+        glTexSubImage2D(
+            GL_TEXTURE_2D,
+            0,
+            rect.x,
+            rect.y,
+            rect.width,
+            rect.height,
+            GL_RGBA,
+            GL_UNSIGNED_BYTE,
+            pygame.image.tostring(self.pixels.subsurface(rect), "RGBA"),
+        )
+
+
+class SpriteBatch:
+    """
+    GL 批量精灵渲染器。
+
+    表面第一次被绘制时打包进纹理图集（过大的表面使用独立纹理），之后每帧只提交
+    顶点数据：所有四边形写入同一个顶点缓冲，连续使用同一纹理的四边形合并成一次
+    glDrawArrays，因此绘制顺序与软件路径完全一致。
+
+    实现了场景渲染用到的 Surface 子集（blit / blits / fill / get_size），
+    可以直接传给 Scene.render 和 Group.draw。
+    """
+
+    def __init__(
+        self, size, atlas_size=Config.ATLAS_SIZE, max_atlases=Config.MAX_ATLASES
+    ):
+        self.size = size
+        self.atlas_size = atlas_size
+        self.max_atlases = max_atlases
+        self._atlases = []
+        # id(surface) -> (texture, u0, v0, u1, v1, atlas, x, y, width, height)
+        self._entries = {}
+        self._finalizers = {}
+        self._pending_delete = []  # 已被回收的表面对应的独立纹理
+        # 已被回收的表面占用的图集区域：本帧可能仍有引用它的四边形，下一帧再归还
+        self._pending_release = []
+        self._vertices = array("f")
+        self._batches = []  # [texture, first_vertex, vertex_count]
+        self._offset = (0, 0)
+        self.vbo = glGenBuffers(1)
+        self.draw_calls = 0  # 上一帧的绘制调用次数
+        self._atlases.append(TextureAtlas(atlas_size))
+
+    # --- Surface 兼容接口 ---
+
+    def get_size(self):
+        return self.size
+
+    def get_width(self):
+        return self.size[0]
+
+    def get_height(self):
+        return self.size[1]
+
+    def get_rect(self, **kwargs):
+        rect = pygame.Rect((0, 0), self.size)
+        for name, value in kwargs.items():
+            setattr(rect, name, value)
+        return rect
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        width, height = source.get_size()
+        if width == 0 or height == 0:
+            return pygame.Rect(dest[0], dest[1], 0, 0)
+        texture, u0, v0, u1, v1 = self._texture_for(source)[:5]
+        if area is not None:
+            # 只绘制源表面的一部分：按比例收缩纹理坐标
+            area = pygame.Rect(area).clip(pygame.Rect(0, 0, width, height))
+            du = (u1 - u0) / width
+            dv = (v1 - v0) / height
+            u0, u1 = u0 + area.left * du, u0 + area.right * du
+            v0, v1 = v0 + area.top * dv, v0 + area.bottom * dv
+            width, height = area.size
+        alpha = source.get_alpha()
+        a = 1.0 if alpha is None else alpha / 255.0
+        x, y = dest[0], dest[1]
+        self._quad(texture, x, y, width, height, u0, v0, u1, v1, 1.0, 1.0, 1.0, a)
+        return pygame.Rect(x, y, width, height)
+
+    def blits(self, blit_sequence, doreturn=1):
+        blit = self.blit
+        rects = [blit(*item) for item in blit_sequence]
+        return rects if doreturn else None
+
+    def blit_rotated(self, source, center, angle):
+        """
+        以 center 为中心、逆时针旋转 angle 度（同 pygame.transform.rotate）
+        绘制 source：直接画旋转的四边形，不在 CPU 上生成旋转后的表面。
+        """
+        texture, u0, v0, u1, v1 = self._texture_for(source)[:5]
+        alpha = source.get_alpha()
+        a = 1.0 if alpha is None else alpha / 255.0
+        half_w, half_h = source.get_width() / 2, source.get_height() / 2
+        rad = math.radians(angle)
+        c, s = math.cos(rad), math.sin(rad)
+        cx, cy = center
+        corners = [
+            (cx + x * c + y * s, cy - x * s + y * c)
+            for x, y in (
+                (-half_w, -half_h),
+                (half_w, -half_h),
+                (half_w, half_h),
+                (-half_w, half_h),
+            )
+        ]
+        self._quad_corners(texture, corners, u0, v0, u1, v1, 1.0, 1.0, 1.0, a)
+
+    def fill(self, color, rect=None, special_flags=0):
+        rect = pygame.Rect((0, 0), self.size) if rect is None else pygame.Rect(rect)
+        self._solid(color, rect.x, rect.y, rect.width, rect.height)
+        return rect
+
+    def draw_rect(self, color, rect, width=0):
+        rect = pygame.Rect(rect)
+        if width <= 0:
+            self._solid(color, rect.x, rect.y, rect.width, rect.height)
+        else:
+            # 与 pygame.draw.rect 相同：边框画在矩形内侧
+            self._solid(color, rect.x, rect.y, rect.width, width)
+            self._solid(color, rect.x, rect.bottom - width, rect.width, width)
+            self._solid(color, rect.x, rect.y, width, rect.height)
+            self._solid(color, rect.right - width, rect.y, width, rect.height)
+        return rect
+
+    # --- 帧控制 ---
+
+    def begin(self, offset=(0, 0)):
+        """开始新的一帧；offset 为屏幕震动偏移"""
+        if self._pending_delete:
+            glDeleteTextures(self._pending_delete)
+            self._pending_delete = []
+        for atlas, generation, region in self._pending_release:
+            if atlas.generation == generation:  # 图集重置后区域已失效
+                atlas.release(*region)
+        self._pending_release = []
+        self._offset = offset
+        self.draw_calls = 0
+
+    def end(self):
+        self.flush()
+
+    def flush(self):
+        """把已累计的四边形上传到顶点缓冲并按纹理分批绘制"""
+        if not self._batches:
+            return
+        for atlas in self._atlases:
+            atlas.commit()
+
+        data = np.frombuffer(self._vertices, dtype=np.float32)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STREAM_DRAW)
+        del data  # 释放对 array 的缓冲区引用
+
+        glLoadIdentity()
+        glTranslatef(self._offset[0], self._offset[1], 0)
+        glEnable(GL_TEXTURE_2D)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(2, GL_FLOAT, _VERTEX_STRIDE, ctypes.c_void_p(0))
+        glTexCoordPointer(2, GL_FLOAT, _VERTEX_STRIDE, ctypes.c_void_p(8))
+        glColorPointer(4, GL_FLOAT, _VERTEX_STRIDE, ctypes.c_void_p(16))
+
+        for texture, first, count in self._batches:
+            glBindTexture(GL_TEXTURE_2D, texture)
+            glDrawArrays(GL_QUADS, first, count)
+
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glDisable(GL_TEXTURE_2D)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glColor4f(1.0, 1.0, 1.0, 1.0)
+
+        self.draw_calls += len(self._batches)
+        self._batches = []
+        self._vertices = array("f")
+
+    # --- 内部实现 ---
+
+    def _quad(self, texture, x, y, w, h, u0, v0, u1, v1, r, g, b, a):
+        batches = self._batches
+        if not batches or batches[-1][0] != texture:
+            batches.append([texture, len(self._vertices) // _VERTEX_FLOATS, 0])
+        batches[-1][2] += 4
+        x1 = x + w
+        y1 = y + h
+        self._vertices.extend(
+            (
+                x, y, u0, v0, r, g, b, a,
+                x1, y, u1, v0, r, g, b, a,
+                x1, y1, u1, v1, r, g, b, a,
+                x, y1, u0, v1, r, g, b, a,
+            )
+        )  # fmt: skip
+
+    def _quad_corners(self, texture, corners, u0, v0, u1, v1, r, g, b, a):
+        """任意四边形：corners 依次为纹理左上、右上、右下、左下对应的顶点"""
+        batches = self._batches
+        if not batches or batches[-1][0] != texture:
+            batches.append([texture, len(self._vertices) // _VERTEX_FLOATS, 0])
+        batches[-1][2] += 4
+        (x0, y0), (x1, y1), (x2, y2), (x3, y3) = corners
+        self._vertices.extend(
+            (
+                x0, y0, u0, v0, r, g, b, a,
+                x1, y1, u1, v0, r, g, b, a,
+                x2, y2, u1, v1, r, g, b, a,
+                x3, y3, u0, v1, r, g, b, a,
+            )
+        )  # fmt: skip
+
+    def _solid(self, color, x, y, w, h):
+        color = pygame.Color(color)
+        atlas = self._atlases[-1]
+        u, v = atlas.white_uv
+        self._quad(
+            atlas.texture,
+            x,
+            y,
+            w,
+            h,
+            u,
+            v,
+            u,
+            v,
+            color.r / 255.0,
+            color.g / 255.0,
+            color.b / 255.0,
+            color.a / 255.0,
+        )
+
+    def _texture_for(self, surface):
+        key = id(surface)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._add(surface)
+        elif _dirty_surfaces and surface in _dirty_surfaces:
+            _dirty_surfaces.discard(surface)
+            entry = self._reupload(surface, entry)
+        return entry
+
+    def _add(self, surface):
+        key = id(surface)
+        width, height = surface.get_size()
+        limit = self.atlas_size // 2
+        if width > limit or height > limit:
+            entry = self._add_standalone(surface)
+        else:
+            pos = self._atlases[-1].allocate(width, height)
+            if pos is None:
+                self._grow_or_reset()
+                pos = self._atlases[-1].allocate(width, height)
+            atlas = self._atlases[-1]
+            atlas.stage(surface, *pos)
+            size = atlas.size
+            entry = (
+                atlas.texture,
+                pos[0] / size,
+                pos[1] / size,
+                (pos[0] + width) / size,
+                (pos[1] + height) / size,
+                atlas,
+                pos[0],
+                pos[1],
+                width,
+                height,
+            )
+        self._entries[key] = entry
+        if key not in self._finalizers:
+            self._finalizers[key] = weakref.finalize(surface, self._forget, key)
+        return entry
+
+    def _add_standalone(self, surface):
+        texture = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, texture)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        self._upload_standalone(surface, texture)
+        return (texture, 0.0, 0.0, 1.0, 1.0, None, 0, 0, 0, 0)
+
+    def _upload_standalone(self, surface, texture):
+        width, height = surface.get_size()
+        glBindTexture(GL_TEXTURE_2D, texture)
+        glTexImage2D(
+            GL_TEXTURE_2D,
+            0,
+            GL_RGBA,
+            width,
+            height,
+            0,
+            GL_RGBA,
+            GL_UNSIGNED_BYTE,
+            _rgba_bytes(surface),
+        )
+
+    def _reupload(self, surface, entry):
+        atlas = entry[5]
+        if atlas is None:
+            self._upload_standalone(surface, entry[0])
+        else:
+            atlas.stage(surface, entry[6], entry[7])
+        return entry
+
+    def _grow_or_reset(self):
+        """当前图集已满：新建图集，数量到达上限时清空全部图集重新打包"""
+        if len(self._atlases) < self.max_atlases:
+            self._atlases.append(TextureAtlas(self.atlas_size))
+            return
+        # 先画掉已提交的四边形，它们引用的图集区域马上会被覆盖
+        self.flush()
+        for key in [k for k, e in self._entries.items() if e[5] is not None]:
+            del self._entries[key]
+        for atlas in self._atlases:
+            atlas.reset()
+
+    def _forget(self, key):
+        entry = self._entries.pop(key, None)
+        self._finalizers.pop(key, None)
+        if entry is None:
+            return
+        atlas = entry[5]
+        if atlas is None:
+            self._pending_delete.append(entry[0])
+        else:
+            self._pending_release.append((atlas, atlas.generation, entry[6:10]))
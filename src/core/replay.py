@@ -0,0 +1,261 @@
+import os
+import struct
+import time
+import zlib
+
+import pygame
+
+from .config import Config
+
+# 每一步的输入压成一个字节：只记录场景真正读取的方向键
+INPUT_UP = 1
+INPUT_DOWN = 2
+INPUT_LEFT = 4
+INPUT_RIGHT = 8
+
+KEY_BITS = {
+    pygame.K_w: INPUT_UP,
+    pygame.K_UP: INPUT_UP,
+    pygame.K_s: INPUT_DOWN,
+    pygame.K_DOWN: INPUT_DOWN,
+    pygame.K_a: INPUT_LEFT,
+    pygame.K_LEFT: INPUT_LEFT,
+    pygame.K_d: INPUT_RIGHT,
+    pygame.K_RIGHT: INPUT_RIGHT,
+}
+
+
+class InputSnapshot:
+    """
+    一步的输入状态，接口与 pygame.key.get_pressed() 的结果相同（keys[K_w]），
+    Player.handle_movement_input 不需要区分实时输入和回放输入。
+    """
+
+    __slots__ = ("mask",)
+
+    def __init__(self, mask=0):
+        self.mask = mask
+
+    @classmethod
+    def from_keys(cls, keys):
+        mask = 0
+        for key, bit in KEY_BITS.items():
+            if keys[key]:
+                mask |= bit
+        return cls(mask)
+
+    def __getitem__(self, key):
+        return bool(self.mask & KEY_BITS.get(key, 0))
+
+
+class LiveInput:
+    """从键盘读取当前按键状态（默认输入源）"""
+
+    def poll(self, scene):
+        return InputSnapshot.from_keys(pygame.key.get_pressed())
+
+
+def nondeterministic_settings():
+    """
+    使模拟依赖机器速度、无法逐步重现的设置（空列表表示可以录制和回放）。
+    时间只来自 SimulationClock，随机数只来自种子流；剩下的例外在这里列出。
+    """
+    reasons = []
+    if Config.SPAWN_BUDGET_MS:
+        reasons.append("SPAWN_BUDGET_MS > 0 ties enemy spawning to wall-clock time")
+    return reasons
+
+
+def state_checksum(scene):
+    """
+    场景模拟状态的 CRC32：玩家、分数、波次、敌机、玩家子弹和子弹池。
+    录制时定期保存，回放时逐个比对，用于发现回放与原始过程不一致的那一步。
+    """
+    player = scene.player
+    score = scene.game.score_manager
+    crc = zlib.crc32(
+        struct.pack(
+            "<iidqqii",
+            player.rect.x,
+            player.rect.y,
+            player.health,
+            score.current_score,
+            score.combo,
+            scene.spawner.wave,
+            len(scene.enemies),
+        )
+    )
+    for enemy in scene.enemies:
+        crc = zlib.crc32(
+            struct.pack("<iid", enemy.rect.x, enemy.rect.y, enemy.hp), crc
+        )
+    for bullet in scene.bullets:
+        crc = zlib.crc32(struct.pack("<ii", bullet.rect.x, bullet.rect.y), crc)
+    pool = scene.enemy_bullets
+    return zlib.crc32(pool.pos[: pool.count].tobytes(), crc)
+
+
+class Replay:
+    """
+    一局游戏的回放：主种子、模拟频率、影响模拟的开关（hold_hp：玩家
+    不掉血）、每步一个字节的输入，以及每隔 checkpoint_interval 步的状态
+    校验值。
+
+    文件格式（小端）：头部 HEADER，随后是 zlib 压缩的输入字节和
+    uint32 校验值数组。输入大多连续相同，压缩后一小时的录像只有几 KB。
+    """
+
+    MAGIC = b"BRPL"
+    VERSION = 1
+    # 魔数、版本、种子、模拟频率、校验间隔、开关、步数、压缩输入长度、
+    # 校验值个数、最终校验值
+    HEADER = struct.Struct("<4sHQHHHIIII")
+    FLAG_HOLD_HP = 1
+
+    def __init__(
+        self,
+        seed,
+        tick_rate,
+        checkpoint_interval=Config.REPLAY_CHECKPOINT_TICKS,
+        inputs=b"",
+        checksums=(),
+        final_checksum=0,
+        hold_hp=False,
+    ):
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.checkpoint_interval = checkpoint_interval
+        self.hold_hp = hold_hp
+        self.inputs = bytearray(inputs)
+        self.checksums = list(checksums)
+        self.final_checksum = final_checksum
+
+    @property
+    def ticks(self):
+        return len(self.inputs)
+
+    def save(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        inputs = zlib.compress(bytes(self.inputs), 9)
+        with open(path, "wb") as f:
+            f.write(
+                self.HEADER.pack(
+                    self.MAGIC,
+                    self.VERSION,
+                    self.seed,
+                    self.tick_rate,
+                    self.checkpoint_interval,
+                    self.FLAG_HOLD_HP if self.hold_hp else 0,
+                    len(self.inputs),
+                    len(inputs),
+                    len(self.checksums),
+                    self.final_checksum,
+                )
+            )
+            f.write(inputs)
+            f.write(struct.pack(f"<{len(self.checksums)}I", *self.checksums))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        (
+            magic,
+            version,
+            seed,
+            tick_rate,
+            interval,
+            flags,
+            ticks,
+            compressed,
+            count,
+            final_checksum,
+        ) = cls.HEADER.unpack_from(data)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError(f"{path} is not a version {cls.VERSION} replay file")
+        offset = cls.HEADER.size
+        inputs = zlib.decompress(data[offset : offset + compressed])
+        if len(inputs) != ticks:
+            raise ValueError(f"{path} is truncated ({len(inputs)}/{ticks} ticks)")
+        checksums = struct.unpack_from(f"<{count}I", data, offset + compressed)
+        return cls(
+            seed,
+            tick_rate,
+            interval,
+            inputs,
+            checksums,
+            final_checksum,
+            hold_hp=bool(flags & cls.FLAG_HOLD_HP),
+        )
+
+
+def default_replay_path():
+    return os.path.join(Config.REPLAY_DIR, time.strftime("replay-%Y%m%d-%H%M%S.rpl"))
+
+
+class ReplayRecorder:
+    """
+    包装另一个输入源（默认实时键盘），把每一步读到的输入和定期的状态
+    校验值记入 replay。用法与其他输入源相同：scene.input = ReplayRecorder(...)
+    """
+
+    def __init__(self, seed, tick_rate, source=None):
+        self.source = source or LiveInput()
+        self.replay = Replay(seed, tick_rate, hold_hp=Config.HOLD_HP)
+
+    def poll(self, scene):
+        replay = self.replay
+        if replay.ticks % replay.checkpoint_interval == 0:
+            replay.checksums.append(state_checksum(scene))
+        snapshot = self.source.poll(scene)
+        replay.inputs.append(snapshot.mask)
+        return snapshot
+
+    def save(self, scene, path=None):
+        """写出回放文件（scene 用于记录最终状态的校验值），返回文件路径"""
+        self.replay.final_checksum = state_checksum(scene)
+        path = path or default_replay_path()
+        self.replay.save(path)
+        print(f"Replay saved to {path} ({self.replay.ticks} ticks)")
+        return path
+
+
+class ReplayInput:
+    """
+    按录像逐步返回输入，并在检查点比对状态校验值。
+    desync_tick 记录第一次不一致的步（None 表示目前完全一致）；
+    录像的输入用完后 finished 为 True，之后返回空输入。
+    """
+
+    def __init__(self, replay):
+        self.replay = replay
+        self.ticks = 0
+        self.verified = 0  # 已通过的检查点数
+        self.desync_tick = None
+        self.finished = False
+
+    def _check(self, expected, scene):
+        if state_checksum(scene) == expected:
+            self.verified += 1
+        elif self.desync_tick is None:
+            self.desync_tick = self.ticks
+
+    def poll(self, scene):
+        replay = self.replay
+        tick = self.ticks
+        if tick % replay.checkpoint_interval == 0:
+            index = tick // replay.checkpoint_interval
+            if index < len(replay.checksums):
+                self._check(replay.checksums[index], scene)
+        if tick >= replay.ticks:
+            self.finished = True
+            return InputSnapshot()
+        self.ticks += 1
+        return InputSnapshot(replay.inputs[tick])
+
+    def verify_final(self, scene):
+        """回放结束后比对最终状态，返回整个回放是否与录制时一致"""
+        self._check(self.replay.final_checksum, scene)
+        return self.desync_tick is None
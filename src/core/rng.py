@@ -0,0 +1,68 @@
+import os
+import random
+import zlib
+
+import numpy as np
+
+from .config import Config
+
+
+class RandomStreams:
+    """
+    按子系统划分的随机数流，全部由一个主种子派生。
+
+    每个子系统（spawner、boss、combat、drops、powerups、effects、particles、
+    patterns）各用一条独立的流，某个子系统多取或少取随机数不会影响其他
+    子系统的序列。
+    seed() 原地重置所有已创建的流，因此模块级保存的引用始终有效：
+
+        _random = rng.stream("spawner")  # 标准库 random.Random 接口
+        _np_random = rng.numpy("particles")  # numpy.random.Generator
+
+    同一个主种子、同一串输入得到完全相同的游戏过程（回放依赖这一点）。
+    """
+
+    def __init__(self, seed=None):
+        self._streams = {}
+        self._generators = {}
+        self.seed(seed)
+
+    @staticmethod
+    def new_seed():
+        return int.from_bytes(os.urandom(4), "little")
+
+    def seed(self, seed=None):
+        """用主种子重置所有流，seed 为 None 时随机选择；返回实际使用的种子"""
+        self.master_seed = self.new_seed() if seed is None else int(seed)
+        for name, stream in self._streams.items():
+            stream.seed(self._stream_seed(name))
+        for name, generator in self._generators.items():
+            generator.bit_generator.state = self._bit_generator(name).state
+        return self.master_seed
+
+    def _stream_seed(self, name):
+        # 字符串种子按 SHA-512 转换，不受 PYTHONHASHSEED 影响
+        return f"{self.master_seed}:{name}"
+
+    def _bit_generator(self, name):
+        return np.random.PCG64(
+            np.random.SeedSequence([self.master_seed, zlib.crc32(name.encode())])
+        )
+
+    def stream(self, name):
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = random.Random(self._stream_seed(name))
+            self._streams[name] = stream
+        return stream
+
+    def numpy(self, name):
+        generator = self._generators.get(name)
+        if generator is None:
+            generator = np.random.Generator(self._bit_generator(name))
+            self._generators[name] = generator
+        return generator
+
+
+# 进程级共享实例；GameScene 创建时按 Config.RNG_SEED（或随机种子）重置
+rng = RandomStreams(Config.RNG_SEED)
@@ -0,0 +1,179 @@
+import ctypes
+import sys
+
+import numpy as np
+import pygame
+from OpenGL.GL import *
+
+from .config import Config
+
+
+def pixel_format(surface):
+    """
+    表面原生像素布局对应的 GL 格式；无法直接上传时返回 None。
+
+    纹理按表面的行顺序（自上而下）存放，垂直翻转由绘制时的纹理坐标完成。
+    """
+    if surface.get_bytesize() != 4 or sys.byteorder != "little":
+        return None
+    masks = surface.get_masks()[:3]
+    if masks == (0xFF0000, 0xFF00, 0xFF):
+        return GL_BGRA  # 小端 ARGB8888：内存中为 B, G, R, A
+    if masks == (0xFF, 0xFF00, 0xFF0000):
+        return GL_RGBA
+    return None
+
+
+class _PixelSource:
+    """
+    表面像素缓冲区的零拷贝视图（Surface.get_view），用完必须 release()，
+    否则表面保持锁定、无法 blit。
+    """
+
+    def __init__(self, surface):
+        self.format = pixel_format(surface)
+        self.pitch = surface.get_pitch()
+        if self.format is not None:
+            self._view = surface.get_view("1")
+            self.pixels = np.frombuffer(self._view, dtype=np.uint8)
+            self.row_length = self.pitch // 4
+        else:
+            # 非 32 位表面：退回到拷贝一份 RGBA
+            self._view = None
+            self.pixels = np.frombuffer(
+                pygame.image.tostring(surface, "RGBA"), dtype=np.uint8
+            )
+            self.format = GL_RGBA
+            self.row_length = surface.get_width()
+            self.pitch = self.row_length * 4
+
+    def release(self):
+        self.pixels = None
+        self._view = None
+
+
+def _set_unpack(row_length, skip_pixels, skip_rows):
+    glPixelStorei(GL_UNPACK_ROW_LENGTH, row_length)
+    glPixelStorei(GL_UNPACK_SKIP_PIXELS, skip_pixels)
+    glPixelStorei(GL_UNPACK_SKIP_ROWS, skip_rows)
+
+
+class SyncTextureUploader:
+    """
+    同步上传：glTexSubImage2D 直接读取表面的像素缓冲区，
+    驱动在调用返回前完成拷贝，主线程会一直等到拷贝结束。
+    """
+
+    def __init__(self, texture, size):
+        self.texture = texture
+        self.size = size
+
+    def upload(self, surface, rects=None):
+        """上传整张表面或其中的若干矩形，返回上传的字节数"""
+        if rects is None:
+            rects = [surface.get_rect()]
+        source = _PixelSource(surface)
+        glBindTexture(GL_TEXTURE_2D, self.texture)
+        uploaded = 0
+        try:
+            for rect in rects:
+                # 子矩形通过 UNPACK 参数直接在整张缓冲区里定位，不做切片拷贝
+                _set_unpack(source.row_length, rect.x, rect.y)
+                glTexSubImage2D(
+                    GL_TEXTURE_2D,
+                    0,
+                    rect.x,
+                    rect.y,
+                    rect.width,
+                    rect.height,
+                    source.format,
+                    GL_UNSIGNED_BYTE,
+                    source.pixels,
+                )
+                uploaded += rect.width * rect.height * 4
+        finally:
+            _set_unpack(0, 0, 0)
+            source.release()
+        return uploaded
+
+
+class PBOTextureUploader:
+    """
+    通过像素缓冲对象（PBO）环异步上传。
+
+    每帧把像素写入环中的下一个 PBO，再让 glTexSubImage2D 从该 PBO 读取：
+    调用立即返回，由驱动在后台完成 DMA。下一帧写入另一个 PBO，
+    因此不必等待上一帧的传输结束。
+    """
+
+    def __init__(self, texture, size, count=Config.PBO_COUNT):
+        self.texture = texture
+        self.size = size
+        self.capacity = size[0] * size[1] * 4
+        buffers = glGenBuffers(count)
+        self.buffers = [int(buffers)] if count == 1 else [int(b) for b in buffers]
+        self.index = 0
+        for buffer in self.buffers:
+            glBindBuffer(GL_PIXEL_UNPACK_BUFFER, buffer)
+            glBufferData(GL_PIXEL_UNPACK_BUFFER, self.capacity, None, GL_STREAM_DRAW)
+        glBindBuffer(GL_PIXEL_UNPACK_BUFFER, 0)
+
+    def upload(self, surface, rects=None):
+        """上传整张表面或其中的若干矩形，返回上传的字节数"""
+        if rects is None:
+            rects = [surface.get_rect()]
+        source = _PixelSource(surface)
+        buffer = self.buffers[self.index]
+        self.index = (self.index + 1) % len(self.buffers)
+
+        # 1. 把各矩形紧凑地拷入映射后的 PBO（每个矩形一次跨步拷贝，直接读表面缓冲区）
+        glBindBuffer(GL_PIXEL_UNPACK_BUFFER, buffer)
+        pointer = glMapBufferRange(
+            GL_PIXEL_UNPACK_BUFFER,
+            0,
+            self.capacity,
+            GL_MAP_WRITE_BIT | GL_MAP_INVALIDATE_BUFFER_BIT,
+        )
+        mapped = np.ctypeslib.as_array(
+            (ctypes.c_ubyte * self.capacity).from_address(pointer)
+        )
+        rows = source.pixels.reshape(-1, source.pitch)
+        offsets = []
+        offset = 0
+        try:
+            for rect in rects:
+                length = rect.width * rect.height * 4
+                block = rows[rect.top : rect.bottom, rect.left * 4 : rect.right * 4]
+                mapped[offset : offset + length].reshape(block.shape)[:] = block
+                offsets.append(offset)
+                offset += length
+        finally:
+            del mapped
+            glUnmapBuffer(GL_PIXEL_UNPACK_BUFFER)
+            source.release()
+
+        # 2. 从 PBO 更新纹理（异步，按偏移量读取）
+        glBindTexture(GL_TEXTURE_2D, self.texture)
+        uploaded = 0
+        for rect, rect_offset in zip(rects, offsets):
+            glTexSubImage2D(
+                GL_TEXTURE_2D,
+                0,
+                rect.x,
+                rect.y,
+                rect.width,
+                rect.height,
+                source.format,
+                GL_UNSIGNED_BYTE,
+                ctypes.c_void_p(rect_offset),
+            )
+            uploaded += rect.width * rect.height * 4
+        glBindBuffer(GL_PIXEL_UNPACK_BUFFER, 0)
+        return uploaded
+
+
+def create_texture_uploader(texture, size):
+    """按 Config.TEXTURE_UPLOAD 选择上传方式"""
+    if Config.TEXTURE_UPLOAD == "pbo":
+        return PBOTextureUploader(texture, size)
+    return SyncTextureUploader(texture, size)
@@ -0,0 +1,135 @@
+import math
+
+
+class Timer:
+    """schedule() 返回的句柄，cancel() 后回调不会再执行"""
+
+    __slots__ = ("expires", "callback", "args", "cancelled")
+
+    def __init__(self, expires, callback, args):
+        self.expires = expires  # 到期的刻度
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class TimerWheel:
+    """
+    分层时间轮：场景级的计时服务，实体登记“多少秒后调用某个函数”，
+    等待期间不再每帧累加自己的计时器。
+
+    时间按模拟时钟计，刻度为一个标称模拟步（resolution 秒，由场景按实际的
+    模拟频率传入）。
+    第 0 层每格一个刻度，共 256 格；之后每层 64 格，每格覆盖下一层
+    一整圈。计时器按剩余刻度数放进对应层，每当低层转完一圈，把高层
+    当前格中的计时器重新分配到低层（级联），因此登记、取消和每步推进
+    都是 O(1)，与等待中的计时器数量无关。
+    取消只做标记，级联或到期时丢弃。
+    """
+
+    LEVEL_BITS = (8, 6, 6, 6)
+
+    def __init__(self, clock, resolution):
+        self.clock = clock
+        self.resolution = resolution
+        self.now = self._tick_at(clock.time)  # 已处理到的刻度
+        self._shifts = []
+        self._levels = []
+        shift = 0
+        for bits in self.LEVEL_BITS:
+            self._shifts.append(shift)
+            self._levels.append([[] for _ in range(1 << bits)])
+            shift += bits
+        self._span = 1 << shift  # 超出所有层的计时器先放进 overflow
+        self._overflow = []
+
+    def _tick_at(self, seconds):
+        # 模拟时间是逐步累加的浮点数，留一点余量避免刚好到期时被舍掉一刻
+        return int(seconds / self.resolution + 1e-6)
+
+    def schedule(self, delay, callback, *args):
+        """delay 秒（模拟时间）后调用 callback(*args)，返回 Timer 句柄"""
+        expires = math.ceil((self.clock.time + delay) / self.resolution - 1e-6)
+        timer = Timer(max(expires, self.now + 1), callback, args)
+        self._insert(timer)
+        return timer
+
+    def _insert(self, timer):
+        delta = timer.expires - self.now
+        if delta >= self._span:
+            self._overflow.append(timer)
+            return
+        for level, shift in enumerate(self._shifts):
+            bits = self.LEVEL_BITS[level]
+            if delta < 1 << (shift + bits):
+                slots = self._levels[level]
+                slots[(timer.expires >> shift) & (len(slots) - 1)].append(timer)
+                return
+
+    def _cascade(self, level):
+        """把第 level 层当前格中的计时器重新分配到更低的层"""
+        slots = self._levels[level]
+        index = (self.now >> self._shifts[level]) & (len(slots) - 1)
+        timers, slots[index] = slots[index], []
+        for timer in timers:
+            if not timer.cancelled:
+                self._insert(timer)
+        return index
+
+    def advance(self):
+        """推进到模拟时钟的当前时间，按到期顺序执行到期的回调"""
+        target = self._tick_at(self.clock.time)
+        wheel = self._levels[0]
+        mask = len(wheel) - 1
+        while self.now < target:
+            self.now += 1
+            if self.now & mask == 0:
+                # 第 0 层转完一圈：级联第 1 层的当前格；该层也回到第 0 格时继续向上
+                level = 1
+                while level < len(self._levels) and self._cascade(level) == 0:
+                    level += 1
+                if level == len(self._levels):
+                    overflow, self._overflow = self._overflow, []
+                    for timer in overflow:
+                        if not timer.cancelled:
+                            self._insert(timer)
+            due, wheel[self.now & mask] = wheel[self.now & mask], []
+            for timer in due:
+                if not timer.cancelled:
+                    timer.cancelled = True  # 已执行，句柄不再有效
+                    timer.callback(*timer.args)
+
+
+class TimerOwner:
+    """
+    实体的计时器混入类：按名字登记计时器（同名的旧计时器被取消），
+    kill() 时取消全部，死亡的实体不会再收到回调。使用前需设置 self.timers。
+    """
+
+    _timer_handles = None
+
+    def after(self, name, delay, callback, *args):
+        """delay 秒后调用 callback(*args)，替换同名的计时器"""
+        if self._timer_handles is None:
+            self._timer_handles = {}
+        self.cancel_timer(name)
+        self._timer_handles[name] = self.timers.schedule(delay, callback, *args)
+
+    def cancel_timer(self, name):
+        if self._timer_handles:
+            timer = self._timer_handles.pop(name, None)
+            if timer is not None:
+                timer.cancel()
+
+    def cancel_timers(self):
+        if self._timer_handles:
+            for timer in self._timer_handles.values():
+                timer.cancel()
+            self._timer_handles.clear()
+
+    def kill(self):
+        self.cancel_timers()
+        super().kill()
@@ -0,0 +1,37 @@
+from .config import Config
+
+
+class FixedTimestep:
+    """
+    固定步长累加器：把可变的帧间隔累加起来，按 1 / tick_rate 的整步切分。
+
+    每帧调用 advance(frame_dt) 得到本帧需要模拟的步数，剩余不足一步的时间
+    留到下一帧，alpha 为其占一步的比例，供渲染在两步之间插值。
+    一帧积压的步数超过 max_steps 时只补算 max_steps 步，多出的时间丢弃，
+    避免模拟越慢、补算越多的死亡螺旋。
+    """
+
+    def __init__(self, tick_rate=Config.TICK_RATE, max_steps=Config.MAX_CATCHUP_STEPS):
+        self.tick_rate = tick_rate
+        self.step = 1.0 / tick_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.alpha = 0.0  # 累加器中剩余时间占一步的比例 [0, 1)
+        self.dropped = 0.0  # 因追赶上限被丢弃的总时间（秒）
+
+    def advance(self, frame_dt):
+        """累加 frame_dt 秒，返回本帧要执行的模拟步数"""
+        self.accumulator += frame_dt
+        steps = int(self.accumulator / self.step)
+        if steps > self.max_steps:
+            skipped = steps - self.max_steps
+            self.dropped += skipped * self.step
+            self.accumulator -= skipped * self.step
+            steps = self.max_steps
+        self.accumulator = max(0.0, self.accumulator - steps * self.step)
+        self.alpha = min(self.accumulator / self.step, 1.0)
+        return steps
+
+    def reset(self):
+        self.accumulator = 0.0
+        self.alpha = 0.0
@@ -0,0 +1,147 @@
+import json
+import os
+import threading
+import time
+
+from .config import Config
+
+
+class TraceRecorder:
+    """
+    把帧、各计时段和游戏事件记录成 Chrome Trace Event 格式的 JSON，
+    可以直接在 Perfetto（ui.perfetto.dev）或 chrome://tracing 中打开。
+
+    - 计时段：FrameProfiler 在录制期间把每个 scope 和每一帧报告为完整事件（"X"）
+    - 游戏事件：instant(name, **args) 记为全局瞬时事件（"i"），例如波次开始、
+      Boss 登场、Boss 阶段变化、玩家死亡
+    - 计数器：counter(name, **values)（"C"），例如生成队列长度
+
+    未录制时 instant() 和 counter() 立即返回。事件数超过 max_events 后不再记录，
+    只统计丢弃的数量，避免长时间录制耗尽内存。
+    """
+
+    def __init__(self, max_events=Config.TRACE_MAX_EVENTS):
+        self.recording = False
+        self.max_events = max_events
+        self.events = []
+        self.dropped = 0
+        self._origin = 0.0
+        self._pid = os.getpid()
+        self._tid = threading.get_ident()
+
+    def start(self):
+        self.events = []
+        self.dropped = 0
+        self._origin = time.perf_counter()
+        self.recording = True
+
+    def stop(self):
+        self.recording = False
+
+    def _timestamp(self, seconds):
+        """perf_counter 秒 -> 相对录制开始的微秒"""
+        return (seconds - self._origin) * 1e6
+
+    def _append(self, event):
+        if len(self.events) < self.max_events:
+            self.events.append(event)
+        else:
+            self.dropped += 1
+
+    def complete(self, name, start, duration, category="frame"):
+        """一段从 start 开始、持续 duration 秒的计时（均为 perf_counter 秒）"""
+        if not self.recording:
+            return
+        self._append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": self._timestamp(start),
+                "dur": duration * 1e6,
+                "pid": self._pid,
+                "tid": self._tid,
+            }
+        )
+
+    def instant(self, name, **args):
+        """当前时刻的游戏事件，args 显示在 Perfetto 的详情面板中"""
+        if not self.recording:
+            return
+        self._append(
+            {
+                "name": name,
+                "cat": "gameplay",
+                "ph": "i",
+                "s": "g",  # 全局事件：在时间轴上贯穿所有轨道
+                "ts": self._timestamp(time.perf_counter()),
+                "pid": self._pid,
+                "tid": self._tid,
+                "args": args,
+            }
+        )
+
+    def counter(self, name, **values):
+        """当前时刻的计数器取值（"C"），Perfetto 中显示为随时间变化的曲线"""
+        if not self.recording:
+            return
+        self._append(
+            {
+                "name": name,
+                "cat": "gameplay",
+                "ph": "C",
+                "ts": self._timestamp(time.perf_counter()),
+                "pid": self._pid,
+                "tid": self._tid,
+                "args": values,
+            }
+        )
+
+    def save(self, path):
+        """写出 JSON 文件，返回写入的事件数"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        metadata = {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": self._pid,
+            "tid": self._tid,
+            "args": {"name": "main"},
+        }
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    "traceEvents": [metadata] + self.events,
+                    "displayTimeUnit": "ms",
+                    "otherData": {"title": Config.TITLE, "dropped": self.dropped},
+                },
+                f,
+            )
+        return len(self.events)
+
+
+# 进程级共享实例
+tracer = TraceRecorder()
+
+
+def default_trace_path():
+    return os.path.join(Config.TRACE_DIR, time.strftime("trace-%Y%m%d-%H%M%S.json"))
+
+
+def start_recording(profiler):
+    """开始录制：启用分析器，并让它把计时段和帧报告给 tracer"""
+    tracer.start()
+    profiler.recorder = tracer
+    profiler.acquire()
+
+
+def stop_recording(profiler, path=None):
+    """停止录制并写出文件，返回文件路径"""
+    tracer.stop()
+    profiler.recorder = None
+    profiler.release()
+    path = path or default_trace_path()
+    count = tracer.save(path)
+    print(f"Trace saved to {path} ({count} events, {tracer.dropped} dropped)")
+    return path
@@ -0,0 +1,130 @@
+import gc
+import json
+import os
+import time
+
+from .config import Config
+
+
+class SpikeWatchdog:
+    """
+    卡顿监视器：每帧结束时检查耗时，超过预算（目标帧间隔 x budget_factor）
+    就把这一帧的分析数据、各组实体数量和游戏状态写成 JSON，
+    文件按 spike-00.json ... spike-NN.json 循环覆盖，最多保留 keep 个。
+
+    两类卡顿分开标记：
+    - frame：本帧自身的工作（事件、模拟、渲染、上传、翻转）超出预算；
+      若本帧内 GC 暂停累计超过 Config.SPIKE_GC_TAG_MS，再加上 gc 标记
+    - tick_jitter：上一帧的工作在预算内，但 clock.tick 测得的帧间隔
+      仍超出预算，即时间损失在帧外（休眠过头、系统调度）
+
+    GC 暂停通过 gc.callbacks 逐次记录代数、耗时和回收数量。
+    """
+
+    def __init__(
+        self,
+        profiler,
+        budget_factor=Config.SPIKE_BUDGET_FACTOR,
+        directory=Config.SPIKE_DIR,
+        keep=Config.SPIKE_KEEP,
+        cooldown=Config.SPIKE_COOLDOWN,
+    ):
+        self.profiler = profiler
+        rate = Config.FPS or Config.TICK_RATE  # FPS 为 0（不限帧）时按模拟频率
+        self.budget_ms = 1000 / rate * budget_factor
+        self.directory = directory
+        self.keep = keep
+        self.cooldown = cooldown
+        self.captures = 0
+        self._last_capture = -float("inf")
+        self._previous_work_ms = 0.0
+        self._gc_pauses = []  # 本帧内的 GC：(代数, 毫秒, 回收数)
+        self._gc_start = None
+        self.running = False
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self.profiler.acquire()
+        gc.callbacks.append(self._on_gc)
+
+    def stop(self):
+        if not self.running:
+            return
+        self.running = False
+        self.profiler.release()
+        gc.callbacks.remove(self._on_gc)
+
+    def _on_gc(self, phase, info):
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            duration = (time.perf_counter() - self._gc_start) * 1000
+            self._gc_start = None
+            self._gc_pauses.append(
+                (info["generation"], duration, info.get("collected", 0))
+            )
+
+    def end_frame(self, tick_ms, scene=None):
+        """
+        在 profiler.end_frame() 之后调用。
+
+        Args:
+            tick_ms: 本帧开始时 clock.tick 返回的帧间隔（毫秒）。
+            scene: 当前场景，用于记录实体数量和游戏状态。
+        """
+        last = self.profiler.last_frame()
+        gc_pauses, self._gc_pauses = self._gc_pauses, []
+        if last is None:
+            return
+        scopes, work_ms = last
+        previous_work_ms, self._previous_work_ms = self._previous_work_ms, work_ms
+
+        tags = []
+        if work_ms > self.budget_ms:
+            tags.append("frame")
+            if sum(pause[1] for pause in gc_pauses) >= Config.SPIKE_GC_TAG_MS:
+                tags.append("gc")
+        elif tick_ms > self.budget_ms and previous_work_ms <= self.budget_ms:
+            tags.append("tick_jitter")
+        if not tags:
+            return
+
+        now = time.perf_counter()
+        if now - self._last_capture < self.cooldown:
+            return
+        self._last_capture = now
+        self._save(
+            {
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "frame": self.profiler.frames - 1,
+                "tags": tags,
+                "budget_ms": self.budget_ms,
+                "frame_ms": work_ms,
+                "tick_ms": tick_ms,
+                "previous_frame_ms": previous_work_ms,
+                "scopes_ms": scopes,
+                "gc": [
+                    {"generation": gen, "duration_ms": ms, "collected": collected}
+                    for gen, ms, collected in gc_pauses
+                ],
+                "entity_counts": (
+                    scene.entity_counts() if hasattr(scene, "entity_counts") else {}
+                ),
+                "state": scene.debug_state() if hasattr(scene, "debug_state") else {},
+            }
+        )
+
+    def _save(self, capture):
+        os.makedirs(self.directory, exist_ok=True)
+        name = f"spike-{self.captures % self.keep:02d}.json"
+        path = os.path.join(self.directory, name)
+        with open(path, "w") as f:
+            json.dump(capture, f, indent=2)
+        self.captures += 1
+        print(
+            f"Frame spike ({', '.join(capture['tags'])}): "
+            f"{capture['frame_ms']:.1f} ms work, {capture['tick_ms']:.1f} ms tick "
+            f"-> {path}"
+        )
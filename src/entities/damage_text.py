@@ -1,6 +1,9 @@
 import pygame
-from random import randint
 from pygame.math import Vector2
+from ..core.rng import rng
+from ..managers.fonts import fonts, render_faded, render_text
+
+_random = rng.stream("effects")
 
 
 class DamageText(pygame.sprite.Sprite):
@@ -8,13 +11,15 @@ class DamageText(pygame.sprite.Sprite):
         super().__init__()
         # 初始化位置属性（关键修正）
         self.pos = Vector2(pos)  # 将传入的pos转换为Vector2
-        self.pos += Vector2(randint(-15, 15), randint(-10, 10))  # 随机偏移
+        self.pos += Vector2(
+            _random.randint(-15, 15), _random.randint(-10, 10)
+        )  # 随机偏移
 
         # 文字属性
         self._create_text_surface(damage, is_critical)
 
         # 运动参数
-        self.velocity = Vector2(randint(-20, 20), -50 if is_critical else -30)
+        self.velocity = Vector2(_random.randint(-20, 20), -50 if is_critical else -30)
         self.lifetime = 1.0
         self.age = 0.0
 
@@ -22,10 +27,11 @@ class DamageText(pygame.sprite.Sprite):
         """创建文字表面"""
         self.font_size = 32 if is_critical else 24
         self.color = (255, 255, 0) if is_critical else (255, 255, 255)
-        self.font = pygame.font.SysFont("Arial", self.font_size, bold=True)
+        self.font = fonts.get("Arial", self.font_size, bold=True)
 
-        text = f"{damage}!" if is_critical else str(damage)
-        self.image = self.font.render(text, True, self.color)
+        self.text = f"{damage}!" if is_critical else str(damage)
+        # 缓存中的表面是共享的，淡出时换成缓存的半透明版本（见 update）
+        self.image = render_text(self.font, self.text, self.color)
         self.rect = self.image.get_rect(center=self.pos)  # 初始化rect位置
 
     def update(self, dt):
@@ -39,7 +45,7 @@ class DamageText(pygame.sprite.Sprite):
 
         # 透明度变化
         alpha = 255 * (1 - self.age / self.lifetime)
-        self.image.set_alpha(int(alpha))
+        self.image = render_faded(self.font, self.text, self.color, alpha)
 
         # 自动销毁
         if self.age >= self.lifetime:
@@ -1,37 +1,163 @@
 import pygame
 import math
-from random import uniform
 from pygame.math import Vector2
 from ..core.config import Config
 from .bullet import *
-from random import randint
+from ..managers.bullet_pool import BulletPool
+from ..core.renderer import draw_rect
+from ..core.trace import tracer
+from ..core.rng import rng
+from ..core.timers import TimerOwner
+from ..managers.patterns import compile_patterns
+
+_random = rng.stream("boss")
+
+# 弹幕定义：加载时编译成偏移、方向、速度和颜色表，发射时只做一次旋转和批量写入
+# （格式见 compile_pattern）
+PATTERNS = compile_patterns(
+    {
+        "circle": {"shape": "ring", "count": 24},
+        "spiral": {"shape": "ring", "count": 8, "speed": 250, "color": (255, 150, 0)},
+        "boss_ring": {
+            "shape": "ring",
+            "count": 24,
+            "speed": 250,
+            "color": (255, 150, 0),
+        },
+        "boss_shotgun": {
+            "shape": "fan",
+            "count": 9,
+            "spread": 120,
+            "speed": 400,
+            "speed_jitter": 50,
+            "color_range": ((100, 0, 0), (255, 0, 0)),
+        },
+        "boss_matrix": {
+            "shape": "grid",
+            "cols": 5,
+            "rows": 3,
+            "spacing": 80,
+            "heading": 90,
+            "direction_jitter": 5,
+            "speed": 250,
+            "color": (0, 0, 150),
+            "color_ramp": {"col": (50, 0, 0), "row": (0, 80, 0)},
+        },
+        "boss_shield": {
+            "shape": "ring",
+            "count": 8,
+            "radius": 80,
+            "direction": 90,
+            "speed": 200,
+            "color": (0, 200, 200),
+        },
+        "boss_homing_ring": {
+            "shape": "ring",
+            "count": 12,
+            "speed": 180,
+            "color": (255, 150, 0),
+            "kind": BulletPool.HOMING,
+            "lifetime": 3,
+        },
+        "boss_dna": {
+            "shape": "spiral",
+            "count": 30,
+            "radius_step": 3,
+            "heading": 90,
+            "speed": 250,
+            "speed_ramp": {"index": 2},
+            "color": (0, 150, 200),
+            "color_ramp": {"index": (8, -5, 0)},
+        },
+    }
+)
+
+
+# 敌机外观原型，按 (类型名, ...) 保存。不放进 asset_cache：那是有容量上限的
+# LRU，背景等资源会把原型挤出去，重新绘制后 GL 图集里又多占一个位置
+_prototypes = {}
+
+
+def _prototype(key, render):
+    """
+    敌机外观原型：key 对应的图像只绘制一次，之后所有实例共享同一张表面
+    （GL 图集中也只占一个位置）。需要修改图像的实例先调用
+    Enemy._own_image() 换成私有副本（写时复制）。
+    """
+    image = _prototypes.get(key)
+    if image is None:
+        image = _prototypes[key] = render()
+    return image
+
+
+class Enemy(TimerOwner, pygame.sprite.Sprite):
+    fire_interval = 2.0  # 开火间隔（秒），由 EmitterScheduler 按此排程
 
-
-class Enemy(pygame.sprite.Sprite):
     def __init__(self, pos, hp=1, score_value=100):
         super().__init__()
         self.hp = hp
         self.max_hp = hp
-        self.image = pygame.Surface((32, 32))
-        self._create_visual()
-        self.rect = self.image.get_rect(center=pos)
+        self.image = self.prototype()
+        self._image_shared = True
+        # 碰撞矩形固定为 32x32，与各类型图像的实际尺寸无关
+        self.rect = pygame.Rect(0, 0, 32, 32)
+        self.rect.center = pos
         self.hitbox = self.rect.inflate(-8, -8)
-        self.shoot_timer = 0
         self.speed = Vector2(0, 100)
         self.score_value = score_value
         self.player_pos = None
-
-    def _create_visual(self):
-        self.image.fill((255, 0, 0))
+        # 场景的模拟时钟、计时服务和射击调度，生成时由 attach() 接入
+        self.clock = None
+        self.timers = None
+        self.emitters = None
+        self.fire_target = None
+
+    @classmethod
+    def prototype(cls):
+        """该类型共享的预渲染图像"""
+        return _prototype((cls.__name__,), cls._render_visual)
+
+    @staticmethod
+    def _render_visual():
+        image = pygame.Surface((32, 32))
+        image.fill((255, 0, 0))
+        return image
+
+    def _own_image(self):
+        """写时复制：第一次修改图像（像素或 alpha）前换成私有副本"""
+        if self._image_shared:
+            self.image = self.image.copy()
+            self._image_shared = False
+        return self.image
+
+    # 非 None 时为转向速度（度/秒），场景每步用 steer_sprites 批量转向玩家
+    turn_speed = None
 
     def update(self, dt, player_pos=None):
         self.player_pos = player_pos
-        self.shoot_timer += dt
         self.rect.y += self.speed.y * dt
 
     def shoot_pattern(self, bullet_group):
+        """开火一次（由 EmitterScheduler 在开火时间到达时调用）"""
         raise NotImplementedError("必须实现射击模式")
 
+    def attach(self, clock, timers, emitters=None, fire_target=None):
+        """接入场景的模拟时钟、计时服务（TimerWheel）和射击调度，并启动计时器"""
+        self.clock = clock
+        self.timers = timers
+        if emitters is not None:
+            emitters.register(self, fire_target)
+        self._start_timers()
+
+    def _start_timers(self):
+        """子类在此登记生成后就开始计时的计时器（见 TimerOwner.after）"""
+
+    def _spawn_child(self, child, groups):
+        """释放的僚机接入同一个场景，并登记到同一个射击目标"""
+        child.attach(self.clock, self.timers, self.emitters, self.fire_target)
+        for group in groups:
+            group.add(child)
+
     # 新增核心方法：处理伤害
     def take_damage(self, damage):
         """基础伤害处理方法"""
@@ -43,38 +169,41 @@ class Enemy(pygame.sprite.Sprite):
 class BasicEnemy(Enemy):
     def __init__(self, pos, hp=1, score_value=100):
         super().__init__(pos, hp=hp, score_value=score_value)
-        self.image.fill((100, 100, 100))
         self.hitbox = self.rect.inflate(-10, -10)
         self.speed = Vector2(0, 150)
 
+    @staticmethod
+    def _render_visual():
+        image = pygame.Surface((32, 32))
+        image.fill((100, 100, 100))
+        return image
+
     def update(self, dt, player_pos=None):
         super().update(dt, player_pos)
         if self.rect.top > Config.HEIGHT:
             self.kill()
 
     def shoot_pattern(self, bullet_group):
-        if self.shoot_timer >= 2.0:
-            bullet = EnemyBullet(
-                self.rect.center, Vector2(0, 1), speed=300, color=(100, 100, 100)
-            )
-            bullet_group.add(bullet)
-            self.shoot_timer = 0
+        bullet_group.spawn(
+            self.rect.center, Vector2(0, 1), speed=300, color=(100, 100, 100)
+        )
 
 
 class CircleEnemy(BasicEnemy):
+    fire_interval = 1.5
+
     def __init__(self, pos):
         super().__init__(pos, hp=2, score_value=200)
-        self.image = pygame.Surface((32, 32), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, (255, 150, 0), (16, 16), 12)
         self.speed = Vector2(0, 300)
 
+    @staticmethod
+    def _render_visual():
+        image = pygame.Surface((32, 32), pygame.SRCALPHA)
+        pygame.draw.circle(image, (255, 150, 0), (16, 16), 12)
+        return image
+
     def shoot_pattern(self, bullet_group):
-        if self.shoot_timer > 1.5:
-            self.shoot_timer = 0
-            for angle in range(0, 360, 15):
-                rad = math.radians(angle)
-                direction = Vector2(math.cos(rad), math.sin(rad))
-                bullet_group.add(EnemyBullet(self.rect.center, direction))
+        PATTERNS["circle"].fire(bullet_group, self.rect.center)
 
     def update(self, dt, player_pos=None):
         super().update(dt, player_pos)
@@ -88,19 +217,25 @@ class CircleEnemy(BasicEnemy):
 class ZigzagEnemy(BasicEnemy):
     """锯齿移动敌机"""
 
+    fire_interval = 1.2
+
     def __init__(self, pos):
         super().__init__(pos, hp=3, score_value=150)
-        self.image = pygame.Surface((32, 32), pygame.SRCALPHA)
-        pygame.draw.polygon(self.image, (0, 200, 100), [(16, 0), (0, 32), (32, 32)])
         self.speed = Vector2(0, 200)
         self.amplitude = 100  # 横向摆动幅度
         self.frequency = 2  # 摆动频率
 
+    @staticmethod
+    def _render_visual():
+        image = pygame.Surface((32, 32), pygame.SRCALPHA)
+        pygame.draw.polygon(image, (0, 200, 100), [(16, 0), (0, 32), (32, 32)])
+        return image
+
     def update(self, dt, player_pos=None):
         self.rect.y += self.speed.y * dt
         # 横向锯齿运动
         self.rect.x += (
-            math.sin(pygame.time.get_ticks() * 0.001 * self.frequency)
+            math.sin(self.clock.time * self.frequency)
             * self.amplitude
             * dt
         )
@@ -108,64 +243,54 @@ class ZigzagEnemy(BasicEnemy):
             self.kill()
 
     def shoot_pattern(self, bullet_group):
-        if self.shoot_timer >= 1.2:
-            # 三向散射
-            for angle in [-15, 0, 15]:
-                bullet = EnemyBullet(
-                    self.rect.center,
-                    Vector2(0, 1).rotate(angle),
-                    speed=300,
-                    color=(0, 200, 100),
-                )
-                bullet_group.add(bullet)
-            self.shoot_timer = 0
+        # 三向散射
+        for angle in [-15, 0, 15]:
+            bullet_group.spawn(
+                self.rect.center,
+                Vector2(0, 1).rotate(angle),
+                speed=300,
+                color=(0, 200, 100),
+            )
 
 
 class HomingDroneEnemy(Enemy):
     """跟踪无人机"""
 
+    fire_interval = 1.8
+    turn_speed = 90  # 转向速度度/秒
+
     def __init__(self, pos, max_alive_time=7):
         super().__init__(pos, hp=5, score_value=300)
-        self.image = pygame.Surface((36, 36), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, (150, 50, 200), (18, 18), 15)
-        pygame.draw.circle(self.image, (200, 200, 200), (18, 18), 5)
         self.speed = Vector2(0, 50)
-        self.turn_speed = 90  # 转向速度度/秒
         self.max_alive_time = max_alive_time
-        self.timer = 0
+
+    @staticmethod
+    def _render_visual():
+        image = pygame.Surface((36, 36), pygame.SRCALPHA)
+        pygame.draw.circle(image, (150, 50, 200), (18, 18), 15)
+        pygame.draw.circle(image, (200, 200, 200), (18, 18), 5)
+        return image
+
+    def _start_timers(self):
+        self.after("expire", self.max_alive_time, self.kill)
 
     def update(self, dt, player_pos=None):
         super().update(dt, player_pos)
-        self.timer += dt
-        if player_pos:
-            # 向玩家方向转向
-            target_vector = Vector2(player_pos) - self.rect.center
-            if target_vector.length() > 0:
-                target_dir = target_vector.normalize()
-                current_dir = self.speed.normalize()
-                angle = current_dir.angle_to(target_dir)
-                max_turn = self.turn_speed * dt
-                angle = max(-max_turn, min(angle, max_turn))
-                self.speed = current_dir.rotate(angle) * self.speed.length()
-
+        # 向玩家方向的转向已由场景批量完成（steer_sprites）
         self.rect.center += self.speed * dt
         if self.rect.top > Config.HEIGHT:
             self.kill()
-        if self.timer > self.max_alive_time:
-            self.kill()
 
     def shoot_pattern(self, bullet_group):
-        if self.shoot_timer >= 1.8:
-            # 发射跟踪导弹
-            bullet = HomingEnemyBullet(
-                self.rect.center,
-                Vector2(0, 1),
-                speed=200,
-                color=(200, 100, 200),
-                player_pos_ref=lambda: self.player_pos,
-            )
-            bullet_group.add(bullet)
-            self.shoot_timer = 0
+        # 发射跟踪导弹
+        bullet_group.spawn(
+            self.rect.center,
+            Vector2(0, 1),
+            speed=200,
+            color=(200, 100, 200),
+            kind=BulletPool.HOMING,
+            lifetime=3,
+        )
 
 
 class ShieldedEnemy(BasicEnemy):
@@ -173,104 +298,108 @@ class ShieldedEnemy(BasicEnemy):
 
     def __init__(self, pos):
         super().__init__(pos, hp=5, score_value=250)
-        self.base_image = pygame.Surface((40, 40), pygame.SRCALPHA)
-        # 绘制护盾效果
-        pygame.draw.circle(self.base_image, (100, 100, 255, 100), (20, 20), 18)
-        pygame.draw.circle(self.base_image, (0, 0, 200), (20, 20), 12)
-        self.image = self.base_image.copy()
         self.shield_active = True
         self.shield_recharge_time = 5.0
-        self.shield_timer = 0.0
         self.speed = Vector2(0, 50)
 
+    @staticmethod
+    def _render_visual():
+        image = pygame.Surface((40, 40), pygame.SRCALPHA)
+        # 绘制护盾效果
+        pygame.draw.circle(image, (100, 100, 255, 100), (20, 20), 18)
+        pygame.draw.circle(image, (0, 0, 200), (20, 20), 12)
+        return image
+
+    @classmethod
+    def broken_prototype(cls):
+        """护盾被击破后的暗淡外观，同样只绘制一次"""
+
+        def render():
+            image = cls.prototype().copy()
+            image.fill((255, 255, 255, 200), special_flags=pygame.BLEND_RGBA_MULT)
+            return image
+
+        return _prototype((cls.__name__, "broken"), render)
+
     def take_damage(self, damage):
         if self.shield_active:
-            # 护盾存在时免疫伤害
-            self.image.fill((255, 255, 255, 200), special_flags=pygame.BLEND_RGBA_MULT)
+            # 护盾存在时免疫伤害（换成预渲染的击破外观，不改写共享图像）
+            self.image = self.broken_prototype()
             self.shield_active = False
+            self.after("shield", self.shield_recharge_time, self._recharge_shield)
             # print("Block damage.")
             return
         super().take_damage(damage)
         # print(f"Take damage:{str(damage)} .")
 
-    def update(self, dt, player_pos=None):
-        super().update(dt, player_pos)
-        # 护盾恢复逻辑
-        if not self.shield_active:
-            self.shield_timer += dt
-            if self.shield_timer >= self.shield_recharge_time:
-                self.shield_active = True
-                self.image = self.base_image.copy()
-                self.shield_timer = 0.0
+    def _recharge_shield(self):
+        self.shield_active = True
+        self.image = self.prototype()
 
 
 class SpiralEnemy(CircleEnemy):
     """螺旋弹幕敌机"""
 
+    fire_interval = 0.8
+
     def __init__(self, pos):
         super().__init__(pos)
-        self.image.fill((0, 0, 0, 0))
-        pygame.draw.polygon(self.image, (255, 100, 0), [(16, 0), (32, 32), (0, 32)])
         self.rotate_speed = 180  # 度/秒
 
+    @staticmethod
+    def _render_visual():
+        image = pygame.Surface((32, 32), pygame.SRCALPHA)
+        pygame.draw.polygon(image, (255, 100, 0), [(16, 0), (32, 32), (0, 32)])
+        return image
+
     def shoot_pattern(self, bullet_group):
-        if self.shoot_timer > 0.8:
-            # 旋转发射
-            base_angle = pygame.time.get_ticks() / 1000 * self.rotate_speed
-            for i in range(0, 360, 45):
-                angle = base_angle + i
-                direction = Vector2(1, 0).rotate(angle)
-                bullet = EnemyBullet(
-                    self.rect.center, direction, speed=250, color=(255, 150, 0)
-                )
-                bullet_group.add(bullet)
-            self.shoot_timer = 0
+        # 旋转发射
+        base_angle = self.clock.time * self.rotate_speed
+        PATTERNS["spiral"].fire(bullet_group, self.rect.center, base_angle)
 
 
 class CarrierEnemy(Enemy):
     """母舰敌机"""
 
+    fire_interval = 2.5
+
     def __init__(self, pos):
         super().__init__(pos, hp=20, score_value=500)
-        self.image = pygame.Surface((64, 32))
-        self.image.fill((80, 80, 80))
-        pygame.draw.rect(self.image, (100, 100, 100), (0, 12, 64, 8))
         self.speed = Vector2(0, 50)
         self.drone_spawn_interval = 3.0
-        self.drone_timer = 0.0
 
-    def update(self, dt, player_pos=None):
-        super().update(dt, player_pos)
-        self.drone_timer += dt
-        # 定期释放小飞机
-        if self.drone_timer >= self.drone_spawn_interval:
-            self._release_drones()
-            self.drone_timer = 0
+    @staticmethod
+    def _render_visual():
+        image = pygame.Surface((64, 32))
+        image.fill((80, 80, 80))
+        pygame.draw.rect(image, (100, 100, 100), (0, 12, 64, 8))
+        return image
+
+    def _start_timers(self):
+        self.after("drones", self.drone_spawn_interval, self._release_drones)
 
     def _release_drones(self):
+        """定期释放小飞机"""
+        self.after("drones", self.drone_spawn_interval, self._release_drones)
         groups = list(self.groups())
         for i in range(-1, 2):
             pos = (self.rect.centerx + i * 20, self.rect.centery + 20)
             drone = BasicEnemy(pos, hp=1, score_value=50)
             drone.speed = Vector2(0, 200)
-            for group in groups:
-                group.add(drone)
+            self._spawn_child(drone, groups)
 
     def shoot_pattern(self, bullet_group):
-        if self.shoot_timer >= 2.5:
-            # 两侧齐射
-            for side in [-1, 1]:
-                pos = (self.rect.centerx + side * 24, self.rect.centery)
-                bullet = EnemyBullet(
-                    pos, Vector2(0, 1), speed=300, color=(100, 100, 100)
-                )
-                bullet_group.add(bullet)
-            self.shoot_timer = 0
+        # 两侧齐射
+        for side in [-1, 1]:
+            pos = (self.rect.centerx + side * 24, self.rect.centery)
+            bullet_group.spawn(pos, Vector2(0, 1), speed=300, color=(100, 100, 100))
 
 
 class StealthEnemy(BasicEnemy):
     """隐形敌机"""
 
+    fire_interval = 1.0
+
     def __init__(self, pos):
         super().__init__(pos, hp=2, score_value=200)
         self.alpha = 0
@@ -288,29 +417,34 @@ class StealthEnemy(BasicEnemy):
                 self.alpha = max(self.alpha - self.fade_speed * dt, 0)
                 self.is_visible = False
 
-            self.image.set_alpha(self.alpha)
+            self._own_image().set_alpha(self.alpha)  # 每个实例透明度不同，需要私有副本
 
         super().update(dt, player_pos)
 
     def shoot_pattern(self, bullet_group):
-        if self.is_visible and self.shoot_timer >= 1.0:
-            # 瞬发三向弹
-            for angle in [-5, 0, 5]:
-                bullet = EnemyBullet(
-                    self.rect.center,
-                    Vector2(0, 1).rotate(angle),
-                    speed=400,
-                    color=(100, 100, 100, self.alpha),
-                )
-                bullet_group.add(bullet)
-            self.shoot_timer = 0
+        if not self.is_visible:
+            return False  # 显形后再开火（调度器下一步重试）
+        # 瞬发三向弹
+        for angle in [-5, 0, 5]:
+            bullet_group.spawn(
+                self.rect.center,
+                Vector2(0, 1).rotate(angle),
+                speed=400,
+                color=(100, 100, 100, self.alpha),
+            )
 
 
 class Boss(Enemy):
+    # 各阶段的外观颜色，每个阶段的图像预渲染一次，阶段变化时直接换图
+    PHASE_COLORS = {
+        1: (200, 50, 200),
+        2: (150, 0, 200),
+        3: (255, 255, 150),
+        4: (255, 0, 100),
+    }
+
     def __init__(self):
         super().__init__((Config.WIDTH // 2, 100), hp=50, score_value=1000)
-        self.image = pygame.Surface((128, 64))
-        self.image.fill((200, 50, 200))
         self.rect = self.image.get_rect(center=(Config.WIDTH // 2, 100))
         self.phase = 1
         self.move_speed = 150
@@ -318,20 +452,17 @@ class Boss(Enemy):
         self.base_y = 100
         self.direction = 1
         self.attack_speed = 0.8  # 初始攻击间隔
-        self.attack_timer = 0.0
         self.attack_patterns = []
-        self.bullets_groups = []
 
         # 激光相关属性
         self.laser_duration = 1.5
         self.laser_cooldown = 5.0
-        self.laser_timer = 0.0
         self.attack_patterns = []
         # 新增属性
-        self.minion_spawn_timer = 0.0
         # self.minion_spawn_interval = 8.0
-        self.blackhole_timer = 0.0
         self.blackhole_cooldown = 15.0
+        # 冷却已结束、但当前阶段还不能发动的技能（进入对应阶段时立即发动）
+        self._ready_abilities = set()
         self.max_phase = 4
         self.phase_callback = {}
         for i in range(1, self.max_phase + 1):
@@ -341,57 +472,85 @@ class Boss(Enemy):
         # 调整召唤间隔为更合理的值
         self.minion_spawn_interval = 5.0  # 5秒召唤一次
 
+    @property
+    def fire_interval(self):
+        return self.attack_speed  # 生成时会按阶段调整 attack_speed
+
+    @classmethod
+    def prototype(cls):
+        return cls.phase_prototype(1)
+
+    @classmethod
+    def phase_prototype(cls, phase):
+        def render():
+            image = pygame.Surface((128, 64))
+            image.fill(cls.PHASE_COLORS[phase])
+            return image
+
+        return _prototype((cls.__name__, phase), render)
+
     def add_phase_callback(self, phase: int, callback: any):
         self.phase_callback[phase].append(callback)
 
     def take_damage(self, damage):  # 重写Boss的伤害处理
         super().take_damage(damage)
         if self.hp <= self.max_hp * 0.5 and self.phase < 2:
-            self.phase = 2
-            self.image.fill((150, 0, 200))
-            for _phase_callback in self.phase_callback[self.phase]:
-                _phase_callback()
+            self._enter_phase(2)
         if self.hp <= self.max_hp * 0.3 and self.phase < 3:
-            self.phase = 3
-            self.image.fill((255, 255, 150))
-            for _phase_callback in self.phase_callback[self.phase]:
-                _phase_callback()
+            self._enter_phase(3)
         if self.hp <= self.max_hp * 0.1 and self.phase < 4:
-            self.phase = 4
-            self.image.fill((255, 0, 100))
-            for _phase_callback in self.phase_callback[self.phase]:
-                _phase_callback()
+            self._enter_phase(4)
 
     def update(self, dt, player_pos=None):
         super().update(dt, player_pos)
         self._handle_movement(dt)
-        self.attack_timer += dt
-        self.laser_timer += dt
-
-        # 处理激光攻击
-        if self.phase == 2 and self.laser_timer >= self.laser_cooldown:
-            self._laser_attack(self.bullets_groups[0])
-            self.laser_timer = 0.0
-
-        # 常规攻击模式
-        if self.attack_timer >= self.attack_speed:
-            self.shoot(self.bullets_groups)
-            self.attack_timer = 0
-
-        # 新增子系统计时器
-        self.minion_spawn_timer += dt
-        self.blackhole_timer += dt
-
-        # 修改召唤条件判断
-        if self.phase >= 2 and self.enemies_group:
-            if self.minion_spawn_timer >= self.minion_spawn_interval:
-                self._summon_minions()
-                self.minion_spawn_timer = 0.0
-
-        # 黑洞攻击系统
-        if self.phase >= 3 and self.blackhole_timer >= self.blackhole_cooldown:
-            self._blackhole_attack(self.bullets_groups[0])
-            self.blackhole_timer = 0.0
+        # 常规攻击模式由 EmitterScheduler 按 attack_speed 调度（见 shoot_pattern），
+        # 激光、召唤和黑洞由计时服务按各自的冷却触发（见 _start_timers）
+
+    def _start_timers(self):
+        self._ready_abilities.clear()
+        self.after("laser", self.laser_cooldown, self._ability_ready, "laser")
+        self.after(
+            "minions", self.minion_spawn_interval, self._ability_ready, "minions"
+        )
+        self.after(
+            "blackhole", self.blackhole_cooldown, self._ability_ready, "blackhole"
+        )
+
+    def _ability_ready(self, name):
+        """冷却结束：当前阶段允许时立即发动，否则等阶段变化时再发动"""
+        if not self._use_ability(name):
+            self._ready_abilities.add(name)
+
+    def _use_ability(self, name):
+        """按阶段条件发动技能并重新开始冷却，返回是否发动"""
+        if name == "laser":  # 激光攻击（仅第 2 阶段）
+            if self.phase != 2:
+                return False
+            self._laser_attack(self.fire_target)
+            cooldown = self.laser_cooldown
+        elif name == "minions":  # 召唤护卫机
+            if self.phase < 2 or not self.enemies_group:
+                return False
+            self._summon_minions()
+            cooldown = self.minion_spawn_interval
+        else:  # 黑洞攻击系统
+            if self.phase < 3:
+                return False
+            self._blackhole_attack(self.fire_target)
+            cooldown = self.blackhole_cooldown
+        self.after(name, cooldown, self._ability_ready, name)
+        return True
+
+    def _enter_phase(self, phase):
+        self.phase = phase
+        tracer.instant("boss_phase", phase=phase, hp=self.hp, max_hp=self.max_hp)
+        self.image = self.phase_prototype(phase)
+        for _phase_callback in self.phase_callback[phase]:
+            _phase_callback()
+        for name in sorted(self._ready_abilities):
+            if self._use_ability(name):
+                self._ready_abilities.discard(name)
 
     def _handle_movement(self, dt):
         move_amount = self.move_speed * self.direction * dt
@@ -407,7 +566,7 @@ class Boss(Enemy):
             self.direction = -1
 
         self.rect.centerx = new_x
-        self.rect.centery = self.base_y + 20 * math.sin(pygame.time.get_ticks() / 300)
+        self.rect.centery = self.base_y + 20 * math.sin(self.clock.get_ticks() / 300)
 
     def _spread_attack(self, bullet_group):
         if self.player_pos:
@@ -416,27 +575,20 @@ class Boss(Enemy):
                 direction = direction.normalize()
                 for angle in [-15, 0, 15]:
                     rotated = direction.rotate(angle)
-                    bullet_group.add(
-                        EnemyBullet(self.rect.center, rotated, color=(255, 0, 200))
-                    )
+                    bullet_group.spawn(self.rect.center, rotated, color=(255, 0, 200))
 
     def _spiral_attack(self, bullet_group):
-        angle = pygame.time.get_ticks() % 360 * 3
+        angle = self.clock.get_ticks() % 360 * 3
         rad = math.radians(angle)
         direction = Vector2(math.cos(rad), math.sin(rad))
-        bullet_group.add(
-            EnemyBullet(self.rect.center, direction, speed=350, color=(50, 200, 255))
+        bullet_group.spawn(
+            self.rect.center, direction, speed=350, color=(50, 200, 255)
         )
 
     def shoot_pattern(self, bullet_group):
-        if len(self.bullets_groups) >= 3:
-            self.bullets_groups.clear()
-        self.bullets_groups.append(bullet_group)
-
-    def shoot(self, bullets_groups):
+        """当前阶段的每种攻击模式各发射一次"""
         for attack_pattern in self.attack_patterns:
-            for bullets_group in bullets_groups:
-                attack_pattern(bullets_group)
+            attack_pattern(bullet_group)
 
     def draw_health_bar(self, surface):
         """在屏幕顶部绘制Boss血条"""
@@ -445,57 +597,46 @@ class Boss(Enemy):
         pos = (Config.WIDTH // 2 - bar_width // 2, 20)
 
         # 背景
-        pygame.draw.rect(surface, (80, 0, 0), (*pos, bar_width, bar_height))
+        draw_rect(surface, (80, 0, 0), (*pos, bar_width, bar_height))
         # 当前血量
         fill_width = bar_width * (self.hp / self.max_hp)
-        pygame.draw.rect(surface, (200, 50, 200), (*pos, fill_width, bar_height))
+        draw_rect(surface, (200, 50, 200), (*pos, fill_width, bar_height))
 
     def _ring_attack(self, bullet_group):
         """环形弹幕攻击"""
-        num_bullets = 24
-        for angle in range(0, 360, 360 // num_bullets):
-            rad = math.radians(angle)
-            direction = Vector2(math.cos(rad), math.sin(rad))
-            bullet = EnemyBullet(
-                self.rect.center, direction, speed=250, color=(255, 150, 0)
-            )
-            bullet_group.add(bullet)
+        PATTERNS["boss_ring"].fire(bullet_group, self.rect.center)
 
     def _homing_attack(self, bullet_group):
         """跟踪导弹攻击"""
         if self.player_pos:
             initial_dir = Vector2(0, 1)  # 初始向下
-            bullet = HomingEnemyBullet(
+            bullet_group.spawn(
                 self.rect.center,
                 initial_dir,
                 speed=200,
                 color=(255, 0, 150),
-                player_pos_ref=lambda: self.player_pos,
+                kind=BulletPool.HOMING,
+                lifetime=3,
             )
-            bullet_group.add(bullet)
 
     def _bounce_attack(self, bullet_group):
         """弹跳子弹攻击"""
-        angle = uniform(-45, 45)
+        angle = _random.uniform(-45, 45)
         direction = Vector2(1, 0).rotate(angle)  # 随机水平方向
-        bullet = BounceEnemyBullet(
-            self.rect.center, direction, speed=300, color=(0, 0, 255)
+        bullet_group.spawn(
+            self.rect.center,
+            direction,
+            speed=300,
+            color=(0, 0, 255),
+            kind=BulletPool.BOUNCE,
+            max_bounce=3,
         )
-        bullet_group.add(bullet)
 
     def _shotgun_attack(self, bullet_group):
         """散弹枪式扇形攻击"""
         if self.player_pos:
-            base_dir = (Vector2(self.player_pos) - self.rect.center).normalize()
-            for angle in range(-60, 61, 15):
-                spread_dir = base_dir.rotate(angle)
-                bullet = EnemyBullet(
-                    self.rect.center,
-                    spread_dir,
-                    speed=400 + randint(-50, 50),
-                    color=(randint(100, 255), 0, 0),
-                )
-                bullet_group.add(bullet)
+            _, aim = (Vector2(self.player_pos) - self.rect.center).as_polar()
+            PATTERNS["boss_shotgun"].fire(bullet_group, self.rect.center, aim)
 
     def _laser_attack(self, bullet_group):
         """激光束攻击"""
@@ -514,11 +655,17 @@ class Boss(Enemy):
         """地雷阵攻击"""
         for _ in range(3):
             pos = (
-                self.rect.centerx + randint(-200, 200),
-                self.rect.centery + randint(50, 150),
+                self.rect.centerx + _random.randint(-200, 200),
+                self.rect.centery + _random.randint(50, 150),
+            )
+            bullet_group.spawn(
+                pos,
+                Vector2(0, 1),
+                speed=0,
+                color=(255, 255, 0),
+                kind=BulletPool.MINE,
+                lifetime=1.5 + _random.uniform(0, 1.5),  # 引爆延时
             )
-            mine = MineBullet(pos, delay=1.5 + uniform(0, 1.5), color=(255, 255, 0))
-            bullet_group.add(mine)
 
     def _cross_lasers_attack(self, bullet_group):
         """十字交叉激光"""
@@ -535,22 +682,11 @@ class Boss(Enemy):
 
     def _matrix_attack(self, bullet_group):
         """矩阵弹幕"""
-        cols = 5
-        rows = 3
-        spacing = 80
-        offset = pygame.time.get_ticks() % 2000 / 2000 * spacing
-
-        for x in range(cols):
-            for y in range(rows):
-                pos = (x * spacing + offset - 200, y * spacing + offset + 50)
-                direction = Vector2(0, 1).rotate(uniform(-5, 5))
-                bullet = EnemyBullet(
-                    (pos[0] + self.rect.centerx - 200, pos[1]),
-                    direction,
-                    speed=250,
-                    color=(x * 50, y * 80, 150),
-                )
-                bullet_group.add(bullet)
+        pattern = PATTERNS["boss_matrix"]
+        offset = self.clock.get_ticks() % 2000 / 2000 * pattern.spec["spacing"]
+        # 方阵从 Boss 左侧 400 像素、屏幕顶部 50 像素处开始，整体随时间斜向平移
+        origin = (self.rect.centerx - 400 + offset, 50 + offset)
+        pattern.fire(bullet_group, origin)
 
     def _summon_minions(self):
         """召唤护卫机（修正组引用）"""
@@ -559,12 +695,12 @@ class Boss(Enemy):
             minion = CircleEnemy(pos)
             minion.speed = Vector2(0, 0)
             minion.hp = 3
-            self.enemies_group.add(minion)  # 添加到正确的敌人组
+            self._spawn_child(minion, [self.enemies_group])  # 添加到正确的敌人组
 
     def _blackhole_attack(self, bullet_group):
         """黑洞引力攻击"""
         blackhole_pos = (
-            self.rect.centerx + randint(-200, 200),
+            self.rect.centerx + _random.randint(-200, 200),
             self.rect.centery + 150,
         )
         bullet_group.add(BlackHole(blackhole_pos))
@@ -578,32 +714,13 @@ class Boss(Enemy):
 
     def _rotating_shield(self, bullet_group):
         """旋转护盾弹幕"""
-        radius = 80
-        angle = pygame.time.get_ticks() % 360 * 2
-        for _ in range(8):
-            pos = self.rect.center + Vector2(
-                radius * math.cos(math.radians(angle)),
-                radius * math.sin(math.radians(angle)),
-            )
-            bullet = EnemyBullet(pos, Vector2(0, 1), speed=200, color=(0, 200, 200))
-            bullet_group.add(bullet)
-            angle += 45
+        angle = self.clock.get_ticks() % 360 * 2
+        PATTERNS["boss_shield"].fire(bullet_group, self.rect.center, angle)
 
     def _homing_ring(self, bullet_group):
         """追踪环形弹"""
-        num = 12
-        base_angle = pygame.time.get_ticks() % 360 * 0.5
-        for i in range(num):
-            angle = base_angle + i * (360 / num)
-            direction = Vector2(1, 0).rotate(angle)
-            bullet = HomingEnemyBullet(
-                self.rect.center,
-                direction,
-                speed=180,
-                color=(255, 150, 0),
-                player_pos_ref=lambda: self.player_pos,
-            )
-            bullet_group.add(bullet)
+        base_angle = self.clock.get_ticks() % 360 * 0.5
+        PATTERNS["boss_homing_ring"].fire(bullet_group, self.rect.center, base_angle)
 
     def _shockwave_attack(self, bullet_group):
         """全屏震荡波"""
@@ -620,28 +737,40 @@ class Boss(Enemy):
                 offset = (i - mirror_count // 2) * 50
                 pos = (self.rect.centerx + offset, self.rect.centery)
                 direction = (Vector2(self.player_pos) - pos).normalize()
-                bullet = MirrorBullet(
-                    pos, direction, bounce=3, color=(200, 200, 0)  # 最大反弹次数
+                bullet_group.spawn(
+                    pos,
+                    direction,
+                    color=(200, 200, 0),
+                    kind=BulletPool.MIRROR,
+                    max_bounce=3,  # 最大反弹次数
                 )
-                bullet_group.add(bullet)
 
     def _dna_attack(self, bullet_group):
         """DNA螺旋弹幕"""
-        num = 30
-        for i in range(num):
-            angle = i * 137.5  # 黄金角度
-            radius = i * 3
-            x = radius * math.cos(math.radians(angle))
-            y = radius * math.sin(math.radians(angle))
-            pos = self.rect.center + Vector2(x, y)
-            direction = Vector2(
-                math.cos(math.radians(angle + 90)), math.sin(math.radians(angle + 90))
-            ).normalize()
-            bullet = EnemyBullet(
-                pos, direction, speed=250 + i * 2, color=(i * 8, 150 - i * 5, 200)
-            )
-            bullet_group.add(bullet)
+        PATTERNS["boss_dna"].fire(bullet_group, self.rect.center)  # 黄金角螺旋
 
     def set_enemies_group(self, group):
         """设置敌人组的引用"""
         self.enemies_group = group
+
+
+# 所有敌机类型（启动时预渲染外观）
+ENEMY_TYPES = (
+    BasicEnemy,
+    CircleEnemy,
+    ZigzagEnemy,
+    HomingDroneEnemy,
+    ShieldedEnemy,
+    SpiralEnemy,
+    CarrierEnemy,
+    StealthEnemy,
+)
+
+
+def prerender_enemy_visuals():
+    """预先绘制所有敌机和 Boss 各阶段的外观，避免首次生成某种敌机时再绘制"""
+    for enemy_class in ENEMY_TYPES:
+        enemy_class.prototype()
+    ShieldedEnemy.broken_prototype()
+    for phase in Boss.PHASE_COLORS:
+        Boss.phase_prototype(phase)
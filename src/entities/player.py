@@ -1,6 +1,5 @@
 import pygame
 from pygame.math import Vector2
-from random import random
 
 # Assuming Config is imported correctly
 try:
@@ -13,23 +12,61 @@ except ImportError:
 
 
 from ..entities.powerup import PowerUpType
+from ..managers.assets import load_image
+from ..core.renderer import draw_rect
+from ..core.trace import tracer
+from ..core.rng import rng
+from ..core.clock import SimulationClock
+from ..core.timers import TimerOwner, TimerWheel
 
+_random = rng.stream("combat")
 
 # Assuming Bullet and PowerBullet classes are defined below or imported
 # from ..entities.bullet import Bullet, PowerBullet # Example import
 
 
-class Player(pygame.sprite.Sprite):
+def _player_placeholder() -> pygame.Surface:
+    """Fallback graphic used when the player sprite is missing."""
+    image = pygame.Surface(
+        (32, 32), pygame.SRCALPHA
+    )  # Use SRCALPHA for potential transparency
+    image.fill((0, 0, 0, 0))  # Transparent background
+    pygame.draw.polygon(
+        image, (0, 200, 255), [(16, 0), (0, 32), (32, 32)]
+    )  # Blue triangle fallback
+    pygame.draw.rect(image, (255, 0, 0), (14, 25, 4, 6))  # Small red rectangle (engine?)
+    return image
+
+
+def _bullet_placeholder() -> pygame.Surface:
+    image = pygame.Surface((5, 15))
+    image.fill((100, 200, 255))  # Light blue fallback
+    return image
+
+
+def _power_bullet_placeholder() -> pygame.Surface:
+    image = pygame.Surface((8, 20))  # Slightly larger fallback
+    image.fill((255, 100, 255))  # Magenta fallback
+    return image
+
+
+class Player(TimerOwner, pygame.sprite.Sprite):
     """Represents the player character."""
 
-    def __init__(self, pos: tuple[int, int]):
+    def __init__(
+        self, pos: tuple[int, int], clock: SimulationClock, timers: TimerWheel
+    ):
         """
         Initializes the player sprite.
 
         Args:
             pos: Initial center position (x, y) for the player.
+            clock: The scene's simulation clock, used for shot cooldowns.
+            timers: The scene's timer service, ends invincibility and powerups.
         """
         super().__init__()
+        self.clock = clock
+        self.timers = timers
 
         # --- Core Attributes ---
         self.speed = 450  # Pixels per second
@@ -37,7 +74,7 @@ class Player(pygame.sprite.Sprite):
         self.health = self.max_health
         self.invincible = False  # Currently invincible?
         self.invincible_duration = 1.5  # Seconds
-        self.invincible_timer = 0.0  # Float for dt accuracy
+        self.invincible_since = 0.0  # Clock time the current i-frames began
 
         # --- Image and Position ---
         self.image = None  # Will be loaded by _load_image
@@ -53,8 +90,7 @@ class Player(pygame.sprite.Sprite):
 
         # --- Powerups ---
         self.active_powerups = []
-        self.powerup_timer_fire_power = 0.0
-        self.powerup_duration_fire_power = 0.0
+        self.powerup_duration_fire_power = 10.0  # Seconds
         self.shield_count = 0
 
         # Note: Removed self.is_alive, use self.alive() inherited from Sprite
@@ -64,24 +100,11 @@ class Player(pygame.sprite.Sprite):
 
     def _load_image(self, pos: tuple[int, int]):
         """Loads the player's image and sets up rect and hitbox."""
-        try:
-            # Load image with transparency support
-            # Make sure 'assets/sprites/player.png' path is correct
-            self.image = pygame.image.load("assets/sprites/player.png").convert_alpha()
-            # Scale if needed, e.g., pygame.transform.scale(self.image, (new_width, new_height))
-        except (FileNotFoundError, pygame.error) as e:
-            print(f"Error loading player image: {e}")
-            # Create a fallback placeholder surface
-            self.image = pygame.Surface(
-                (32, 32), pygame.SRCALPHA
-            )  # Use SRCALPHA for potential transparency
-            self.image.fill((0, 0, 0, 0))  # Transparent background
-            pygame.draw.polygon(
-                self.image, (0, 200, 255), [(16, 0), (0, 32), (32, 32)]
-            )  # Blue triangle fallback
-            pygame.draw.rect(
-                self.image, (255, 0, 0), (14, 25, 4, 6)
-            )  # Small red rectangle (engine?)
+        # The cached surface is shared, copy it because the invincibility
+        # blink changes this sprite's alpha.
+        self.image = load_image(
+            "assets/sprites/player.png", fallback=_player_placeholder
+        ).copy()
 
         self.rect = self.image.get_rect(center=pos)
         # Adjust hitbox size relative to the image (e.g., slightly smaller)
@@ -123,6 +146,7 @@ class Player(pygame.sprite.Sprite):
     def _die(self):
         """Handles player death."""
         print("Player Died!")
+        tracer.instant("player_death")
         # Add death effects (explosion particles, sound) here if needed
         # Example: Make player semi-transparent or change image
         # self.image.set_alpha(100)
@@ -131,11 +155,18 @@ class Player(pygame.sprite.Sprite):
     def _activate_invincibility(self):
         """Activates temporary invincibility."""
         self.invincible = True
-        self.invincible_timer = 0.0  # Reset timer
+        self.invincible_since = self.clock.time
+        self.after("invincible", self.invincible_duration, self._end_invincibility)
         # Ensure sprite is fully visible when invincibility starts
         if self.image:
             self.image.set_alpha(255)
 
+    def _end_invincibility(self):
+        """Timer callback: invincibility frames are over."""
+        self.invincible = False
+        if self.image:
+            self.image.set_alpha(255)  # Ensure fully visible
+
     def handle_movement_input(self, keys: pygame.key.ScancodeWrapper, dt: float):
         """
         Handles player movement based on currently pressed keys.
@@ -174,6 +205,11 @@ class Player(pygame.sprite.Sprite):
         # Update hitbox position after clamping rect
         self.hitbox.center = self.rect.center
 
+    def nudge(self, offset):
+        """Moves the player by an external pull (black holes), staying on screen."""
+        self.rect.center += Vector2(offset)
+        self._clamp_position()
+
     def shoot(self, bullet_group: pygame.sprite.Group):
         """
         Attempts to fire a bullet if cooldown allows.
@@ -182,7 +218,7 @@ class Player(pygame.sprite.Sprite):
             bullet_group: The sprite group to add the new bullet to.
         """
         # Use float time for better accuracy with dt
-        now = pygame.time.get_ticks() / 1000.0
+        now = self.clock.time
         if now - self.last_shot_time >= self.shoot_cooldown:
             self.last_shot_time = now
 
@@ -220,29 +256,14 @@ class Player(pygame.sprite.Sprite):
         if Config.HOLD_HP:
             self.health = self.max_health
         # --- Update Invincibility ---
+        # Invincibility and powerups are ended by timers (see self.after)
         if self.invincible:
-            self.invincible_timer += dt
+            elapsed = self.clock.time - self.invincible_since
             # Blinking effect (alpha changes rapidly)
-            alpha = (
-                255 if int(self.invincible_timer * 12) % 2 == 0 else 100
-            )  # Faster blink
+            alpha = 255 if int(elapsed * 12) % 2 == 0 else 100  # Faster blink
             if self.image:
                 self.image.set_alpha(alpha)
 
-            # Check if invincibility ends
-            if self.invincible_timer >= self.invincible_duration:
-                self.invincible = False
-                self.invincible_timer = 0.0
-                if self.image:
-                    self.image.set_alpha(255)  # Ensure fully visible
-
-        # --- Update Powerup Timer ---
-        if len(self.active_powerups) > 0:
-            if PowerUpType.FIREPOWER in self.active_powerups:
-                self.powerup_timer_fire_power += dt
-                if self.powerup_timer_fire_power >= self.powerup_duration_fire_power:
-                    self.deactivate_power_boost()
-
         # --- Update Hitbox Position ---
         self.rect.center += self.velocity * dt
         # Ensure hitbox stays centered on the player's rect
@@ -269,19 +290,19 @@ class Player(pygame.sprite.Sprite):
         health_fill_rect = pygame.Rect(pos_x, pos_y, fill_width, bar_height)
 
         # Draw background (dark grey)
-        pygame.draw.rect(surface, (80, 80, 80), background_rect)
+        draw_rect(surface, (80, 80, 80), background_rect)
         # Draw health fill (green)
         if fill_width > 0:
-            pygame.draw.rect(surface, (0, 220, 0), health_fill_rect)
+            draw_rect(surface, (0, 220, 0), health_fill_rect)
         # Optional border
-        pygame.draw.rect(surface, (200, 200, 200), background_rect, 1)
+        draw_rect(surface, (200, 200, 200), background_rect, 1)
 
     def _calculate_damage(self) -> (int, bool):
         """Calculates bullet damage, including critical hits."""
         base_damage = 1
         calculated_base_damage = base_damage * (1 + self.killed_enemy_count * 0.5)
         # Apply critical hit chance
-        if random() < self.crit_chance:
+        if _random.random() < self.crit_chance:
             return (
                 calculated_base_damage * 2,
                 True,
@@ -313,16 +334,16 @@ class Player(pygame.sprite.Sprite):
         if PowerUpType.FIREPOWER not in self.active_powerups:
             self.active_powerups.append(PowerUpType.FIREPOWER)
             self.shoot_cooldown = 0.1  # Increase fire rate
-            self.powerup_duration_fire_power = 10
-        else:
-            self.powerup_timer_fire_power = 0
+        # Picking it up again restarts the duration
+        self.after(
+            "firepower", self.powerup_duration_fire_power, self.deactivate_power_boost
+        )
 
     def deactivate_power_boost(self):
         for i in range(len(self.active_powerups)):
             if self.active_powerups[i] == PowerUpType.FIREPOWER:
                 self.active_powerups.pop(i)
-        self.powerup_timer_fire_power = 0
-        self.powerup_duration_fire_power = 0
+        self.cancel_timer("firepower")
         self.shoot_cooldown = 0.2
 
     def _reset_effects(self):
@@ -335,8 +356,6 @@ class Player(pygame.sprite.Sprite):
         """Resets all powerup effects when the timer expires."""
         self.deactivate_power_boost()
         self.active_powerups = []
-        self.powerup_timer_fire_power = 0.0
-        self.powerup_duration_fire_power = 0.0
 
 
 # --- Bullet Classes (Example definitions) ---
@@ -346,13 +365,10 @@ class Bullet(pygame.sprite.Sprite):
     def __init__(self, pos, direction, damage=1, is_critical=False):
         super().__init__()
         self.damage = damage
-        try:
-            self.image = pygame.image.load(
-                "assets/sprites/bullet_player.png"
-            ).convert_alpha()
-        except (FileNotFoundError, pygame.error):
-            self.image = pygame.Surface((5, 15))
-            self.image.fill((100, 200, 255))  # Light blue fallback
+        # Shared, decoded once per process
+        self.image = load_image(
+            "assets/sprites/bullet_player.png", fallback=_bullet_placeholder
+        )
         self.rect = self.image.get_rect(center=pos)
         self.speed = 800
         self.direction = direction.normalize()  # Ensure direction is normalized
@@ -371,13 +387,10 @@ class PowerBullet(Bullet):
     def __init__(self, pos, direction, damage, is_critical=False):
         # Power bullets have higher base damage
         super().__init__(pos, direction, damage, is_critical)
-        try:
-            # Use a different graphic for power bullets
-            self.image = pygame.image.load(
-                "assets/sprites/bullet_player_power.png"
-            ).convert_alpha()
-        except (FileNotFoundError, pygame.error):
-            self.image = pygame.Surface((8, 20))  # Slightly larger fallback
-            self.image.fill((255, 100, 255))  # Magenta fallback
+        # Use a different graphic for power bullets
+        self.image = load_image(
+            "assets/sprites/bullet_player_power.png",
+            fallback=_power_bullet_placeholder,
+        )
         self.rect = self.image.get_rect(center=pos)  # Update rect for new image size
         self.speed = 1000  # Faster speed
@@ -1,8 +1,10 @@
 from enum import Enum
-import random
 import pygame
 from pygame.math import Vector2
 from ..core.config import Config
+from ..core.rng import rng
+
+_random = rng.stream("powerups")
 
 
 class PowerUpType(Enum):
@@ -16,7 +18,7 @@ class PowerUp(pygame.sprite.Sprite):
 
     def __init__(self, enemy_pos):
         super().__init__()
-        self.type = random.choice(list(PowerUpType))
+        self.type = _random.choice(list(PowerUpType))
         colors = {
             PowerUpType.HEALTH: (0, 255, 0),
             PowerUpType.SHIELD: (0, 0, 255),
@@ -0,0 +1,76 @@
+import pygame
+from collections import OrderedDict
+from ..core.config import Config
+
+
+class AssetCache:
+    """按键缓存已解码的表面，同一资源在进程内只解码一次并由所有实例共享。
+
+    缓存有容量上限，超出后淘汰最久未使用的条目。缓存中的表面是共享的，
+    需要修改像素或 alpha 的调用方应自行 copy()。
+    """
+
+    def __init__(self, max_size=64):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, loader):
+        """返回 key 对应的表面；未命中时调用 loader() 生成并缓存"""
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = loader()
+        self._entries[key] = surface
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)  # 淘汰最久未使用的条目
+        return surface
+
+    def invalidate(self, key=None):
+        """移除指定条目；key 为 None 时清空整个缓存（例如显示模式改变后）"""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# 进程级共享缓存
+asset_cache = AssetCache(Config.ASSET_CACHE_SIZE)
+
+
+def load_image(path, fallback=None, alpha=True, size=None):
+    """
+    通过共享缓存加载图像。
+
+    Args:
+        path: 图像文件路径。
+        fallback: 加载失败时生成占位表面的函数；占位表面同样会被缓存，
+            缺失的文件不会在每次调用时重复触发异常。
+        alpha: 是否使用 convert_alpha() 保留透明通道。
+        size: 可选的 (宽, 高)，加载后缩放到该尺寸。
+    """
+
+    def loader():
+        try:
+            image = pygame.image.load(path)
+        except (FileNotFoundError, pygame.error) as e:
+            if fallback is None:
+                raise
+            print(f"Error loading image '{path}': {e}")
+            return fallback()
+        if size is not None:
+            image = pygame.transform.scale(image, size)
+        return image.convert_alpha() if alpha else image.convert()
+
+    return asset_cache.get((path, size, alpha), loader)
@@ -0,0 +1,349 @@
+import math
+
+import numpy as np
+import pygame
+from pygame.sprite import Group
+
+from ..core.config import Config
+from ..entities.bullet import _bullet_image
+from .fields import ForceFields
+from .steering import turn_towards
+
+
+class BulletPool:
+    """
+    敌方子弹池：位置、速度、颜色、类型、存活时间等按列存放在 NumPy 数组里
+    （结构数组 SoA），每帧用一次向量化运算推进、反弹、追踪和剔除所有子弹。
+
+    活跃子弹始终紧凑地排在数组前 count 项，剔除时保持原有顺序，
+    因此绘制顺序与碰撞结果和逐个精灵更新时一致。
+
+    激光、黑洞、震荡波等形状特殊的弹幕仍是精灵：add() 把它们转交给
+    sprites 组，与池中子弹一起更新和绘制；其中的力场（黑洞）同时登记到
+    fields，由 apply_fields() 一次施加到所有子弹。
+
+    prev 列保存上一模拟步的位置（snapshot() 时写入），绘制时可以在
+    prev 与 pos 之间插值。
+    """
+
+    # 子弹类型
+    NORMAL = 0
+    HOMING = 1  # 按 turn_rate 转向目标，超过 lifetime 消失
+    BOUNCE = 2  # 碰到屏幕边缘反弹，反弹 max_bounce 次后消失
+    MIRROR = 3  # 行为同 BOUNCE，单独区分便于统计和调整
+    MINE = 4  # 静止，lifetime 到时向 12 个方向炸开
+
+    SIZE = 8  # 子弹边长（像素）
+    MARGIN = 100  # 超出屏幕多远后剔除
+    TURN_RATE = 120  # 追踪弹每秒最大转向角度
+    MINE_SPEED = 350  # 地雷碎片速度
+    MINE_FRAGMENTS = 12  # 地雷碎片数量
+
+    def __init__(self, capacity=Config.BULLET_POOL_SIZE):
+        self.sprites = Group()
+        self.count = 0
+        self.target = None  # 追踪弹的目标位置（玩家中心）
+        self.fields = ForceFields()
+        self._allocate(capacity)
+
+        # 调色板：颜色 -> 下标，每种颜色共用一张表面
+        self._color_index = {}
+        self._images = []
+
+    def _allocate(self, capacity):
+        self.capacity = capacity
+        self.pos = np.zeros((capacity, 2))
+        self.prev = np.zeros((capacity, 2))
+        self.vel = np.zeros((capacity, 2))
+        self.color = np.zeros(capacity, dtype=np.int32)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self.age = np.zeros(capacity)
+        self.lifetime = np.zeros(capacity)
+        self.bounces = np.zeros(capacity, dtype=np.int32)
+        self.max_bounce = np.zeros(capacity, dtype=np.int32)
+
+    def _columns(self):
+        return (
+            self.pos,
+            self.prev,
+            self.vel,
+            self.color,
+            self.kind,
+            self.age,
+            self.lifetime,
+            self.bounces,
+            self.max_bounce,
+        )
+
+    def _grow(self):
+        """容量不足时翻倍，已有数据原样拷贝"""
+        old = self._columns()
+        count = self.count
+        self._allocate(self.capacity * 2)
+        for new, column in zip(self._columns(), old):
+            new[:count] = column[:count]
+
+    def _palette(self, color):
+        key = tuple(int(c) for c in color[:3])
+        index = self._color_index.get(key)
+        if index is None:
+            index = len(self._images)
+            self._color_index[key] = index
+            self._images.append(_bullet_image(key))
+        return index
+
+    def palette_indices(self, colors):
+        """一组颜色（(n, 3) 数组或颜色序列）对应的调色板下标，供 spawn_many 使用"""
+        lookup = self._color_index.get
+        indices = []
+        for color in np.asarray(colors).tolist():
+            index = lookup(tuple(color))
+            indices.append(self._palette(color) if index is None else index)
+        return np.array(indices, dtype=np.int32)
+
+    # --- 生成 ---
+
+    def spawn(
+        self,
+        pos,
+        direction,
+        speed=400,
+        color=(255, 0, 0),
+        kind=NORMAL,
+        lifetime=math.inf,
+        max_bounce=3,
+    ):
+        """发射一颗子弹；参数含义与原先的 EnemyBullet 相同"""
+        if self.count == self.capacity:
+            self._grow()
+        dx, dy = direction
+        length = math.hypot(dx, dy)
+        if length == 0:
+            dx, dy, length = 0.0, 1.0, 1.0
+
+        i = self.count
+        self.pos[i] = pos
+        self.prev[i] = pos
+        self.vel[i] = (dx / length * speed, dy / length * speed)
+        self.color[i] = self._palette(color)
+        self.kind[i] = kind
+        self.age[i] = 0.0
+        self.lifetime[i] = lifetime
+        self.bounces[i] = 0
+        self.max_bounce[i] = max_bounce
+        self.count = i + 1
+
+    def spawn_many(
+        self, pos, vel, color, kind=NORMAL, lifetime=math.inf, max_bounce=3
+    ):
+        """
+        一次写入一批子弹：pos、vel 为 (n, 2) 数组，color 为调色板下标
+        （标量或长度 n 的数组，见 palette_indices），其余参数同 spawn。
+        """
+        total = len(pos)
+        while self.count + total > self.capacity:
+            self._grow()
+
+        start, end = self.count, self.count + total
+        self.pos[start:end] = pos
+        self.prev[start:end] = pos
+        self.vel[start:end] = vel
+        self.color[start:end] = color
+        self.kind[start:end] = kind
+        self.age[start:end] = 0.0
+        self.lifetime[start:end] = lifetime
+        self.bounces[start:end] = 0
+        self.max_bounce[start:end] = max_bounce
+        self.count = end
+
+    def add(self, *sprites):
+        """非池化的弹幕精灵（激光、黑洞等）"""
+        self.sprites.add(*sprites)
+        for sprite in sprites:
+            if getattr(sprite, "is_force_field", False):
+                self.fields.add(sprite)
+
+    # --- 更新 ---
+
+    def snapshot(self):
+        """记录当前位置，作为下一模拟步的插值起点"""
+        self.prev[: self.count] = self.pos[: self.count]
+
+    def update(self, dt, target=None):
+        self.target = target
+        self.sprites.update(dt)
+
+        n = self.count
+        if not n:
+            return
+        pos = self.pos[:n]
+        vel = self.vel[:n]
+        kind = self.kind[:n]
+        age = self.age[:n]
+        age += dt
+
+        homing = kind == self.HOMING
+        if target is not None and homing.any():
+            self._steer(homing, target, dt)
+
+        bouncing = (kind == self.BOUNCE) | (kind == self.MIRROR)
+        old = pos.copy()
+        moving = kind != self.MINE
+        pos[moving] += vel[moving] * dt
+        if bouncing.any():
+            self._bounce(bouncing, old)
+
+        # 剔除：离开屏幕、超时、反弹次数用尽
+        half = self.SIZE / 2
+        margin = self.MARGIN
+        left = pos[:, 0] - half
+        top = pos[:, 1] - half
+        alive = (
+            (-margin < left)
+            & (left < Config.WIDTH + margin)
+            & (-margin < top)
+            & (top < Config.HEIGHT + margin)
+        )
+        alive |= bouncing | (kind == self.MINE)  # 这两类不按边界剔除
+        alive &= age <= self.lifetime[:n]
+        alive &= self.bounces[:n] < self.max_bounce[:n]
+
+        exploded = (kind == self.MINE) & ~alive
+        if exploded.any():
+            fragments = pos[exploded].copy(), self.color[:n][exploded].copy()
+        else:
+            fragments = None
+
+        if not alive.all():
+            self._compact(alive)
+        if fragments is not None:
+            self._explode(*fragments)
+
+    def _steer(self, mask, target, dt):
+        """追踪弹朝目标转向，每帧最多转 TURN_RATE * dt 度，速率不变"""
+        n = self.count
+        self.vel[:n][mask] = turn_towards(
+            self.pos[:n][mask],
+            self.vel[:n][mask],
+            target,
+            self.TURN_RATE * dt,
+            min_distance=10,
+        )
+
+    def _bounce(self, mask, old):
+        """撞墙的子弹退回上一帧位置并翻转对应的速度分量"""
+        n = self.count
+        pos = self.pos[:n]
+        vel = self.vel[:n]
+        half = self.SIZE / 2
+
+        hit_x = mask & ((pos[:, 0] - half < 0) | (pos[:, 0] + half > Config.WIDTH))
+        vel[hit_x, 0] *= -1
+        pos[hit_x] = old[hit_x]
+
+        # 与逐个更新时相同：垂直方向按水平修正后的位置判断
+        hit_y = mask & ((pos[:, 1] - half < 0) | (pos[:, 1] + half > Config.HEIGHT))
+        vel[hit_y, 1] *= -1
+        pos[hit_y] = old[hit_y]
+
+        self.bounces[:n] += hit_x.astype(np.int32) + hit_y
+
+    def _compact(self, keep):
+        """保留 keep 为 True 的子弹并按原顺序移到数组前部"""
+        n = self.count
+        for column in self._columns():
+            kept = column[:n][keep]
+            column[: len(kept)] = kept
+        self.count = int(keep.sum())
+
+    def _explode(self, positions, colors):
+        """每颗地雷向四周均匀炸出 MINE_FRAGMENTS 颗普通子弹（一次批量写入）"""
+        fragments = self.MINE_FRAGMENTS
+        angles = np.radians(np.arange(fragments) * (360 / fragments))
+        velocity = np.column_stack((np.cos(angles), np.sin(angles))) * self.MINE_SPEED
+        self.spawn_many(
+            np.repeat(positions, fragments, axis=0),
+            np.tile(velocity, (len(positions), 1)),
+            np.repeat(colors, fragments),
+        )
+
+    # --- 效果 ---
+
+    def apply_fields(self, dt, player=None):
+        """力场（黑洞）拉动子弹、弹幕精灵和玩家，见 ForceFields"""
+        self.fields.apply(self, dt, player)
+
+    # --- 碰撞 ---
+
+    def collide_rect(self, rect, ratio=1.0, dokill=True):
+        """
+        与 rect 重叠的子弹数（含 sprites 组中的精灵），语义同
+        spritecollide(..., collided=collide_rect_ratio(ratio))，dokill 时移除命中的子弹。
+        """
+        rect = pygame.Rect(rect)
+        width, height = rect.size
+        target = rect.inflate(width * ratio - width, height * ratio - height)
+        probe = pygame.sprite.Sprite()
+        probe.rect = rect
+        sprite_hits = pygame.sprite.spritecollide(
+            probe,
+            self.sprites,
+            dokill,
+            collided=pygame.sprite.collide_rect_ratio(ratio),
+        )
+
+        n = self.count
+        if not n:
+            return len(sprite_hits)
+        # 与 Rect.inflate 一样把缩放量截断为整数
+        half = (self.SIZE + int(self.SIZE * ratio - self.SIZE)) / 2
+        pos = self.pos[:n]
+        hit = (
+            (pos[:, 0] - half < target.right)
+            & (pos[:, 0] + half > target.left)
+            & (pos[:, 1] - half < target.bottom)
+            & (pos[:, 1] + half > target.top)
+        )
+        count = int(hit.sum())
+        if count and dokill:
+            self._compact(~hit)
+        return len(sprite_hits) + count
+
+    # --- 绘制 ---
+
+    def draw(self, surface, alpha=1.0):
+        # 池中的普通子弹在下，激光、黑洞等大型精灵画在上面
+        self.draw_bullets(surface, alpha)
+        for sprite in self.sprites:
+            draw = getattr(sprite, "draw", None)  # 激光自行绘制（旋转四边形）
+            if draw is not None:
+                draw(surface)
+            else:
+                surface.blit(sprite.image, sprite.rect)
+
+    def draw_bullets(self, surface, alpha=1.0):
+        """
+        只绘制池中的子弹：同色共用一张图，一次 blits 提交。
+        alpha < 1 时画在上一步与当前步之间的插值位置。
+        """
+        n = self.count
+        if not n:
+            return
+        images = self._images
+        half = self.SIZE // 2
+        pos = self.pos[:n]
+        if alpha < 1.0:
+            prev = self.prev[:n]
+            pos = prev + (pos - prev) * alpha
+        topleft = (pos - half).astype(np.int32).tolist()
+        surface.blits(
+            [(images[c], p) for c, p in zip(self.color[:n].tolist(), topleft)], 0
+        )
+
+    def empty(self):
+        self.sprites.empty()
+        self.fields.clear()
+        self.count = 0
+
+    def __len__(self):
+        return self.count + len(self.sprites)
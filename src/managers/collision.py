@@ -0,0 +1,139 @@
+import pygame
+
+from ..core.config import Config
+
+
+class SpatialHash:
+    """
+    均匀网格宽相位：把精灵按 rect 覆盖的格子登记到字典里，查询时只对
+    同格的候选者做精确碰撞测试，代替 pygame.sprite 的两两暴力检测。
+
+    每帧调用 build() 按组的顺序重建。spritecollide / groupcollide 的参数
+    与返回值与 pygame.sprite 的同名函数一致，结果（包括顺序）也相同：
+    候选者按登记顺序排序后再交给 collided 判断。
+
+    宽相位按 rect 划分，collided 判定范围超出 rect 时（如 collide_circle）
+    需用 padding 放宽，保证候选集合不漏掉任何碰撞。
+    """
+
+    def __init__(self, cell_size=Config.COLLISION_CELL_SIZE, padding=0):
+        self.cell_size = cell_size
+        self.padding = padding
+        self._cells = {}
+        self._order = {}  # 精灵 -> 登记顺序
+
+    def clear(self):
+        self._cells.clear()
+        self._order.clear()
+
+    def build(self, sprites):
+        """按 sprites 的顺序重建网格"""
+        self.clear()
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def insert(self, sprite):
+        self._order[sprite] = len(self._order)
+        cells = self._cells
+        left, top, right, bottom = self._span(sprite.rect)
+        for cx in range(left, right + 1):
+            for cy in range(top, bottom + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [sprite]
+                else:
+                    bucket.append(sprite)
+
+    def _span(self, rect):
+        """rect（按 padding 放宽后）覆盖的格子范围，含两端"""
+        size = self.cell_size
+        pad = self.padding
+        left = (rect.left - pad) // size
+        top = (rect.top - pad) // size
+        right = (rect.right - 1 + pad) // size
+        bottom = (rect.bottom - 1 + pad) // size
+        # 宽或高为 0 的 rect 仍占一个格子
+        return left, top, max(left, right), max(top, bottom)
+
+    def candidates(self, rect):
+        """与 rect 同格的存活精灵，按登记顺序排列"""
+        cells = self._cells
+        left, top, right, bottom = self._span(rect)
+        if left == right and top == bottom:
+            # 常见情况：只落在一个格子里，桶内本来就是登记顺序
+            bucket = cells.get((left, top))
+            if not bucket:
+                return []
+            # 已被 kill() 的精灵不再参与检测（与从组里移除后的 pygame 行为一致）
+            return [sprite for sprite in bucket if sprite.alive()]
+
+        found = set()
+        for cx in range(left, right + 1):
+            for cy in range(top, bottom + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        if not found:
+            return []
+        return sorted(
+            (sprite for sprite in found if sprite.alive()),
+            key=self._order.__getitem__,
+        )
+
+    def spritecollide(self, sprite, dokill, collided=None):
+        """同 pygame.sprite.spritecollide(sprite, <网格中的精灵>, dokill, collided)"""
+        candidates = self.candidates(sprite.rect)
+        if not candidates:
+            return []
+        if collided is None or collided is pygame.sprite.collide_rect:
+            rect = sprite.rect
+            hits = [other for other in candidates if rect.colliderect(other.rect)]
+        else:
+            hits = [other for other in candidates if collided(sprite, other)]
+        if dokill:
+            for other in hits:
+                other.kill()
+        return hits
+
+    def groupcollide(self, sprites, dokilla, dokillb, collided=None):
+        """同 pygame.sprite.groupcollide(sprites, <网格中的精灵>, ...)"""
+        if collided is pygame.sprite.collide_rect:
+            collided = None
+        cells = self._cells
+        size = self.cell_size
+        pad = self.padding
+        crashed = {}
+        for sprite in list(sprites):
+            rect = sprite.rect
+            # 内联的单格快速路径：大多数子弹只落在一个格子里
+            left = (rect.left - pad) // size
+            top = (rect.top - pad) // size
+            if (
+                left == (rect.right - 1 + pad) // size
+                and top == (rect.bottom - 1 + pad) // size
+            ):
+                bucket = cells.get((left, top))
+                if not bucket:
+                    continue
+                if collided is None:
+                    hits = [
+                        other
+                        for other in bucket
+                        if rect.colliderect(other.rect) and other.alive()
+                    ]
+                else:
+                    hits = [
+                        other
+                        for other in bucket
+                        if other.alive() and collided(sprite, other)
+                    ]
+                if hits and dokillb:
+                    for other in hits:
+                        other.kill()
+            else:
+                hits = self.spritecollide(sprite, dokillb, collided)
+            if hits:
+                crashed[sprite] = hits
+                if dokilla:
+                    sprite.kill()
+        return crashed
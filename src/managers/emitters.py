@@ -0,0 +1,58 @@
+import heapq
+
+
+class EmitterScheduler:
+    """
+    敌机射击调度：按下一次开火的模拟时间排序的小顶堆。
+
+    敌机生成时登记一次（register），之后每步只弹出开火时间已到的敌机，
+    调用 enemy.shoot_pattern(target) 并按 enemy.fire_interval 排入下一次。
+    每次开火只写入登记的目标一次。shoot_pattern 返回 False 表示条件不满足
+    （例如隐形敌机尚未显形），下一步再试。
+    已死亡的敌机在弹出时丢弃，不需要显式注销。
+    """
+
+    def __init__(self, clock, target):
+        self.clock = clock
+        self.target = target  # 默认目标（敌方子弹池）
+        self._heap = []  # (开火时间, 序号, 敌机)
+        self._registered = set()
+        self._sequence = 0  # 同一时间开火的敌机按登记顺序，结果可重现
+        self.fired = 0  # 上一步开火的敌机数
+
+    def register(self, enemy, target=None):
+        """登记敌机，第一次开火在 fire_interval 秒之后；重复登记不产生影响"""
+        if enemy in self._registered:
+            return
+        enemy.emitters = self
+        enemy.fire_target = self.target if target is None else target
+        self._registered.add(enemy)
+        self._push(self.clock.time + enemy.fire_interval, enemy)
+
+    def _push(self, time, enemy):
+        heapq.heappush(self._heap, (time, self._sequence, enemy))
+        self._sequence += 1
+
+    def update(self):
+        now = self.clock.time
+        heap = self._heap
+        retry = []
+        fired = 0
+        while heap and heap[0][0] <= now:
+            due, _, enemy = heapq.heappop(heap)
+            if not enemy.alive():
+                self._registered.discard(enemy)
+                continue
+            if enemy.shoot_pattern(enemy.fire_target) is False:
+                retry.append(enemy)
+                continue
+            fired += 1
+            # 从计划的开火时间排下一次：开火总落在步边界上，从 now 排会每次
+            # 多等不足一步的时间，节奏越来越慢
+            self._push(due + enemy.fire_interval, enemy)
+        for enemy in retry:
+            self._push(now, enemy)  # 本步已处理完，下一步弹出；开火后从这里重新计节奏
+        self.fired = fired
+
+    def __len__(self):
+        return len(self._registered)
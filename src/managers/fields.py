@@ -0,0 +1,142 @@
+import numpy as np
+
+from ..core.config import Config
+from ..entities.bullet import EnemyBullet
+
+_STRIDE = 1 << 20  # 网格键 = 行 * _STRIDE + 列，列号远小于 _STRIDE / 2
+
+
+class ForceFields:
+    """
+    力场系统：黑洞等吸引体登记为力场，每步一次向量化计算所有力场对
+    抛射物的合力，代替每个黑洞各自遍历全部子弹。
+
+    力场对象需提供 field_center、field_radius（作用半径）、field_strength
+    （拉力，像素/秒，越靠近中心越大）、player_force（对玩家的拉力，0 表示
+    不影响玩家）以及 alive()；死亡的力场在下一步自动移除。
+
+    受力对象与原先黑洞遍历的一致：池中的子弹和 EnemyBullet 精灵（震荡波），
+    激光不受影响。玩家在同一步内直接移动（Player.nudge），不改动 velocity。
+
+    子弹池中的子弹先按 cell_size 的网格排序，每个力场只查询半径覆盖的
+    格子行（二分查找），不在范围内的子弹不参与计算。所有力场的拉力按
+    同一时刻的位置计算后一起累加。
+    """
+
+    def __init__(self, cell_size=Config.FIELD_CELL_SIZE):
+        self.cell_size = cell_size
+        self._fields = []
+        self.pairs = 0  # 上一步受力的（力场, 对象）对数
+
+    def add(self, field):
+        self._fields.append(field)
+
+    def clear(self):
+        self._fields.clear()
+
+    def __len__(self):
+        return len(self._fields)
+
+    def apply(self, pool, dt, player=None):
+        """对 pool 中的子弹、弹幕精灵以及 player 施加所有力场的合力"""
+        self._fields = fields = [field for field in self._fields if field.alive()]
+        self.pairs = 0
+        if not fields:
+            return
+        centers = np.array([field.field_center for field in fields], dtype=float)
+        radius = np.array([field.field_radius for field in fields], dtype=float)
+        strength = np.array([field.field_strength for field in fields], dtype=float)
+
+        n = pool.count
+        if n:
+            pos = pool.pos[:n]
+            field_ids, ids = self._query(pos, centers, radius)
+            pos += self._displacement(
+                pos, field_ids, ids, centers, radius, strength * dt
+            )
+
+        # 形状特殊的敌方弹幕精灵（如震荡波）数量很少，直接两两计算
+        sprites = [sprite for sprite in pool.sprites if isinstance(sprite, EnemyBullet)]
+        if sprites:
+            pos = np.array([sprite.rect.center for sprite in sprites], dtype=float)
+            field_ids = np.repeat(np.arange(len(fields)), len(sprites))
+            ids = np.tile(np.arange(len(sprites)), len(fields))
+            pos += self._displacement(
+                pos, field_ids, ids, centers, radius, strength * dt
+            )
+            for sprite, center in zip(sprites, pos.tolist()):
+                sprite.rect.center = center
+
+        if player is not None and player.alive():
+            force = np.array([field.player_force for field in fields], dtype=float)
+            if force.any():
+                pull = self._displacement(
+                    np.array([player.rect.center], dtype=float),
+                    np.arange(len(fields)),
+                    np.zeros(len(fields), dtype=np.intp),
+                    centers,
+                    radius,
+                    force * dt,
+                )
+                if pull.any():
+                    player.nudge(pull[0].tolist())
+
+    def _query(self, pos, centers, radius):
+        """返回每个力场半径覆盖的格子中的子弹：(力场下标数组, 子弹下标数组)"""
+        size = self.cell_size
+        cells = np.floor(pos / size).astype(np.int64)
+        keys = cells[:, 1] * _STRIDE + cells[:, 0]
+        order = np.argsort(keys)  # 受力按下标累加，同格内的顺序无关
+        keys = keys[order]
+
+        # 每个力场覆盖的每一行格子：该行列号在 [left, right] 之间的子弹
+        # 在排序后的键上是连续的一段，用二分查找求出这一段的起止
+        low = np.floor((centers - radius[:, None]) / size).astype(np.int64)
+        high = np.floor((centers + radius[:, None]) / size).astype(np.int64)
+        rows_per_field = high[:, 1] - low[:, 1] + 1
+        field_of_row = np.repeat(np.arange(len(centers)), rows_per_field)
+        first_index = np.cumsum(rows_per_field) - rows_per_field
+        rows = np.repeat(low[:, 1] - first_index, rows_per_field) + np.arange(
+            len(field_of_row)
+        )
+        starts = np.searchsorted(keys, rows * _STRIDE + low[field_of_row, 0])
+        ends = np.searchsorted(
+            keys, rows * _STRIDE + high[field_of_row, 0], side="right"
+        )
+
+        # 把所有 [start, end) 段展开成一个下标数组
+        lengths = ends - starts
+        total = int(lengths.sum())
+        if not total:
+            empty = np.zeros(0, dtype=np.intp)
+            return empty, empty
+        segment_start = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        return (
+            np.repeat(field_of_row, lengths),
+            order[segment_start + np.arange(total)],
+        )
+
+    def _displacement(self, pos, field_ids, ids, centers, radius, strength):
+        """
+        各点朝力场中心的合位移：距离 d 小于半径 R 时为
+        strength * (1 - d / R)，方向指向中心（与中心重合的点不受力）。
+        """
+        offset = centers[field_ids] - pos[ids]
+        distance = np.hypot(offset[:, 0], offset[:, 1])
+        reach = radius[field_ids]
+        inside = (distance > 0) & (distance < reach)
+        count = int(inside.sum())
+        if not count:
+            return np.zeros_like(pos)
+        d = distance[inside]
+        step = strength[field_ids[inside]] * (1 - d / reach[inside]) / d
+        pull = offset[inside] * step[:, None]
+        # 同一点受多个力场作用时按下标累加
+        ids = ids[inside]
+        self.pairs += count
+        return np.column_stack(
+            (
+                np.bincount(ids, pull[:, 0], minlength=len(pos)),
+                np.bincount(ids, pull[:, 1], minlength=len(pos)),
+            )
+        )
@@ -0,0 +1,74 @@
+import pygame
+from ..core.config import Config
+from .assets import AssetCache
+
+
+class FontRegistry:
+    """按 (字体名, 字号, 粗体, 斜体) 缓存字体对象，每种组合只加载一次。
+
+    SysFont 每次调用都会扫描系统字体并重新加载字形文件，不能放在每帧
+    或每次命中的路径上。字体名为 None 时使用 pygame 自带的默认字体。
+    """
+
+    def __init__(self):
+        self._fonts = {}
+
+    def get(self, name=None, size=24, bold=False, italic=False):
+        key = (name, size, bold, italic)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._load(name, size, bold, italic)
+            self._fonts[key] = font
+        return font
+
+    @staticmethod
+    def _load(name, size, bold, italic):
+        if name is not None:
+            try:
+                return pygame.font.SysFont(name, size, bold=bold, italic=italic)
+            except pygame.error:
+                print(f"Warning: font '{name}' not available, using Pygame default.")
+        font = pygame.font.Font(None, size)
+        font.set_bold(bold)
+        font.set_italic(italic)
+        return font
+
+    def __len__(self):
+        return len(self._fonts)
+
+
+# 进程级共享实例
+fonts = FontRegistry()
+text_cache = AssetCache(Config.TEXT_CACHE_SIZE)
+
+
+def render_text(font, text, color, antialias=True):
+    """
+    通过共享缓存渲染文字，内容不变的文字只渲染一次。
+
+    返回的表面是共享的，需要修改 alpha 或像素的调用方应自行 copy()，
+    或用 render_faded() 取得半透明的版本。
+    """
+    color = tuple(color)
+    return text_cache.get(
+        (font, text, color, antialias), lambda: font.render(text, antialias, color)
+    )
+
+
+def render_faded(font, text, color, alpha, antialias=True):
+    """
+    半透明的 render_text：alpha（0-255）量化到 TEXT_FADE_STEPS 级，每级的
+    表面同样共享缓存，淡出动画不必给每个实例复制一张表面。
+    """
+    steps = Config.TEXT_FADE_STEPS
+    level = max(0, min(steps, round(alpha * steps / 255)))
+    if level == steps:
+        return render_text(font, text, color, antialias)
+    color = tuple(color)
+
+    def fade():
+        image = render_text(font, text, color, antialias).copy()
+        image.set_alpha(level * 255 // steps)
+        return image
+
+    return text_cache.get((font, text, color, antialias, level), fade)
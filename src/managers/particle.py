@@ -1,25 +1,105 @@
+import numpy as np
 import pygame
-from pygame.math import Vector2
-from random import uniform
 from ..core.config import Config
+from ..core.rng import rng
 
-class HitParticle(pygame.sprite.Sprite):
-    def __init__(self, pos, color=(255,0,0)):
-        super().__init__()
-        self.image = pygame.Surface((8,8), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, color, (4,4), 4)
-        self.rect = self.image.get_rect(center=pos)
-        self.lifetime = 0.3  # 秒
-        self.age = 0
-        self.velocity = Vector2(
-            uniform(-100, 100),
-            uniform(-100, 100)
-        )
+
+class ParticleEmitter:
+    """
+    粒子池：固定容量的 NumPy 数组，按环形顺序复用槽位，运行时不再创建表面。
+
+    容量用尽时新粒子覆盖最早发射的粒子。每种颜色只预渲染一次，
+    按 ALPHA_LEVELS 个透明度档位各存一份，绘制时直接按档位取图。
+    prev 保存上一模拟步的位置，供绘制时插值。
+    """
+
+    SIZE = 8  # 粒子直径（像素）
+    LIFETIME = 0.3  # 秒
+    SPEED = 100  # 初速度各分量的范围 [-SPEED, SPEED]
+    ALPHA_LEVELS = 16
+
+    def __init__(self, capacity=Config.PARTICLE_CAPACITY):
+        self.capacity = capacity
+        self.pos = np.zeros((capacity, 2))
+        self.prev = np.zeros((capacity, 2))
+        self.vel = np.zeros((capacity, 2))
+        self.age = np.full(capacity, self.LIFETIME)  # age >= LIFETIME 即空闲
+        self.color = np.zeros(capacity, dtype=np.int32)
+        self._head = 0  # 下一个写入的槽位
+        self._rng = rng.numpy("particles")
+
+        self._color_index = {}
+        self._frames = []  # 颜色下标 -> 各透明度档位的表面
+
+    def _palette(self, color):
+        key = tuple(color)
+        index = self._color_index.get(key)
+        if index is None:
+            index = len(self._frames)
+            self._color_index[key] = index
+            self._frames.append(self._render(key))
+        return index
+
+    def _render(self, color):
+        radius = self.SIZE // 2
+        base = pygame.Surface((self.SIZE, self.SIZE), pygame.SRCALPHA)
+        pygame.draw.circle(base, color, (radius, radius), radius)
+        frames = []
+        for level in range(self.ALPHA_LEVELS):
+            frame = base.copy()
+            frame.set_alpha(255 * (level + 1) // self.ALPHA_LEVELS)
+            frames.append(frame)
+        return frames
+
+    def emit(self, pos, count, color=(255, 0, 0)):
+        """在 pos 处发射 count 个粒子，速度随机"""
+        count = min(count, self.capacity)
+        slots = (self._head + np.arange(count)) % self.capacity
+        self._head = (self._head + count) % self.capacity
+
+        self.pos[slots] = pos
+        self.prev[slots] = pos
+        self.vel[slots] = self._rng.uniform(-self.SPEED, self.SPEED, (count, 2))
+        self.age[slots] = 0.0
+        self.color[slots] = self._palette(color)
+
+    def snapshot(self):
+        self.prev[:] = self.pos
 
     def update(self, dt):
-        self.age += dt
-        self.rect.center += self.velocity * dt
-        self.image.set_alpha(255 * (1 - self.age/self.lifetime))
-        
-        if self.age >= self.lifetime:
-            self.kill()
\ No newline at end of file
+        live = self.age < self.LIFETIME
+        if not live.any():
+            return
+        self.pos[live] += self.vel[live] * dt
+        self.age[live] += dt
+
+    def draw(self, surface, alpha=1.0):
+        live = np.flatnonzero(self.age < self.LIFETIME)
+        if not len(live):
+            return
+        # 透明度 255 * (1 - age / LIFETIME) 量化到 ALPHA_LEVELS 档
+        fade = 1 - self.age[live] / self.LIFETIME
+        levels = np.clip(
+            (fade * self.ALPHA_LEVELS).astype(np.int32), 0, self.ALPHA_LEVELS - 1
+        )
+        pos = self.pos[live]
+        if alpha < 1.0:
+            prev = self.prev[live]
+            pos = prev + (pos - prev) * alpha
+        topleft = (pos - self.SIZE // 2).astype(np.int32).tolist()
+        frames = self._frames
+        surface.blits(
+            [
+                (frames[c][level], p)
+                for c, level, p in zip(
+                    self.color[live].tolist(), levels.tolist(), topleft
+                )
+            ],
+            0,
+        )
+
+    def clear(self):
+        self.age[:] = self.LIFETIME
+
+    def __len__(self):
+        return int((self.age < self.LIFETIME).sum())
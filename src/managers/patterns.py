@@ -0,0 +1,184 @@
+import math
+
+import numpy as np
+
+from ..core.rng import rng
+from .bullet_pool import BulletPool
+
+_np_random = rng.numpy("patterns")
+
+GOLDEN_ANGLE = 137.5  # 黄金角（度），螺旋上相邻两颗子弹的夹角
+
+
+class BulletPattern:
+    """
+    编译后的弹幕：每颗子弹相对发射点的偏移、方向、速度和颜色预先算成
+    NumPy 表，fire() 只需按当前角度整体旋转一次，再批量写入子弹池。
+
+    fixed_direction 为 True 时方向是屏幕上的绝对方向，不随发射角度旋转
+    （例如绕 Boss 一圈、全部向下飞的护盾弹）。
+    """
+
+    def __init__(
+        self,
+        offsets,
+        directions,
+        speeds,
+        colors,
+        fixed_direction=False,
+        kind=BulletPool.NORMAL,
+        lifetime=math.inf,
+        max_bounce=3,
+        speed_jitter=0,
+        direction_jitter=0.0,
+        color_range=None,
+        spec=None,
+    ):
+        self.offsets = offsets  # (n, 2)
+        self.directions = directions  # (n, 2) 单位向量
+        self.speeds = speeds  # (n,)
+        self.colors = colors  # (n, 3) 整数 RGB
+        self.fixed_direction = fixed_direction
+        self.kind = kind
+        self.lifetime = lifetime
+        self.max_bounce = max_bounce
+        self.speed_jitter = speed_jitter  # 速度随机增减的整数范围
+        self.direction_jitter = direction_jitter  # 方向随机偏转的角度范围（度）
+        self.color_range = color_range  # (最小 RGB, 最大 RGB)，每颗随机取色
+        self.spec = spec  # 编译前的定义
+        self._pool = None  # 调色板下标按子弹池缓存（颜色固定时）
+        self._color_indices = None
+
+    def __len__(self):
+        return len(self.speeds)
+
+    def _colors_for(self, pool):
+        if self.color_range is not None:
+            low, high = np.asarray(self.color_range)
+            samples = _np_random.random((len(self), 3))
+            return pool.palette_indices(low + (samples * (high - low + 1)).astype(int))
+        if self._pool is not pool:
+            self._pool = pool
+            self._color_indices = pool.palette_indices(self.colors)
+        return self._color_indices
+
+    def fire(self, pool, origin, angle=0.0):
+        """以 origin 为发射点、整体旋转 angle 度，把一轮子弹批量写入 pool"""
+        offsets = self.offsets
+        directions = self.directions
+        if angle:
+            rad = math.radians(angle)
+            c, s = math.cos(rad), math.sin(rad)
+            rotation = np.array([[c, s], [-s, c]])  # 行向量右乘即旋转
+            offsets = offsets @ rotation
+            if not self.fixed_direction:
+                directions = directions @ rotation
+        if self.direction_jitter:
+            jitter = np.radians(
+                _np_random.uniform(
+                    -self.direction_jitter, self.direction_jitter, len(self)
+                )
+            )
+            c, s = np.cos(jitter), np.sin(jitter)
+            x, y = directions[:, 0], directions[:, 1]
+            directions = np.column_stack((x * c - y * s, x * s + y * c))
+        speeds = self.speeds
+        if self.speed_jitter:
+            jitter = self.speed_jitter
+            speeds = speeds + _np_random.integers(-jitter, jitter + 1, len(self))
+        pool.spawn_many(
+            offsets + np.asarray(origin, dtype=float),
+            directions * speeds[:, None],
+            self._colors_for(pool),
+            kind=self.kind,
+            lifetime=self.lifetime,
+            max_bounce=self.max_bounce,
+        )
+
+
+def _unit(angles):
+    rad = np.radians(angles)
+    return np.column_stack((np.cos(rad), np.sin(rad)))
+
+
+def _ramp(spec, key, base, variables):
+    """base 加上各变量（index、col、row）乘以 spec[key] 中对应的步长"""
+    value = np.asarray(base, dtype=float) + np.zeros((len(variables["index"]), 1))
+    for name, step in spec.get(key, {}).items():
+        value = value + variables[name][:, None] * np.asarray(step, dtype=float)
+    return value
+
+
+def compile_pattern(spec):
+    """
+    把弹幕定义（dict）编译成 BulletPattern。形状（shape）：
+
+        ring    count 颗均匀分布在一圈上，radius 为发射半径
+        spiral  第 i 颗在 i * step 度、半径 i * radius_step 处（默认黄金角）
+        grid    cols x rows 的方阵，间距 spacing，逐列排列
+        fan     count 颗均匀分布在 spread 度的扇形内，以发射角度为中心
+
+    ring、spiral 的方向为径向再偏转 heading 度；grid、fan 为 heading 度。
+    给出 direction 时改为固定的屏幕方向（度）。speed、color 是基础值，
+    speed_ramp、color_ramp 按变量 index（及 grid 的 col、row）给出每步增量；
+    speed_jitter、direction_jitter、color_range 在每次发射时随机变化。
+    kind、lifetime、max_bounce 同 BulletPool.spawn。
+    """
+    shape = spec["shape"]
+    heading = spec.get("heading", 0.0)
+    if shape == "ring":
+        count = spec["count"]
+        angles = spec.get("start", 0.0) + np.arange(count) * (360 / count)
+        offsets = _unit(angles) * spec.get("radius", 0.0)
+        headings = angles + heading
+        variables = {"index": np.arange(count)}
+    elif shape == "spiral":
+        count = spec["count"]
+        index = np.arange(count)
+        angles = spec.get("start", 0.0) + index * spec.get("step", GOLDEN_ANGLE)
+        offsets = _unit(angles) * (index * spec.get("radius_step", 0.0))[:, None]
+        headings = angles + heading
+        variables = {"index": index}
+    elif shape == "grid":
+        cols, rows = spec["cols"], spec["rows"]
+        col, row = np.divmod(np.arange(cols * rows), rows)
+        offsets = np.column_stack((col, row)) * float(spec["spacing"])
+        headings = np.full(cols * rows, float(heading))
+        variables = {"index": np.arange(cols * rows), "col": col, "row": row}
+    elif shape == "fan":
+        count = spec["count"]
+        spread = spec["spread"]
+        if count > 1:
+            headings = heading - spread / 2 + np.arange(count) * (spread / (count - 1))
+        else:
+            headings = np.full(count, float(heading))  # 单颗沿扇形中线
+        offsets = np.zeros((count, 2))
+        variables = {"index": np.arange(count)}
+    else:
+        raise ValueError(f"unknown bullet pattern shape: {shape!r}")
+
+    fixed_direction = "direction" in spec
+    if fixed_direction:
+        headings = np.full(len(offsets), float(spec["direction"]))
+    speeds = _ramp(spec, "speed_ramp", spec.get("speed", 400), variables)[:, 0]
+    colors = _ramp(spec, "color_ramp", spec.get("color", (255, 0, 0)), variables)
+    color_range = spec.get("color_range")
+    return BulletPattern(
+        offsets,
+        _unit(headings),
+        speeds,
+        np.clip(colors, 0, 255).astype(np.int32),
+        fixed_direction=fixed_direction,
+        kind=spec.get("kind", BulletPool.NORMAL),
+        lifetime=spec.get("lifetime", math.inf),
+        max_bounce=spec.get("max_bounce", 3),
+        speed_jitter=spec.get("speed_jitter", 0),
+        direction_jitter=spec.get("direction_jitter", 0.0),
+        color_range=color_range,
+        spec=spec,
+    )
+
+
+def compile_patterns(specs):
+    """编译一组命名的弹幕定义（模块加载时调用一次）"""
+    return {name: compile_pattern(spec) for name, spec in specs.items()}
@@ -27,12 +27,16 @@ class ScoreManager:
         self.last_hit_time = 0.0
         print("ScoreManager reset.")  # 添加打印信息方便调试
 
-    def add_score(self, base_value):
-        """根据基础分值增加分数，并处理连击"""
-        # 获取当前时间（秒）
-        # 确保 pygame.init() 已经被调用
+    def add_score(self, base_value, now=None):
+        """
+        根据基础分值增加分数，并处理连击。
+
+        now 为当前时间（秒），游戏场景传入模拟时钟的时间；
+        省略时使用 pygame.time.get_ticks()（墙钟）。
+        """
         try:
-            now = pygame.time.get_ticks() / 1000.0
+            if now is None:
+                now = pygame.time.get_ticks() / 1000.0
         except pygame.error:
             # 如果 Pygame 尚未初始化（例如在测试环境中），
             # 可以使用 time 模块，但这在实际游戏中不推荐
@@ -1,19 +1,34 @@
 # src/managers/spawner.py
 import pygame
-import random
 import math
+import time
+from collections import deque
+from functools import partial
 from pygame.math import Vector2
 from ..core.config import Config
+from ..core.rng import rng
+from ..core.trace import tracer
 from ..entities.enemy import *
 
+_random = rng.stream("spawner")
+
 
 class Spawner:
-    def __init__(self):
+    def __init__(self, clock, timers, emitters):
+        self.clock = clock  # 场景的模拟时钟，交给生成的每个敌机
+        self.timers = timers  # 计时服务，敌机的冷却和持续时间在此登记
+        self.emitters = emitters  # 射击调度，生成的敌机在此登记开火节奏
         self.wave = 0  # 当前波次（从0开始计数）
         self.boss_wave_interval = 5  # 每5波生成BOSS
         self.spawn_timer = 0.0
         self.base_spawn_interval = 10.0
         self.active_boss = None  # 当前活跃的BOSS
+        self.boss_pending = False  # BOSS 已排入生成队列、尚未构造
+
+        # 生成队列：每项为 builder(enemy_group)，构造敌机并加入组
+        self.spawn_queue = deque()
+        self.spawned = 0  # 累计构造的敌机数
+        self._recent_spawns = deque()  # 最近一秒内每次构造的模拟时间
 
         # 难度曲线参数
         self.difficulty_curve = {
@@ -32,7 +47,11 @@ class Spawner:
             return phase
 
     def update(self, dt, enemy_group):
-        """更新生成逻辑"""
+        """更新生成逻辑：按波次规则排队，再在本步预算内构造排队的敌机"""
+        self._schedule(dt, enemy_group)
+        self._drain_queue(enemy_group)
+
+    def _schedule(self, dt, enemy_group):
         self.spawn_timer += dt
 
         # BOSS存活期间暂停生成普通敌机
@@ -43,7 +62,7 @@ class Spawner:
 
         # BOSS波次处理
         if self.wave % self.boss_wave_interval == 0 and self.wave > 0:
-            if not self.active_boss:
+            if not self.active_boss and not self.boss_pending:
                 self._spawn_boss(enemy_group, current_phase)
         else:
             # 动态调整普通波次生成间隔
@@ -65,10 +84,53 @@ class Spawner:
     def _spawn_wave(self, enemy_group, phase):
         """生成普通敌机波次"""
         wave_config = self._generate_wave_config(phase)
+        tracer.instant(
+            "wave_start", wave=self.wave + 1, phase=phase, count=wave_config["count"]
+        )
 
+        # 类型和位置在排队时就确定（波次布局与随机序列不受构造时机影响）
         for _ in range(wave_config["count"]):
-            enemy = self._create_enemy(wave_config)
-            enemy_group.add(enemy)
+            enemy_class, pos = self._roll_enemy(wave_config)
+            self.spawn_queue.append(
+                partial(self._build_enemy, enemy_class, pos, wave_config, self.wave)
+            )
+
+    def _drain_queue(self, enemy_group):
+        """
+        构造排队的敌机，直到达到本步的数量上限 SPAWN_PER_TICK
+        或耗时上限 SPAWN_BUDGET_MS（设置时）。每步至少构造一个。
+        """
+        queue = self.spawn_queue
+        if queue:
+            budget = Config.SPAWN_BUDGET_MS / 1000
+            start = time.perf_counter()
+            built = 0
+            while queue and built < max(Config.SPAWN_PER_TICK, 1):
+                if budget and built and time.perf_counter() - start >= budget:
+                    break
+                self._build_next(enemy_group)
+                built += 1
+            tracer.counter("spawner", queued=len(queue), built=built)
+
+        recent = self._recent_spawns
+        while recent and self.clock.time - recent[0] >= 1.0:
+            recent.popleft()
+
+    def _build_next(self, enemy_group):
+        """构造队首的敌机，计入累计数和 spawn_rate"""
+        self.spawn_queue.popleft()(enemy_group)
+        self.spawned += 1
+        self._recent_spawns.append(self.clock.time)
+
+    @property
+    def spawn_rate(self):
+        """最近一秒（模拟时间）构造的敌机数"""
+        return len(self._recent_spawns)
+
+    def flush(self, enemy_group):
+        """立即构造队列中的全部敌机（基准场景等需要马上就位时使用）"""
+        while self.spawn_queue:
+            self._build_next(enemy_group)
 
     def _generate_wave_config(self, phase):
         """生成波次配置"""
@@ -97,21 +159,38 @@ class Spawner:
         return types
 
     def _create_enemy(self, wave_config):
-        """创建敌机实例并应用难度增强"""
-        EnemyClass = random.choice(wave_config["enemy_types"])
+        """立即创建敌机实例并应用难度增强（不经过生成队列）"""
+        enemy_class, pos = self._roll_enemy(wave_config)
+        return self._make_enemy(enemy_class, pos, wave_config, self.wave)
+
+    def _roll_enemy(self, wave_config):
+        """随机选择敌机类型和生成位置"""
+        enemy_class = _random.choice(wave_config["enemy_types"])
         pos = Vector2(
-            random.randint(50, Config.WIDTH - 50),
-            random.randint(-300, -100),  # 更高的生成位置
+            _random.randint(50, Config.WIDTH - 50),
+            _random.randint(-300, -100),  # 更高的生成位置
         )
+        return enemy_class, pos
 
-        enemy = EnemyClass(pos)
+    def _make_enemy(self, enemy_class, pos, wave_config, wave):
+        enemy = enemy_class(pos)
         enemy.hp *= wave_config["hp_multiplier"]
         enemy.speed *= wave_config["speed_multiplier"]
-        enemy.score_value = int(enemy.score_value * (1.1**self.wave))
+        enemy.score_value = int(enemy.score_value * (1.1**wave))
+        enemy.attach(self.clock, self.timers, self.emitters)
         return enemy
 
+    def _build_enemy(self, enemy_class, pos, wave_config, wave, enemy_group):
+        enemy_group.add(self._make_enemy(enemy_class, pos, wave_config, wave))
+
     def _spawn_boss(self, enemy_group, phase):
+        """BOSS 与普通敌机走同一个生成队列，排在本波剩余成员之后"""
+        self.boss_pending = True
+        self.spawn_queue.append(partial(self._build_boss, phase))
+
+    def _build_boss(self, phase, enemy_group):
         """生成阶段BOSS"""
+        self.boss_pending = False
         self.active_boss = Boss()
         self.active_boss.set_enemies_group(enemy_group)
 
@@ -174,7 +253,10 @@ class Spawner:
                 ),
             )
 
+        # attack_speed 已按阶段调整
+        self.active_boss.attach(self.clock, self.timers, self.emitters)
         enemy_group.add(self.active_boss)
+        tracer.instant("boss_spawn", wave=self.wave, phase=phase)
         print(f"⚡ 第{phase}阶段BOSS登场！当前波次：{self.wave}")
 
     def reset(self):
@@ -182,3 +264,5 @@ class Spawner:
         self.wave = 0
         self.spawn_timer = 0.0
         self.active_boss = None
+        self.boss_pending = False
+        self.spawn_queue.clear()
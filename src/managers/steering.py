@@ -0,0 +1,44 @@
+import numpy as np
+
+
+def turn_towards(pos, vel, target, max_turn, min_distance=0.0):
+    """
+    一批追踪体朝 target 转向：pos、vel 为 (n, 2) 数组，每个最多转 max_turn 度
+    （turn_rate * dt），始终沿较小的夹角转，速率不变；与目标的距离不超过
+    min_distance 时保持原方向。返回新的速度数组。
+    """
+    to_target = np.asarray(target, dtype=float) - pos
+    far = np.hypot(to_target[:, 0], to_target[:, 1]) > min_distance
+
+    heading = np.arctan2(vel[:, 1], vel[:, 0])
+    wanted = np.arctan2(to_target[:, 1], to_target[:, 0])
+    turn = (wanted - heading + np.pi) % (2 * np.pi) - np.pi
+    max_turn = np.radians(max_turn)
+    heading += np.where(far, np.clip(turn, -max_turn, max_turn), 0.0)
+
+    speed = np.hypot(vel[:, 0], vel[:, 1])
+    return np.column_stack((np.cos(heading) * speed, np.sin(heading) * speed))
+
+
+def steer_sprites(sprites, target, dt):
+    """
+    精灵版的批量转向：turn_speed（度/秒）不为 None 的精灵（追踪敌机）
+    一起做一次 turn_towards，结果写回各自的 speed。
+    """
+    if target is None:
+        return
+    steering = [sprite for sprite in sprites if sprite.turn_speed is not None]
+    if not steering:
+        return
+    # 每行：中心 x、y，速度 x、y，转向速度
+    state = np.array(
+        [
+            (*sprite.rect.center, sprite.speed.x, sprite.speed.y, sprite.turn_speed)
+            for sprite in steering
+        ],
+        dtype=float,
+    )
+    vel = turn_towards(state[:, 0:2], state[:, 2:4], target, state[:, 4] * dt)
+    for sprite, (vx, vy) in zip(steering, vel.tolist()):
+        sprite.speed.update(vx, vy)
+
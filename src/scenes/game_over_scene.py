@@ -1,13 +1,14 @@
 import pygame
 from pygame.locals import *
 from ..core.config import Config
+from ..managers.fonts import fonts, render_text
 
 
 class GameOverScene:
     def __init__(self, game):
         self.game = game
-        self.font = pygame.font.Font(None, 72)  # 主标题字体
-        self.info_font = pygame.font.Font(None, 36)  # 分数信息字体
+        self.font = fonts.get(None, 72)  # 主标题字体
+        self.info_font = fonts.get(None, 36)  # 分数信息字体
 
     def handle_event(self, event):
         if event.type == KEYDOWN:
@@ -21,9 +22,11 @@ class GameOverScene:
     def update(self, dt):
         pass
 
-    def render(self, surface):
+    def render_background(self, surface):
         surface.fill((0, 0, 0))
 
+    def render(self, surface):
+
         # 获取分数数据
         score_manager = self.game.score_manager
         current_score = score_manager.current_score
@@ -31,15 +34,15 @@ class GameOverScene:
         high_score = high_scores[0]["score"] if high_scores else 0
 
         # 主标题
-        title_text = self.font.render("GAME OVER", True, (255, 0, 0))
+        title_text = render_text(self.font, "GAME OVER", (255, 0, 0))
         title_rect = title_text.get_rect(
             center=(Config.WIDTH // 2, Config.HEIGHT // 2 - 80)
         )
         surface.blit(title_text, title_rect)
 
         # 当前分数
-        current_text = self.info_font.render(
-            f"Current Score: {current_score}", True, (255, 255, 255)
+        current_text = render_text(
+            self.info_font, f"Current Score: {current_score}", (255, 255, 255)
         )
         current_rect = current_text.get_rect(
             center=(Config.WIDTH // 2, Config.HEIGHT // 2 - 20)
@@ -47,8 +50,8 @@ class GameOverScene:
         surface.blit(current_text, current_rect)
 
         # 历史最高分
-        high_text = self.info_font.render(
-            f"High Score: {high_score}", True, (255, 255, 255)
+        high_text = render_text(
+            self.info_font, f"High Score: {high_score}", (255, 255, 255)
         )
         high_rect = high_text.get_rect(
             center=(Config.WIDTH // 2, Config.HEIGHT // 2 + 20)
@@ -56,8 +59,8 @@ class GameOverScene:
         surface.blit(high_text, high_rect)
 
         # 操作提示
-        prompt_text = self.info_font.render(
-            "Press R to Restart | ESC to Quit", True, (200, 200, 200)
+        prompt_text = render_text(
+            self.info_font, "Press R to Restart | ESC to Quit", (200, 200, 200)
         )
         prompt_rect = prompt_text.get_rect(
             center=(Config.WIDTH // 2, Config.HEIGHT // 2 + 80)
@@ -1,6 +1,4 @@
 import pygame
-import random
-from random import randint
 
 # Third-party Imports
 from pygame.sprite import (
@@ -12,15 +10,25 @@ from pygame.sprite import (
 # It's better practice to have these at the top level of the module
 try:
     from ..core.config import Config
+    from ..core.layers import RenderLayer, RenderQueue
+    from ..core.clock import SimulationClock
+    from ..core.timers import TimerWheel
+    from ..core.profiler import profiler
+    from ..core.replay import LiveInput, ReplayRecorder, nondeterministic_settings
+    from ..core.rng import rng
     from ..entities.player import Player, Bullet, PowerBullet
-    from ..entities.enemy import BasicEnemy, CircleEnemy, Boss
-    from ..entities.bullet import EnemyBullet
+    from ..entities.enemy import BasicEnemy, Boss, prerender_enemy_visuals
+    from ..managers.bullet_pool import BulletPool
+    from ..managers.collision import SpatialHash
+    from ..managers.emitters import EmitterScheduler
     from ..managers.spawner import Spawner
-    from ..managers.particle import HitParticle
+    from ..managers.steering import steer_sprites
+    from ..managers.particle import ParticleEmitter
     from ..entities.damage_text import DamageText
     from .game_over_scene import GameOverScene
     from ..entities.powerup import PowerUp
     from ..ui.hud import HUD  # Moved import
+    from ..managers.assets import asset_cache
 
     # Assuming ParallaxLayer class is defined in this file or imported correctly
 except ImportError as e:
@@ -28,37 +36,66 @@ except ImportError as e:
     # Handle import errors appropriately, maybe raise exception or exit
 
 
+_random = rng.stream("drops")
+
+
 class GameScene:
-    def __init__(self, game):  # game 参数用于访问全局对象如 score_manager
-        self.game = game  # 保存游戏实例引用
+    def __init__(self, game, seed=None, input_source=None):
+        self.game = game  # 保存游戏实例引用（访问 score_manager 等全局对象）
+
+        # --- 随机数与输入 ---
+        # 所有子系统的随机数流由同一个主种子重置，同一种子 + 同一串输入可完整重现一局
+        self.seed = rng.seed(Config.RNG_SEED if seed is None else seed)
+        # 输入源：实时键盘，或回放文件；REPLAY_RECORD 时在外面包一层录制
+        self.input = input_source or LiveInput()
+        self.recorder = None
+        if input_source is None and Config.REPLAY_RECORD:
+            reasons = nondeterministic_settings()
+            if reasons:
+                print(f"Replay recording disabled: {'; '.join(reasons)}")
+            else:
+                self.recorder = ReplayRecorder(
+                    self.seed, self.game.timestep.tick_rate, self.input
+                )
+                self.input = self.recorder
 
         # --- 重置分数管理器 ---
         # 在场景初始化时重置分数和连击
         self.game.score_manager.reset()
         # ----------------------
 
+        # 模拟时钟：实体读取的时间只随模拟步前进（支持暂停和时间缩放）
+        self.clock = SimulationClock()
+        # 计时服务：冷却、持续时间等登记后到期回调，不再每帧累加计时器
+        self.timers = TimerWheel(self.clock, resolution=self.game.timestep.step)
+
         # 玩家相关
-        self.player = Player((Config.WIDTH // 2, Config.HEIGHT - 80))
+        self.player = Player(
+            (Config.WIDTH // 2, Config.HEIGHT - 80), self.clock, self.timers
+        )
         # 使用 GroupSingle 更适合单个玩家精灵的管理和绘制
         self.player_group = GroupSingle(self.player)
 
         # 弹幕组
         self.bullets = Group()  # 玩家子弹
-        self.enemy_bullets = Group()  # 敌人子弹
+        self.enemy_bullets = BulletPool()  # 敌人子弹（数组池 + 激光等特殊弹幕精灵）
 
         # 敌机系统
+        prerender_enemy_visuals()  # 各类型外观只绘制一次（已缓存时直接返回）
         self.enemies = Group()
-        self.spawner = Spawner()
-
-        # 渲染组 (注意：原始代码的 all_sprites 使用方式效率不高)
-        self.all_sprites = Group()  # 这个组在原始代码中管理方式需要优化
-        self.all_sprites.add(self.player)  # 初始添加玩家
+        # 射击调度：敌机生成时登记一次，只有到了开火时间的敌机才会被调用
+        self.emitters = EmitterScheduler(self.clock, self.enemy_bullets)
+        self.spawner = Spawner(self.clock, self.timers, self.emitters)
 
         # 效果组
-        self.particles = Group()  # 粒子效果
+        self.particles = ParticleEmitter()  # 粒子效果（固定容量的粒子池）
         self.damage_numbers = pygame.sprite.Group()  # 伤害文字
         self.powerups = Group()  # 道具
 
+        # 碰撞宽相位（每帧按组重建）
+        self.enemy_grid = SpatialHash()
+        self.powerup_grid = SpatialHash(padding=8)  # 圆形碰撞会超出 rect 少许
+
         # 背景层
         self.background_layers = []
         # 检查配置项决定是否加载背景
@@ -81,17 +118,45 @@ class GameScene:
         # 初始化HUD (需要访问 game.score_manager 来显示分数/连击)
         self.hud = HUD(self.game)  # HUD 可以从 self.game.score_manager 获取信息
 
+        # 渲染层：各组只登记一次，精灵进出组即进出对应的层
+        self.render_queue = RenderQueue()
+        self._register_layers()
+
+    def _register_layers(self):
+        queue = self.render_queue
+        queue.attach(RenderLayer.BACKGROUND, self._draw_background_layers)
+        queue.attach(RenderLayer.PLAYER, self.player_group)
+        queue.attach(RenderLayer.ENEMIES, self.enemies)
+        queue.attach(RenderLayer.BULLETS, self.bullets)
+        queue.attach(RenderLayer.ENEMY_BULLETS, self.enemy_bullets)  # 精灵 + 池中子弹
+        queue.attach(RenderLayer.PICKUPS, self.powerups)
+        queue.attach(RenderLayer.EFFECTS, self._draw_health_bars)
+        queue.attach(RenderLayer.EFFECTS, self.particles)
+        queue.attach(RenderLayer.EFFECTS, self.damage_numbers)
+        queue.attach(RenderLayer.HUD, self.hud)  # 最顶层
+
     def handle_event(self, event):
         # 处理键盘按下/释放等离散事件
         # (原始代码中的连续检测已移至 update)
-        # 如果需要处理特定按键事件（如暂停 P 键），可以在这里添加
         # self.player.handle_event(event) # 让玩家也处理事件（例如特殊技能触发）
-        pass  # 保持和原始代码一致，主要处理在 update
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_p:
+            self.clock.toggle_pause()  # 暂停 / 继续
 
     def update(self, dt):
+        # 记录本步开始前的位置，渲染时在两步之间插值
+        self.render_queue.snapshot()
+
+        # 推进模拟时钟；暂停时整步跳过，时间缩放后的 dt 用于本步的全部更新
+        dt = self.clock.advance(dt)
+        if self.clock.paused:
+            return
+        with profiler.scope("timers"):
+            self.timers.advance()  # 执行本步到期的计时器回调
+
         # 检查玩家是否存活
         if not self.player.alive():  # 使用 sprite.alive() 更标准
             self.game.score_manager.save_high_score("player0")
+            self.save_replay()
             # 重要：在切换场景前可以进行一些清理或状态保存
             self.game.change_scene(GameOverScene(self.game))  # 切换到结束场景
             return  # 玩家死亡，停止当前场景更新
@@ -106,7 +171,7 @@ class GameScene:
         #     self._progress_difficulty()
 
         # --- 玩家输入与更新 ---
-        keys = pygame.key.get_pressed()
+        keys = self.input.poll(self)  # 与 pygame.key.get_pressed() 同样按键名取值
         self.player.handle_movement_input(keys, dt)  # 处理移动等连续输入
         self.player.shoot(self.bullets)
         # 射击逻辑：原始代码在此处调用，但更适合放在 handle_input 或 Player.update 中
@@ -119,34 +184,30 @@ class GameScene:
         self.bullets.update(dt)
 
         # --- 敌机系统更新 ---
-        self.spawner.update(dt, self.enemies)  # Spawner 添加敌人到 self.enemies
+        with profiler.scope("spawner"):
+            self.spawner.update(dt, self.enemies)  # Spawner 添加敌人到 self.enemies
         # 敌人更新（移动、AI、射击），需要玩家位置信息
-        self.enemies.update(dt, self.player.rect.center)  # 假设 Enemy.update 处理这些
-
-        # --- 敌机射击 (原始方式，建议移入 Enemy.update) ---
-        for enemy in self.enemies:
-            # 假设 Enemy 有 shoot_pattern 方法，并将子弹加入 self.enemy_bullets
-            enemy.shoot_pattern(self.enemy_bullets)
-        self.enemy_bullets.update(dt)  # 更新所有敌方子弹
-
-        # --- 渲染组管理 (原始方式，效率低) ---
-        # 清空再添加效率很低，最好在对象创建/销毁时管理组
-        try:
-            self.all_sprites.empty()
-        except KeyError:
-            pass
-        self.all_sprites.add(self.player)
-        self.all_sprites.add(
-            self.enemies, self.bullets, self.enemy_bullets, self.powerups
-        )
-        # ----------------------------------
+        with profiler.scope("enemies"):
+            # 追踪敌机一次性批量转向，各自的 update 只负责移动
+            steer_sprites(self.enemies, self.player.rect.center, dt)
+            self.enemies.update(dt, self.player.rect.center)
+
+        # --- 敌机射击：只调用开火时间已到的敌机 ---
+        with profiler.scope("emitters"):
+            self.emitters.update()
+        with profiler.scope("enemy_bullets"):
+            self.enemy_bullets.update(dt, self.player.rect.center)  # 更新所有敌方子弹
+            # 黑洞等力场一次拉动所有子弹和玩家
+            self.enemy_bullets.apply_fields(dt, self.player)
 
         # --- 碰撞检测 ---
-        self._check_collisions()  # 处理所有碰撞逻辑
+        with profiler.scope("collisions"):
+            self._check_collisions()  # 处理所有碰撞逻辑
 
         # --- 更新效果 ---
-        self.damage_numbers.update(dt)  # 更新伤害文字动画
-        self.particles.update(dt)  # 更新粒子动画
+        with profiler.scope("effects"):
+            self.damage_numbers.update(dt)  # 更新伤害文字动画
+            self.particles.update(dt)  # 更新粒子动画
 
         # --- 清理死亡粒子 (原始方式，建议粒子自毁) ---
         # 假设粒子在 update 中判断是否结束生命并调用 self.kill()
@@ -164,11 +225,8 @@ class GameScene:
     def _check_collisions(self):
         # --- 玩家被敌方子弹击中 ---
         # 假设 Player.take_damage 处理扣血、无敌帧等逻辑
-        player_hits = pygame.sprite.spritecollide(
-            self.player,
-            self.enemy_bullets,
-            True,  # 子弹碰撞后消失
-            collided=pygame.sprite.collide_rect_ratio(0.7),
+        player_hits = self.enemy_bullets.collide_rect(
+            self.player.rect, 0.7, dokill=True  # 子弹碰撞后消失
         )
         if player_hits and not self.player.invincible:  # 检查无敌状态
             # 传递伤害值，假设敌方子弹伤害为1
@@ -177,9 +235,9 @@ class GameScene:
 
         # --- 玩家子弹击中敌机 ---
         # groupcollide 返回字典 {bullet: [enemy_list]}
-        collisions = pygame.sprite.groupcollide(
+        self.enemy_grid.build(self.enemies)  # 敌机网格，下面的玩家碰撞也复用
+        collisions = self.enemy_grid.groupcollide(
             self.bullets,  # 玩家子弹组
-            self.enemies,  # 敌机组
             True,  # 玩家子弹碰撞后消失
             False,  # 敌机碰撞后不消失 (由HP判断)
             collided=pygame.sprite.collide_rect,  # 或其他碰撞函数
@@ -201,10 +259,7 @@ class GameScene:
                 )
 
                 # --- 生成击中粒子 ---
-                for _ in range(5):  # 创建少量击中粒子
-                    self.particles.add(
-                        HitParticle(bullet.rect.center)
-                    )  # 在子弹位置生成
+                self.particles.emit(bullet.rect.center, 5)  # 在子弹位置生成少量击中粒子
 
                 # --- 屏幕震动 (击中) ---
                 # 使用 self.game 引用调用 Game 对象的震动方法
@@ -217,26 +272,27 @@ class GameScene:
                     # 使用 self.game.score_manager 增加分数
                     # enemy.score_value 是敌机应有的属性
                     if hasattr(enemy, "score_value"):
-                        self.game.score_manager.add_score(enemy.score_value)
+                        self.game.score_manager.add_score(
+                            enemy.score_value, self.clock.time
+                        )
                     else:
                         print(
                             f"Warning: Enemy {type(enemy).__name__} missing score_value attribute."
                         )
-                        self.game.score_manager.add_score(10)  # 默认分数
+                        self.game.score_manager.add_score(
+                            10, self.clock.time
+                        )  # 默认分数
                     # ---------------
 
                     # --- 死亡特效 ---
                     # 大爆炸粒子
-                    for _ in range(20):
-                        self.particles.add(
-                            HitParticle(enemy.rect.center, color=(255, 150, 0))
-                        )
+                    self.particles.emit(enemy.rect.center, 20, color=(255, 150, 0))
                     # 屏幕震动 (死亡)
                     self.game.apply_screen_shake(8, 0.3)
 
                     # --- 道具掉落 ---
                     # PowerUp.DROP_CHANCE 应在 PowerUp 类中定义
-                    if random.random() < getattr(
+                    if _random.random() < getattr(
                         PowerUp, "DROP_CHANCE", 0.1
                     ):  # 使用 getattr 提供默认值
                         self.powerups.add(
@@ -246,10 +302,9 @@ class GameScene:
                     # print(f"击破 {type(enemy).__name__} 获得分数") # 打印信息已包含在 score_manager 中
 
         # --- 敌机与玩家碰撞 ---
-        enemy_player_hits = pygame.sprite.spritecollide(
+        enemy_player_hits = self.enemy_grid.spritecollide(
             self.player,
-            self.enemies,
-            False,  # 玩家不消失
+            False,  # 敌机不消失
             collided=pygame.sprite.collide_rect_ratio(0.6),
         )
         if enemy_player_hits and not self.player.invincible:
@@ -271,9 +326,9 @@ class GameScene:
                 break  # 假设一次碰撞只处理一个敌人
 
         # --- 玩家拾取道具 ---
-        powerup_collected = pygame.sprite.spritecollide(
+        self.powerup_grid.build(self.powerups)
+        powerup_collected = self.powerup_grid.spritecollide(
             self.player,
-            self.powerups,
             True,  # 道具拾取后消失
             collided=pygame.sprite.collide_circle_ratio(0.8),  # 假设道具是圆形碰撞
         )
@@ -283,29 +338,67 @@ class GameScene:
             powerup.apply_effect(self.player)  # 正确调用方式
             # 播放拾取音效/特效
 
+    def entity_counts(self):
+        """各组当前的实体数量（帧分析叠加层和无窗口模式使用）"""
+        return {
+            "player": len(self.player_group),
+            "enemies": len(self.enemies),
+            "bullets": len(self.bullets),
+            "enemy_bullets": len(self.enemy_bullets),
+            "particles": len(self.particles),
+            "powerups": len(self.powerups),
+            "damage_text": len(self.damage_numbers),
+        }
+
+    def debug_state(self):
+        """当前的游戏进度（卡顿捕获时一并保存）"""
+        boss = self.spawner.active_boss
+        score = self.game.score_manager
+        return {
+            "wave": self.spawner.wave,
+            "phase": self.spawner.get_current_phase(),
+            "spawn_queue": len(self.spawner.spawn_queue),
+            "spawn_rate": self.spawner.spawn_rate,
+            "boss": (
+                {"phase": boss.phase, "hp": boss.hp, "max_hp": boss.max_hp}
+                if boss is not None and boss.alive()
+                else None
+            ),
+            "player_health": self.player.health,
+            "player_pos": list(self.player.rect.center),
+            "score": score.current_score,
+            "combo": score.combo,
+            "time": self.clock.time,
+        }
+
+    def save_replay(self, path=None):
+        """写出本局的回放文件（仅在录制时），返回路径或 None"""
+        if self.recorder is None:
+            return None
+        recorder, self.recorder = self.recorder, None  # 每局只写一次
+        return recorder.save(self, path)
+
+    def render_background(self, surface):
+        # 1. 渲染背景 (单独的入口：GL 路径可以把背景直接交给 GPU 绘制)
+        self.render_queue.draw_layer(RenderLayer.BACKGROUND, surface)
+
     def render(self, surface):
-        # 1. 渲染背景
+        # 2. 按层绘制游戏世界、特效和 HUD (顺序见 _register_layers)
+        #    精灵画在上一模拟步与当前步之间的插值位置
+        self.render_queue.draw(surface, self.game.render_alpha)
+
+    def _draw_background_layers(self, surface):
         if Config.ENABLE_BACKGROUND:
             for layer in self.background_layers:
-                layer.render(surface)
-
-        # 2. 渲染所有游戏世界精灵 (使用原始的 all_sprites)
-        self.all_sprites.draw(surface)
+                layer.render(surface, self.game.render_alpha)
 
-        # 3. 渲染非 sprite 组的 UI 元素或特效
+    def _draw_health_bars(self, surface):
         # 绘制血条 (应在对应对象的方法中实现)
         self.player.draw_health_bar(surface)
         for enemy in self.enemies:
             if isinstance(enemy, Boss):  # 只为 Boss 绘制血条
                 enemy.draw_health_bar(surface)
 
-        # 渲染粒子和伤害数字 (虽然是 Group，但可能需要在特定层级绘制)
-        self.particles.draw(surface)
-        self.damage_numbers.draw(surface)
-
-        # 4. 渲染 HUD (最顶层)
-        self.hud.draw(surface)  # HUD 绘制分数、连击、生命等信息
-
     def _progress_difficulty(self):
         """根据当前波次提升难度 (原始代码逻辑)"""
         # 确保 self.current_wave 不会超出 difficulty_curve 的索引范围
@@ -333,19 +426,32 @@ class ParallaxLayer:
     """视差背景层 (已优化硬件加速)"""
 
     def __init__(self, image_path, speed_factor):
+        size = (Config.WIDTH, Config.HEIGHT)
+        # 同一背景图在进程内只加载、缩放、转换一次（重开游戏时直接命中缓存）
+        self.image = asset_cache.get(
+            ("parallax", image_path, size),
+            lambda: self._load_image(image_path, size),
+        )
+
+        self.speed_factor = speed_factor
+        self.offset = 0.0  # 使用浮点数以获得更平滑的滚动
+        self.step_distance = 0.0  # 上一模拟步滚动的距离，用于插值绘制
+        self.tile_height = self.image.get_height()
+        # 不再需要将 self.rect 作为移动状态存储
+
+    @staticmethod
+    def _load_image(image_path, size):
         try:
             # 1. 加载原始图像
             loaded_image = pygame.image.load(f"assets/backgrounds/{image_path}")
         except pygame.error as e:
             print(f"错误：无法加载图像 '{image_path}'. Pygame Error: {e}")
             # 创建一个占位符表面以避免崩溃
-            loaded_image = pygame.Surface((Config.WIDTH, Config.HEIGHT))
+            loaded_image = pygame.Surface(size)
             loaded_image.fill((128, 0, 128))  # 用紫色填充，表示错误
 
         # 2. 缩放图像以适应屏幕（或你想要的大小）
-        scaled_image = pygame.transform.scale(
-            loaded_image, (Config.WIDTH, Config.HEIGHT)
-        )
+        scaled_image = pygame.transform.scale(loaded_image, size)
 
         # --- 关键优化：转换为硬件加速格式 ---
         # 如果图像没有透明度 (e.g., JPG), 使用 convert()
@@ -353,33 +459,31 @@ class ParallaxLayer:
         # 根据你的图像文件类型选择
         try:
             # 尝试 convert_alpha()，因为它更通用，能处理带或不带 alpha 的图像
-            self.image = scaled_image.convert_alpha()
+            image = scaled_image.convert_alpha()
             print(f"图像 '{image_path}' 已使用 convert_alpha() 优化。")
         except pygame.error:
             # 如果 convert_alpha() 失败（可能发生在没有 alpha 的表面上），回退到 convert()
-            self.image = scaled_image.convert()
+            image = scaled_image.convert()
             print(f"图像 '{image_path}' 已使用 convert() 优化。")
         # -----------------------------------------
-
-        self.speed_factor = speed_factor
-        self.offset = 0.0  # 使用浮点数以获得更平滑的滚动
-        self.tile_height = self.image.get_height()
-        # 不再需要将 self.rect 作为移动状态存储
+        return image
 
     def update(self, dt):
         """根据时间增量 (dt) 更新层的偏移量"""
         # 使用浮点数计算，乘以 dt 实现帧率无关的移动
-        self.offset += 100.0 * dt * self.speed_factor
+        self.step_distance = 100.0 * dt * self.speed_factor
+        self.offset += self.step_distance
         # 使用取模运算 (%) 使偏移量在 [0, tile_height) 范围内循环
         self.offset %= self.tile_height
 
-    def render(self, surface):
-        """将层渲染（绘制）到目标表面上"""
+    def render(self, surface, alpha=1.0):
+        """将层渲染（绘制）到目标表面上，alpha 为两个模拟步之间的插值比例"""
+        offset = (self.offset - self.step_distance * (1.0 - alpha)) % self.tile_height
         # 计算两个瓦片的位置以实现无缝滚动
         # 第一个瓦片的位置
-        y1 = -self.offset
+        y1 = -offset
         # 第二个瓦片的位置，紧跟在第一个瓦片下方
-        y2 = self.tile_height - self.offset
+        y2 = self.tile_height - offset
 
         # --- 优化：直接使用计算出的坐标进行 blit ---
         surface.blit(self.image, (0, y1))
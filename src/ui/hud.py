@@ -2,6 +2,9 @@
 import pygame
 from pygame.locals import *
 
+from ..core.renderer import draw_rect
+from ..managers.fonts import fonts, render_text
+
 # Assuming Config is imported correctly and defines WIDTH, HEIGHT
 try:
     from ..core.config import Config
@@ -23,16 +26,10 @@ class HUD:
         self.game = game  # Reference to the main game instance
 
         # --- Font Initialization ---
-        # Use SysFont for better portability if font files aren't bundled
-        try:
-            # Try a common sans-serif font
-            self.font = pygame.font.SysFont("verdana", 20)
-            self.combo_font = pygame.font.SysFont("impact", 36)  # Larger font for combo
-        except pygame.error:
-            print("Warning: Specified fonts not found, using Pygame default.")
-            # Fallback to default font if SysFont fails
-            self.font = pygame.font.Font(None, 24)  # Default font, size 24
-            self.combo_font = pygame.font.Font(None, 40)  # Default font, size 40
+        # Fonts come from the shared registry (loaded once per process, falls
+        # back to the Pygame default font if the system font is missing)
+        self.font = fonts.get("verdana", 20)
+        self.combo_font = fonts.get("impact", 36)  # Larger font for combo
 
         # --- Internal State Variables ---
         # Initialize with default values
@@ -125,15 +122,16 @@ class HUD:
         Renders the HUD elements onto the given surface using internally stored state.
         """
         # --- Draw Score ---
-        score_text_surface = self.font.render(
-            f"SCORE: {self._score}", True, (255, 255, 255)
+        # Text goes through the shared cache: unchanged labels are not re-rendered
+        score_text_surface = render_text(
+            self.font, f"SCORE: {self._score}", (255, 255, 255)
         )
         score_rect = score_text_surface.get_rect(topleft=(20, 20))
         surface.blit(score_text_surface, score_rect)
 
         # --- Draw Wave ---
-        wave_text_surface = self.font.render(
-            f"WAVE: {self._wave}", True, (255, 255, 255)
+        wave_text_surface = render_text(
+            self.font, f"WAVE: {self._wave}", (255, 255, 255)
         )
         # Position from top right
         wave_rect = wave_text_surface.get_rect(topright=(Config.WIDTH - 20, 20))
@@ -141,8 +139,8 @@ class HUD:
 
         # --- Draw Combo (if active) ---
         if self._combo > self.combo_display_threshold:
-            combo_text_surface = self.combo_font.render(
-                f"{self._combo} COMBO!", True, self.combo_color
+            combo_text_surface = render_text(
+                self.combo_font, f"{self._combo} COMBO!", self.combo_color
             )
             # Center the combo text using get_rect
             combo_rect = combo_text_surface.get_rect(center=self.combo_position)
@@ -170,13 +168,11 @@ class HUD:
                     segment_width,
                     segment_height,
                 )
-                pygame.draw.rect(surface, color, segment_rect)
-                pygame.draw.rect(
-                    surface, (200, 200, 200), segment_rect, 1
-                )  # Optional border
+                draw_rect(surface, color, segment_rect)
+                draw_rect(surface, (200, 200, 200), segment_rect, 1)  # Optional border
         # --- 绘制盾牌数量（左下角）---
-        shield_text = self.font.render(
-            f"SHIELDS: {self._shield_count}", True, (0, 120, 255)  # 使用蓝色突出显示
+        shield_text = render_text(
+            self.font, f"SHIELDS: {self._shield_count}", (0, 120, 255)  # 使用蓝色突出显示
         )
         # 位置：左下角（生命条上方）
         shield_rect = shield_text.get_rect(bottomleft=(20, Config.HEIGHT - 40))
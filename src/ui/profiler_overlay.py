@@ -0,0 +1,138 @@
+import numpy as np
+import pygame
+
+from ..core.config import Config
+from ..core.renderer import draw_rect, mark_surface_dirty
+from ..managers.fonts import fonts, render_text
+
+
+class ProfilerOverlay:
+    """
+    帧分析器叠加层：左上角显示最近若干帧的堆叠耗时图、各计时段的平均耗时
+    以及各组的实体数量。
+
+    堆叠图每帧用 NumPy 一次性填充到一张表面上（标记为脏表面供 GL 后端
+    重新上传），整张图只需一次 blit。文字每隔 LABEL_INTERVAL 帧刷新一次，
+    避免数值每帧变化把文字缓存冲掉。
+    """
+
+    FRAMES = 120  # 图中显示的帧数
+    BAR_WIDTH = 2
+    GRAPH_HEIGHT = 100
+    GRAPH_SCALES = (16.7, 33.3, 66.7, 133.3, 266.7)  # 纵轴满量程（毫秒），按峰值选择
+    LABEL_INTERVAL = 15
+    POSITION = (10, 60)
+
+    # 计时段颜色，按登记顺序循环使用；最后一项为未计入任何计时段的时间
+    PALETTE = (
+        (230, 80, 80),
+        (80, 200, 90),
+        (80, 140, 240),
+        (240, 200, 60),
+        (200, 90, 220),
+        (60, 210, 210),
+        (250, 140, 50),
+        (160, 230, 120),
+        (150, 120, 250),
+        (240, 120, 170),
+        (120, 180, 160),
+        (200, 200, 200),
+    )
+    OTHER_COLOR = (90, 90, 90)
+    BACKGROUND = (0, 0, 0, 160)
+    TEXT_COLOR = (255, 255, 255)
+    COUNT_COLOR = (180, 180, 180)
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+        self.visible = False
+        self.font = fonts.get("monospace", 14)
+        self.graph = pygame.Surface((self.FRAMES * self.BAR_WIDTH, self.GRAPH_HEIGHT))
+        self._labels = []
+        self._frames_since_labels = self.LABEL_INTERVAL
+
+    def toggle(self):
+        """切换显示；显示期间启用分析器"""
+        self.visible = not self.visible
+        if self.visible:
+            self.profiler.acquire()
+        else:
+            self.profiler.release()
+        self._frames_since_labels = self.LABEL_INTERVAL
+
+    def draw(self, surface, counts=None):
+        if not self.visible:
+            return
+        x, y = self.POSITION
+        scale_ms = self._draw_graph()
+        width, height = self.graph.get_size()
+        draw_rect(surface, self.BACKGROUND, (x - 4, y - 4, width + 220, height + 8))
+        surface.blit(self.graph, (x, y))
+
+        # 目标帧时间参考线
+        if Config.FPS and 1000 / Config.FPS < scale_ms:
+            line_y = y + height - round(1000 / Config.FPS / scale_ms * height)
+            draw_rect(surface, (255, 255, 255), (x, line_y, width, 1))
+
+        self._frames_since_labels += 1
+        if self._frames_since_labels >= self.LABEL_INTERVAL:
+            self._frames_since_labels = 0
+            self._labels = self._build_labels(counts or {})
+        label_x = x + width + 8
+        label_y = y
+        for color, text in self._labels:
+            if color is not None:
+                draw_rect(surface, color, (label_x, label_y + 3, 8, 8))
+            surface.blit(text, (label_x + 12, label_y))
+            label_y += text.get_height()
+
+    def _draw_graph(self):
+        """重画堆叠图，返回使用的纵轴满量程（毫秒）"""
+        samples, frame_time = self.profiler.history(self.FRAMES)
+        pixels = np.zeros((self.FRAMES, self.GRAPH_HEIGHT, 3), dtype=np.uint8)
+        scale_ms = self.GRAPH_SCALES[0]
+        if len(samples):
+            peak = frame_time.max() * 1000
+            scale_ms = next(
+                (ms for ms in self.GRAPH_SCALES if ms >= peak), self.GRAPH_SCALES[-1]
+            )
+            scale = self.GRAPH_HEIGHT / (scale_ms / 1000)
+            # 每列自下而上依次堆叠各计时段，最后是未计入的剩余时间
+            other = np.maximum(frame_time - samples.sum(axis=1), 0)
+            stacked = np.column_stack((np.maximum(samples, 0), other))
+            tops = np.cumsum(stacked, axis=1) * scale
+            heights = np.arange(self.GRAPH_HEIGHT)[::-1] + 0.5  # 第 0 行在顶部
+            segment = (heights[None, :, None] >= tops[:, None, :]).sum(axis=2)
+
+            count = stacked.shape[1]
+            palette = np.zeros((count + 1, 3), dtype=np.uint8)
+            for i in range(count - 1):
+                palette[i] = self.PALETTE[i % len(self.PALETTE)]
+            palette[count - 1] = self.OTHER_COLOR
+            # count 即高于所有计时段的空白部分，保持黑色
+            pixels[-len(samples) :] = palette[segment]
+
+        columns = np.repeat(pixels, self.BAR_WIDTH, axis=0)
+        pygame.surfarray.blit_array(self.graph, columns)
+        mark_surface_dirty(self.graph)
+        return scale_ms
+
+    def _build_labels(self, counts):
+        font = self.font
+        text_color = self.TEXT_COLOR
+        labels = []
+        averages = self.profiler.averages(self.FRAMES)
+        _, frame_time = self.profiler.history(self.FRAMES)
+        if len(frame_time):
+            frame_ms = frame_time.mean() * 1000
+            labels.append(
+                (None, render_text(font, f"frame {frame_ms:14.1f}", text_color))
+            )
+        for i, (name, ms) in enumerate(averages.items()):
+            color = self.PALETTE[i % len(self.PALETTE)]
+            text = render_text(font, f"{name:<14}{ms:6.2f}", text_color)
+            labels.append((color, text))
+        for name, count in counts.items():
+            text = render_text(font, f"{name:<14}{count:6d}", self.COUNT_COLOR)
+            labels.append((None, text))
+        return labels
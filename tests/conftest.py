@@ -0,0 +1,5 @@
+import os
+
+# 测试不开窗口、不出声音
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
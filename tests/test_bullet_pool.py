@@ -0,0 +1,131 @@
+import math
+
+import numpy as np
+import pygame
+
+from src.core.config import Config
+from src.managers.bullet_pool import BulletPool
+
+
+def spawn_numbered(pool, positions, velocities, **kwargs):
+    """每颗子弹用不同的颜色和 lifetime 编号，便于检查各列是否仍对齐"""
+    for i, (pos, vel) in enumerate(zip(positions, velocities)):
+        speed = math.hypot(*vel)
+        pool.spawn(
+            pos,
+            vel if speed else (0, 1),
+            speed=speed,
+            color=(i, 0, 0),
+            lifetime=kwargs.get("lifetime", 1000.0 + i),
+            kind=kwargs.get("kind", BulletPool.NORMAL),
+        )
+
+
+def numbers(pool):
+    """存活子弹的编号（按数组顺序），由颜色和 lifetime 两列各算一次"""
+    n = pool.count
+    by_color = [int(pool._images[c].get_at((0, 0)).r) for c in pool.color[:n]]
+    by_lifetime = [int(t - 1000.0) for t in pool.lifetime[:n]]
+    assert by_color == by_lifetime
+    return by_color
+
+
+def test_offscreen_bullets_are_removed_and_order_is_kept():
+    pool = BulletPool(capacity=4)  # 顺便覆盖扩容
+    positions = [(100 + 10 * i, 100) for i in range(10)]
+    # 奇数号子弹一步飞出屏幕，偶数号静止
+    velocities = [(0, 0) if i % 2 == 0 else (0, -10000) for i in range(10)]
+    spawn_numbered(pool, positions, velocities)
+    assert pool.capacity >= 10
+
+    pool.update(0.1)
+
+    assert numbers(pool) == [0, 2, 4, 6, 8]
+    kept = [list(positions[i]) for i in (0, 2, 4, 6, 8)]
+    assert pool.pos[: pool.count].tolist() == kept
+
+
+def test_expired_bullets_are_removed():
+    pool = BulletPool()
+    for i in range(6):
+        pool.spawn((200, 200), (0, 1), speed=0, color=(i, 0, 0), lifetime=0.5 * i)
+    pool.update(0.6)  # 存活条件 age <= lifetime
+    images = [pool._images[c] for c in pool.color[: pool.count]]
+    assert [int(image.get_at((0, 0)).r) for image in images] == [2, 3, 4, 5]
+
+
+def test_collide_rect_kills_only_hit_bullets():
+    pool = BulletPool()
+    positions = [(50 * i + 25, 300) for i in range(12)]
+    spawn_numbered(pool, positions, [(0, 0)] * 12)
+    pool.vel[: pool.count] = 0.0
+
+    target = pygame.Rect(90, 290, 120, 20)  # 覆盖 x = 75..225 附近的子弹
+    expected = [
+        i
+        for i, (x, y) in enumerate(positions)
+        if pygame.Rect(x - 4, y - 4, 8, 8).colliderect(target)
+    ]
+    assert pool.collide_rect(target, dokill=False) == len(expected)
+    assert pool.count == 12
+
+    assert pool.collide_rect(target) == len(expected)
+    assert numbers(pool) == [i for i in range(12) if i not in expected]
+
+
+def test_collide_rect_matches_rect_ratio():
+    pool = BulletPool()
+    rng = np.random.default_rng(7)
+    positions = rng.uniform((300, 200), (500, 400), (200, 2)).round().tolist()
+    spawn_numbered(pool, positions, [(0, 0)] * len(positions))
+    pool.vel[: pool.count] = 0.0
+
+    rect = pygame.Rect(380, 280, 40, 40)
+    ratio = 0.7
+    collided = pygame.sprite.collide_rect_ratio(ratio)
+    probe = pygame.sprite.Sprite()
+    probe.rect = rect
+    expected = []
+    for i, (x, y) in enumerate(positions):
+        bullet = pygame.sprite.Sprite()
+        bullet.rect = pygame.Rect(0, 0, BulletPool.SIZE, BulletPool.SIZE)
+        bullet.rect.center = (x, y)
+        if collided(probe, bullet):
+            expected.append(i)
+    assert expected
+    assert pool.collide_rect(rect, ratio) == len(expected)
+    assert numbers(pool) == [i for i in range(len(positions)) if i not in expected]
+
+
+def test_mines_explode_into_fragments_after_compaction():
+    pool = BulletPool()
+    pool.spawn((100, 100), (0, 1), speed=0, color=(1, 0, 0), lifetime=10.0)
+    pool.spawn(
+        (300, 300), (0, 1), speed=0, color=(2, 0, 0), kind=BulletPool.MINE, lifetime=0.1
+    )
+    pool.spawn((500, 100), (0, 1), speed=0, color=(3, 0, 0), lifetime=10.0)
+
+    pool.update(0.2)
+
+    assert pool.count == 2 + BulletPool.MINE_FRAGMENTS
+    assert pool.pos[:2].tolist() == [[100, 100], [500, 100]]
+    fragments = pool.pos[2 : pool.count]
+    assert np.allclose(fragments, (300, 300))
+    speeds = np.hypot(*pool.vel[2 : pool.count].T)
+    assert np.allclose(speeds, BulletPool.MINE_SPEED)
+    mine_color = pool.palette_indices([(2, 0, 0)])[0]
+    assert set(pool.color[2 : pool.count].tolist()) == {mine_color}
+
+
+def test_bouncing_bullets_stay_on_screen_until_out_of_bounces():
+    pool = BulletPool()
+    start = (Config.WIDTH - 10, 300)
+    pool.spawn(start, (1, 0), speed=600, kind=BulletPool.BOUNCE, max_bounce=1)
+    pool.update(1 / 60)  # 撞右墙：退回并反向，反弹次数用尽后剔除
+    assert pool.count == 0
+
+    pool.spawn(start, (1, 0), speed=600, kind=BulletPool.BOUNCE, max_bounce=2)
+    pool.update(1 / 60)
+    assert pool.count == 1
+    assert pool.vel[0, 0] < 0
+    assert pool.pos[0, 0] == Config.WIDTH - 10
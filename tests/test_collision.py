@@ -0,0 +1,105 @@
+import random
+
+import pygame
+import pytest
+
+from src.managers.collision import SpatialHash
+
+
+class Box(pygame.sprite.Sprite):
+    def __init__(self, name, rect):
+        super().__init__()
+        self.name = name
+        self.rect = pygame.Rect(rect)
+
+
+def make_world(seed, count_a=150, count_b=120):
+    """两组随机矩形：含跨多个格子的大矩形、宽或高为 0 的矩形和负坐标"""
+    random_ = random.Random(seed)
+
+    def box(name):
+        w = random_.choice((0, 4, 8, 8, 16, 30, 70, 150))
+        h = random_.choice((0, 4, 8, 8, 16, 30, 70, 150))
+        x = random_.randint(-100, 700)
+        y = random_.randint(-100, 500)
+        return Box(name, (x, y, w, h))
+
+    group_a = pygame.sprite.Group(box(f"a{i}") for i in range(count_a))
+    group_b = pygame.sprite.Group(box(f"b{i}") for i in range(count_b))
+    return group_a, group_b
+
+
+def names(result):
+    return {a.name: [b.name for b in hits] for a, hits in result.items()}
+
+
+COLLIDERS = [
+    (None, 0),
+    (pygame.sprite.collide_rect, 0),
+    (pygame.sprite.collide_rect_ratio(0.6), 0),
+    (pygame.sprite.collide_rect_ratio(1.5), 80),  # 判定范围超出 rect，需要 padding
+    (pygame.sprite.collide_circle, 160),  # 细长矩形的外接圆超出 rect 最多 75 像素
+]
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+@pytest.mark.parametrize("collided, padding", COLLIDERS)
+@pytest.mark.parametrize(
+    "dokilla, dokillb", [(False, False), (True, False), (True, True)]
+)
+def test_groupcollide_matches_pygame(seed, collided, padding, dokilla, dokillb):
+    expected_a, expected_b = make_world(seed)
+    expected = pygame.sprite.groupcollide(
+        expected_a, expected_b, dokilla, dokillb, collided
+    )
+
+    group_a, group_b = make_world(seed)
+    grid = SpatialHash(cell_size=32, padding=padding)
+    grid.build(group_b)
+    result = grid.groupcollide(group_a, dokilla, dokillb, collided)
+
+    assert names(result) == names(expected)
+    assert list(names(result)) == list(names(expected))  # 顺序也相同
+    assert sorted(s.name for s in group_a) == sorted(s.name for s in expected_a)
+    assert sorted(s.name for s in group_b) == sorted(s.name for s in expected_b)
+
+
+@pytest.mark.parametrize("collided, padding", COLLIDERS)
+def test_spritecollide_matches_pygame(collided, padding):
+    group_a, group_b = make_world(4)
+    grid = SpatialHash(cell_size=64, padding=padding)
+    grid.build(group_b)
+    for sprite in group_a:
+        expected = pygame.sprite.spritecollide(sprite, group_b, False, collided)
+        hits = grid.spritecollide(sprite, False, collided)
+        assert [b.name for b in hits] == [b.name for b in expected]
+
+
+def test_killed_sprites_are_ignored_until_rebuild():
+    group_a, group_b = make_world(5)
+    grid = SpatialHash(cell_size=32)
+    grid.build(group_b)
+    for sprite in list(group_b)[::2]:
+        sprite.kill()
+    expected = pygame.sprite.groupcollide(group_a, group_b, False, False)
+    assert names(grid.groupcollide(group_a, False, False)) == names(expected)
+
+
+def test_one_pixel_overlaps_at_cell_edges():
+    """沿格子边界逐像素平移：只重叠一个像素的情况也不能漏掉"""
+    size = 32
+    group_b = pygame.sprite.Group(
+        Box("right", (size, 0, 8, 8)), Box("below", (0, size, 8, 8))
+    )
+    grid = SpatialHash(cell_size=size)
+    grid.build(group_b)
+    for offset in range(size - 12, size + 12):
+        for rect in ((offset, 0, 4, 4), (0, offset, 4, 4), (offset, offset, 4, 4)):
+            sprite = Box("probe", rect)
+            expected = pygame.sprite.spritecollide(sprite, group_b, False)
+            hits = grid.spritecollide(sprite, False)
+            assert [b.name for b in hits] == [b.name for b in expected], rect
+            group_a = pygame.sprite.Group(sprite)
+            expected = pygame.sprite.groupcollide(group_a, group_b, False, False)
+            result = grid.groupcollide(group_a, False, False)
+            assert names(result) == names(expected), rect
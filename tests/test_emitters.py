@@ -0,0 +1,52 @@
+import math
+
+from src.core.clock import SimulationClock
+from src.managers.emitters import EmitterScheduler
+
+STEP = 1.0 / 60
+
+
+class Shooter:
+    """记录每次开火时间的敌机替身；hidden_until 之前 shoot_pattern 返回 False"""
+
+    def __init__(self, clock, fire_interval, hidden_until=0.0):
+        self.clock = clock
+        self.fire_interval = fire_interval
+        self.hidden_until = hidden_until
+        self.shots = []
+
+    def alive(self):
+        return True
+
+    def shoot_pattern(self, target):
+        if self.clock.time < self.hidden_until:
+            return False
+        self.shots.append(self.clock.time)
+
+
+def run(seconds, **kwargs):
+    clock = SimulationClock(time_scale=1.0)
+    scheduler = EmitterScheduler(clock, target=None)
+    shooter = Shooter(clock, **kwargs)
+    scheduler.register(shooter)
+    for _ in range(round(seconds / STEP)):
+        clock.advance(STEP)
+        scheduler.update()
+    return shooter.shots
+
+
+def test_cadence_does_not_drift_between_steps():
+    # 0.11 秒不是步长的整数倍：每次开火都晚一点，但不能累积
+    shots = run(6.0, fire_interval=0.11)
+    assert len(shots) == math.floor(6.0 / 0.11)
+    for n, time in enumerate(shots, start=1):
+        assert 0 <= time - n * 0.11 < STEP + 1e-9
+
+
+def test_retry_restarts_cadence_when_the_enemy_can_fire():
+    shots = run(3.0, fire_interval=0.5, hidden_until=1.2)
+    # 0.5 和 1.0 秒时隐形，之后每步重试；1.2 秒显形即开火，此后每 0.5 秒一次
+    assert abs(shots[0] - 1.2) < STEP
+    gaps = [b - a for a, b in zip(shots, shots[1:])]
+    assert all(abs(gap - 0.5) < STEP for gap in gaps)
+    assert len(shots) == 4
@@ -0,0 +1,23 @@
+import pygame
+
+from src.core.config import Config
+from src.entities.enemy import ENEMY_TYPES, Boss, prerender_enemy_visuals
+from src.managers.assets import asset_cache
+
+
+def prototypes():
+    images = [enemy_class.prototype() for enemy_class in ENEMY_TYPES]
+    return images + [Boss.phase_prototype(phase) for phase in Boss.PHASE_COLORS]
+
+
+def test_prototypes_survive_asset_cache_eviction():
+    prerender_enemy_visuals()
+    before = prototypes()
+
+    # 背景、视差层等资源把 LRU 整个换一遍
+    for i in range(Config.ASSET_CACHE_SIZE * 2):
+        asset_cache.get(("filler", i), lambda: pygame.Surface((1, 1)))
+
+    assert all(a is b for a, b in zip(prototypes(), before))
+    for i in range(Config.ASSET_CACHE_SIZE * 2):
+        asset_cache.invalidate(("filler", i))
@@ -0,0 +1,152 @@
+import math
+
+import numpy as np
+import pytest
+from pygame.math import Vector2
+
+from src.core.rng import rng
+from src.managers.bullet_pool import BulletPool
+from src.managers.patterns import GOLDEN_ANGLE, compile_pattern
+
+
+def fired(pattern, origin=(400, 300), angle=0.0):
+    """发射一轮到新的子弹池，返回 (位置, 速度, 颜色) 数组"""
+    pool = BulletPool()
+    pattern.fire(pool, origin, angle)
+    n = pool.count
+    colors = np.array([pool._images[c].get_at((0, 0))[:3] for c in pool.color[:n]])
+    return pool.pos[:n].copy(), pool.vel[:n].copy(), colors
+
+
+def rotated(angle):
+    vector = Vector2(1, 0).rotate(angle)
+    return vector.x, vector.y
+
+
+def test_ring_matches_per_bullet_rotation():
+    pattern = compile_pattern(
+        {"shape": "ring", "count": 12, "speed": 300, "radius": 20}
+    )
+    assert len(pattern) == 12
+    for angle in (0.0, 17.0, -90.0):
+        pos, vel, colors = fired(pattern, angle=angle)
+        for i in range(12):
+            direction = rotated(angle + i * 30)
+            expected = np.add((400, 300), np.multiply(direction, 20))
+            assert pos[i] == pytest.approx(expected)
+            assert vel[i] == pytest.approx(np.multiply(direction, 300))
+        assert (colors == (255, 0, 0)).all()  # 默认颜色
+
+
+def test_heading_turns_ring_directions():
+    pattern = compile_pattern({"shape": "ring", "count": 4, "heading": 90, "speed": 1})
+    _, vel, _ = fired(pattern, angle=10)
+    for i in range(4):
+        assert vel[i] == pytest.approx(rotated(10 + i * 90 + 90))
+
+
+def test_fixed_direction_is_not_rotated():
+    pattern = compile_pattern(
+        {"shape": "ring", "count": 6, "radius": 50, "direction": 90, "speed": 100}
+    )
+    pos, vel, _ = fired(pattern, origin=(0, 0), angle=45)
+    assert vel == pytest.approx(np.tile((0, 100), (6, 1)), abs=1e-9)
+    for i in range(6):  # 发射位置仍随角度旋转
+        assert pos[i] == pytest.approx(np.multiply(rotated(45 + i * 60), 50))
+
+
+def test_fan_is_centred_on_heading():
+    pattern = compile_pattern({"shape": "fan", "count": 5, "spread": 60, "heading": 90})
+    _, vel, _ = fired(pattern, angle=30)
+    for i, offset in enumerate((-30, -15, 0, 15, 30)):
+        assert vel[i] == pytest.approx(np.multiply(rotated(120 + offset), 400))
+
+    single = compile_pattern({"shape": "fan", "count": 1, "spread": 60, "heading": 90})
+    _, vel, _ = fired(single)
+    assert vel[0] == pytest.approx((0, 400), abs=1e-9)
+
+
+def test_spiral_uses_golden_angle_and_radius_step():
+    pattern = compile_pattern({"shape": "spiral", "count": 5, "radius_step": 3})
+    pos, vel, _ = fired(pattern, origin=(0, 0))
+    for i in range(5):
+        direction = rotated(i * GOLDEN_ANGLE)
+        assert pos[i] == pytest.approx(np.multiply(direction, 3 * i), abs=1e-9)
+        assert vel[i] == pytest.approx(np.multiply(direction, 400))
+
+
+def test_grid_is_column_major_with_ramps():
+    pattern = compile_pattern(
+        {
+            "shape": "grid",
+            "cols": 3,
+            "rows": 2,
+            "spacing": 10,
+            "heading": 90,
+            "speed": 100,
+            "speed_ramp": {"col": 10, "row": 1},
+            "color": (0, 0, 250),
+            "color_ramp": {"index": (100, 0, 10)},
+        }
+    )
+    pos, vel, colors = fired(pattern, origin=(0, 0))
+    cells = [(col, row) for col in range(3) for row in range(2)]
+    assert pos.tolist() == [[col * 10, row * 10] for col, row in cells]
+    speeds = np.hypot(vel[:, 0], vel[:, 1])
+    assert speeds == pytest.approx([100 + 10 * col + row for col, row in cells])
+    # 颜色逐颗递增，超出 0-255 的分量被截断
+    assert colors.tolist() == [
+        [min(100 * i, 255), 0, min(250 + 10 * i, 255)] for i in range(6)
+    ]
+
+
+def test_jitter_stays_in_range_and_follows_the_seed():
+    spec = {
+        "shape": "ring",
+        "count": 64,
+        "speed": 200,
+        "speed_jitter": 20,
+        "direction_jitter": 10,
+        "color_range": ((100, 0, 0), (200, 50, 0)),
+    }
+    pattern = compile_pattern(spec)
+    rng.seed(11)
+    first = fired(pattern)
+    rng.seed(11)
+    assert all((a == b).all() for a, b in zip(first, fired(pattern)))
+
+    pos, vel, colors = first
+    speeds = np.hypot(vel[:, 0], vel[:, 1])
+    assert speeds.min() >= 180 - 1e-9 and speeds.max() <= 220 + 1e-9
+    assert np.allclose(speeds, speeds.round())  # 速度抖动为整数
+    headings = np.degrees(np.arctan2(vel[:, 1], vel[:, 0]))
+    expected = np.arange(64) * (360 / 64)
+    turn = (headings - expected + 180) % 360 - 180
+    assert np.abs(turn).max() <= 10 + 1e-9
+    assert (colors >= (100, 0, 0)).all() and (colors <= (200, 50, 0)).all()
+    assert len({tuple(c) for c in colors.tolist()}) > 1
+
+
+def test_unknown_shape_is_rejected():
+    with pytest.raises(ValueError, match="hexagon"):
+        compile_pattern({"shape": "hexagon", "count": 6})
+
+
+def test_pattern_keeps_lifetime_kind_and_bounces():
+    pattern = compile_pattern(
+        {
+            "shape": "ring",
+            "count": 3,
+            "kind": BulletPool.BOUNCE,
+            "lifetime": 2.5,
+            "max_bounce": 5,
+        }
+    )
+    pool = BulletPool()
+    pool.spawn((0, 0), (0, 1))  # 追加在已有子弹之后
+    pattern.fire(pool, (100, 100))
+    assert pool.count == 4
+    assert pool.kind[1:4].tolist() == [BulletPool.BOUNCE] * 3
+    assert pool.lifetime[1:4].tolist() == [2.5] * 3
+    assert pool.max_bounce[1:4].tolist() == [5] * 3
+    assert pool.lifetime[0] == math.inf
@@ -0,0 +1,158 @@
+import pygame
+import pytest
+
+from src.core.config import Config
+from src.core.headless import HeadlessGame
+from src.core.replay import (
+    INPUT_DOWN,
+    INPUT_LEFT,
+    INPUT_RIGHT,
+    INPUT_UP,
+    InputSnapshot,
+    Replay,
+    ReplayInput,
+    ReplayRecorder,
+    nondeterministic_settings,
+)
+from src.scenes.game_scene import GameScene
+
+TICKS = 1500
+
+
+class ScriptedInput:
+    """按步数变化的方向键输入，让玩家在录像里来回移动"""
+
+    PATTERN = (INPUT_LEFT, INPUT_LEFT | INPUT_UP, 0, INPUT_RIGHT, INPUT_DOWN)
+
+    def __init__(self):
+        self.ticks = 0
+
+    def poll(self, scene):
+        self.ticks += 1
+        return InputSnapshot(self.PATTERN[(self.ticks // 40) % len(self.PATTERN)])
+
+
+@pytest.fixture(autouse=True)
+def hold_hp(monkeypatch):
+    # 玩家不会死亡：场景不会切换到结算画面，也不会写高分文件
+    monkeypatch.setattr(Config, "HOLD_HP", True)
+
+
+def run(scene, ticks):
+    game = scene.game
+    game.change_scene(scene)
+    stats = game.run(minutes=ticks * game.timestep.step / 60)
+    assert stats["ticks"] == ticks
+    return scene
+
+
+def record(path, seed=7):
+    game = HeadlessGame()
+    scene = GameScene(game, seed=seed)
+    recorder = ReplayRecorder(scene.seed, game.timestep.tick_rate, ScriptedInput())
+    scene.input = recorder
+    run(scene, TICKS)
+    recorder.save(scene, path)
+    return scene
+
+
+def play(replay, seed=None):
+    """回放 replay，返回 (ReplayInput, 回放结束时的场景)"""
+    game = HeadlessGame(tick_rate=replay.tick_rate)
+    source = ReplayInput(replay)
+    seed = replay.seed if seed is None else seed
+    scene = run(GameScene(game, seed=seed, input_source=source), replay.ticks)
+    return source, scene
+
+
+def test_recorded_run_replays_exactly(tmp_path):
+    path = tmp_path / "run.rpl"
+    recorded = record(path)
+    replay = Replay.load(path)
+    assert replay.seed == recorded.seed
+    assert replay.ticks == TICKS
+    assert replay.hold_hp
+    assert len(set(replay.inputs)) > 1  # 录下的不是空输入
+
+    source, scene = play(replay)
+    assert source.verify_final(scene)
+    assert source.verified == len(replay.checksums) + 1
+    assert scene.player.rect.center == recorded.player.rect.center
+    assert scene.spawner.wave == recorded.spawner.wave
+
+
+def test_replay_with_another_seed_reports_desync(tmp_path):
+    path = tmp_path / "run.rpl"
+    record(path)
+    replay = Replay.load(path)
+    source, scene = play(replay, seed=replay.seed + 1)
+    assert not source.verify_final(scene)
+    assert source.desync_tick is not None
+
+
+def test_file_round_trip(tmp_path):
+    path = tmp_path / "nested" / "run.rpl"  # 目录不存在时自动创建
+    replay = Replay(
+        seed=2**40 + 3,
+        tick_rate=120,
+        checkpoint_interval=30,
+        inputs=bytes([0, INPUT_UP, INPUT_UP | INPUT_RIGHT, 0]),
+        checksums=[1, 2**32 - 1],
+        final_checksum=12345,
+        hold_hp=True,
+    )
+    replay.save(path)
+    loaded = Replay.load(path)
+    assert (loaded.seed, loaded.tick_rate, loaded.checkpoint_interval) == (
+        2**40 + 3,
+        120,
+        30,
+    )
+    assert loaded.inputs == replay.inputs
+    assert loaded.checksums == [1, 2**32 - 1]
+    assert loaded.final_checksum == 12345
+    assert loaded.hold_hp
+
+
+def test_rejects_other_versions_and_truncated_files(tmp_path):
+    path = tmp_path / "run.rpl"
+    Replay(1, 60, inputs=bytes(100)).save(path)
+    data = path.read_bytes()
+
+    other = tmp_path / "other.rpl"
+    other.write_bytes(data[:4] + (Replay.VERSION + 1).to_bytes(2, "little") + data[6:])
+    with pytest.raises(ValueError, match="version"):
+        Replay.load(other)
+
+    header = Replay.HEADER.unpack_from(data)
+    longer = Replay.HEADER.pack(*header[:6], 200, *header[7:])  # 步数与输入不符
+    truncated = tmp_path / "truncated.rpl"
+    truncated.write_bytes(longer + data[Replay.HEADER.size :])
+    with pytest.raises(ValueError, match="truncated"):
+        Replay.load(truncated)
+
+
+class _Pressed(dict):
+    """pygame.key.get_pressed() 的替身：未列出的键视为未按下"""
+
+    def __getitem__(self, key):
+        return self.get(key, False)
+
+
+def test_input_snapshot_reads_like_pressed_keys():
+    keys = {key: False for key in (pygame.K_w, pygame.K_LEFT, pygame.K_s)}
+    keys[pygame.K_w] = keys[pygame.K_LEFT] = True
+    snapshot = InputSnapshot.from_keys(_Pressed(keys))
+    assert snapshot.mask == INPUT_UP | INPUT_LEFT
+    assert snapshot[pygame.K_UP] and snapshot[pygame.K_a]
+    assert not snapshot[pygame.K_s] and not snapshot[pygame.K_SPACE]
+
+
+def test_spawn_budget_blocks_recording(monkeypatch):
+    assert nondeterministic_settings() == []
+    monkeypatch.setattr(Config, "SPAWN_BUDGET_MS", 2.0)
+    assert nondeterministic_settings()
+
+    monkeypatch.setattr(Config, "REPLAY_RECORD", True)
+    scene = GameScene(HeadlessGame())
+    assert scene.recorder is None
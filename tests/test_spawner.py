@@ -0,0 +1,15 @@
+from src.core.headless import HeadlessGame
+from src.scenes.game_scene import GameScene
+
+
+def test_flush_counts_towards_spawn_rate():
+    scene = GameScene(HeadlessGame(), seed=1)
+    spawner = scene.spawner
+    spawner._spawn_wave(scene.enemies, spawner.get_current_phase())
+    queued = len(spawner.spawn_queue)
+    assert queued > 0
+
+    spawner.flush(scene.enemies)
+    assert len(scene.enemies) == queued
+    assert spawner.spawned == queued
+    assert spawner.spawn_rate == queued
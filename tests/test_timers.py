@@ -0,0 +1,104 @@
+import pytest
+
+from src.core.clock import SimulationClock
+from src.core.headless import HeadlessGame
+from src.core.timers import TimerWheel
+from src.scenes.game_scene import GameScene
+
+STEP = 1.0 / 60
+
+
+def make_wheel(cls=TimerWheel):
+    clock = SimulationClock(time_scale=1.0)
+    return clock, cls(clock, resolution=STEP)
+
+
+def run(clock, wheel, ticks):
+    """与 GameScene 相同：时钟推进一步后再推进时间轮"""
+    for _ in range(ticks):
+        clock.advance(STEP)
+        wheel.advance()
+
+
+def record(wheel, fired, delay_ticks):
+    wheel.schedule(delay_ticks * STEP, lambda: fired.append((delay_ticks, wheel.now)))
+
+
+@pytest.mark.parametrize("start", [0, 100, 255])
+@pytest.mark.parametrize(
+    "delay", [1, 255, 256, 257, 16383, 16384, 16385, 16384 * 2 + 7]
+)
+def test_fires_on_exact_tick_across_levels(start, delay):
+    clock, wheel = make_wheel()
+    run(clock, wheel, start)
+    fired = []
+    record(wheel, fired, delay)
+    run(clock, wheel, delay - 1)
+    assert fired == []
+    run(clock, wheel, 1)
+    assert fired == [(delay, start + delay)]
+
+
+def test_fires_in_expiry_order():
+    clock, wheel = make_wheel()
+    fired = []
+    for delay in (16384, 300, 256, 255, 1, 16385):
+        record(wheel, fired, delay)
+    run(clock, wheel, 16400)
+    assert [delay for delay, _ in fired] == [1, 255, 256, 300, 16384, 16385]
+    assert all(delay == tick for delay, tick in fired)
+
+
+@pytest.mark.parametrize(
+    "delay, cancel_at",
+    [
+        (300, 260),  # 第 1 层 -> 在 256 级联到第 0 层后取消
+        (20000, 16500),  # 第 2 层 -> 在 16384 级联到第 1 层后取消
+        (20000, 19980),  # 再级联到第 0 层后取消
+    ],
+)
+def test_cancel_after_cascade(delay, cancel_at):
+    clock, wheel = make_wheel()
+    fired = []
+    timer = wheel.schedule(delay * STEP, fired.append, "cancelled")
+    record(wheel, fired, delay)  # 同一格的另一个计时器照常执行
+    run(clock, wheel, cancel_at)
+    timer.cancel()
+    run(clock, wheel, delay - cancel_at + 10)
+    assert fired == [(delay, delay)]
+
+
+def test_overflow_beyond_all_levels():
+    class SmallWheel(TimerWheel):
+        LEVEL_BITS = (2, 2)  # 只覆盖 16 个刻度，更远的先进 overflow
+
+    clock, wheel = make_wheel(SmallWheel)
+    fired = []
+    for delay in (3, 4, 15, 16, 17, 40):
+        record(wheel, fired, delay)
+    run(clock, wheel, 50)
+    assert fired == [(delay, delay) for delay in (3, 4, 15, 16, 17, 40)]
+
+
+def test_paused_clock_does_not_advance_timers():
+    clock, wheel = make_wheel()
+    fired = []
+    record(wheel, fired, 10)
+    run(clock, wheel, 5)
+    clock.pause()
+    run(clock, wheel, 100)
+    assert fired == []
+    clock.resume()
+    run(clock, wheel, 5)
+    assert fired == [(10, 10)]
+
+
+def test_scene_wheel_ticks_at_the_game_tick_rate():
+    game = HeadlessGame(tick_rate=120)
+    scene = GameScene(game)
+    step = game.timestep.step
+    fired = []
+    scene.timers.schedule(step, fired.append, "next step")
+    scene.clock.advance(step)
+    scene.timers.advance()
+    assert fired == ["next step"]